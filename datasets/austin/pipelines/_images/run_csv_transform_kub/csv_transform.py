@@ -231,12 +231,11 @@ def process_chunk(
     else:
         logging.info("Pipeline Not Recognized.")
         return None
-    save_to_new_file(df=df, file_path=str(target_file_batch), sep="|")
-    append_batch_file(
-        batch_file_path=target_file_batch,
+    append_batch_to_target_file(
+        df=df,
         target_file_path=target_file,
         include_header=include_header,
-        truncate_target_file=truncate_file,
+        truncate_file=truncate_file,
     )
     logging.info(f"Processing Batch {target_file_batch} completed")
 
@@ -261,11 +260,6 @@ def filter_null_rows(
     return df
 
 
-def save_to_new_file(df: pd.DataFrame, file_path: str, sep: str = "|") -> None:
-    logging.info(f"Saving data to target file.. {file_path} ...")
-    df.to_csv(file_path, index=False, sep=sep)
-
-
 def download_file_http(
     source_url: str, source_file: pathlib.Path, continue_on_error: bool = False
 ) -> bool:
@@ -409,33 +403,24 @@ def create_table_schema(
     return schema
 
 
-def append_batch_file(
-    batch_file_path: str,
+def append_batch_to_target_file(
+    df: pd.DataFrame,
     target_file_path: str,
     include_header: bool,
-    truncate_target_file: bool,
+    truncate_file: bool,
+    sep: str = "|",
 ) -> None:
     logging.info(
-        f"Appending file {batch_file_path} to file {target_file_path} with include_header={include_header} and truncate_target_file={truncate_target_file}"
+        f"Appending batch to {target_file_path} with include_header={include_header} and truncate_file={truncate_file}"
+    )
+    # Each chunk goes straight into the target file rather than via a batch file
+    df.to_csv(
+        target_file_path,
+        sep=sep,
+        index=False,
+        header=include_header,
+        mode=("w" if truncate_file else "a"),
     )
-    with open(batch_file_path, "r") as data_file:
-        if truncate_target_file:
-            target_file = open(target_file_path, "w+").close()
-        with open(target_file_path, "a+") as target_file:
-            if not include_header:
-                logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path} without header"
-                )
-                next(data_file)
-            else:
-                logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path} with header"
-                )
-            target_file.write(data_file.read())
-            data_file.close()
-            target_file.close()
-            if os.path.exists(batch_file_path):
-                os.remove(batch_file_path)
 
 
 def upload_file_to_gcs(
@@ -12,18 +12,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import csv
+import hashlib
+import itertools
 import json
 import logging
 import os
 import pathlib
+import resource
 import sys
+import threading
+import time
 import typing
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
 
+import google.auth
 import numpy as np
 import pandas as pd
 import requests
 from google.api_core.exceptions import NotFound
+from google.auth.transport.requests import AuthorizedSession
 from google.cloud import bigquery, storage
 
 
@@ -48,10 +58,19 @@ def main(
     rename_mappings_list: dict,
     input_csv_headers: typing.List[str],
     output_csv_headers: typing.List[str],
+    client_pool_size: str,
+    api_max_workers: str,
+    api_requests_per_second: str,
+    api_cache_location: str,
+    api_cache_ttl_hours: str,
 ) -> None:
     logging.info("Creating 'files' folder")
     pathlib.Path("./files").mkdir(parents=True, exist_ok=True)
     logging.info(f"{pipeline_name} process started")
+    gcp_clients.configure(pool_size=int(client_pool_size))
+    api_cache.configure(
+        location=api_cache_location, ttl_hours=float(api_cache_ttl_hours)
+    )
     execute_pipeline(
         source_file=source_file,
         chunksize=chunksize,
@@ -72,7 +91,11 @@ def main(
         dataset_id=dataset_id,
         destination_table=table_id,
         schema_path=schema_path,
+        api_max_workers=int(api_max_workers),
+        api_requests_per_second=float(api_requests_per_second),
     )
+    api_cache.summary()
+    gcp_clients.summary()
     logging.info(f"{pipeline_name} --> ETL process completed")
 
 
@@ -96,6 +119,8 @@ def execute_pipeline(
     dataset_id: str,
     destination_table: str,
     schema_path: str,
+    api_max_workers: int = 1,
+    api_requests_per_second: float = 0,
 ) -> None:
     json_obj_group_id = open("group_ids.json")
     group_id = json.load(json_obj_group_id)
@@ -104,7 +129,13 @@ def execute_pipeline(
     logging.info("Extracting the data from API and loading into dataframe...")
     if report_level == "national_level":
         df = extract_data_and_convert_to_df_national_level(
-            group_id, year_report, api_naming_convention, source_url, destination_table
+            group_id,
+            year_report,
+            api_naming_convention,
+            source_url,
+            destination_table,
+            max_workers=api_max_workers,
+            requests_per_second=api_requests_per_second,
         )
     elif report_level == "state_level":
         df = extract_data_and_convert_to_df_state_level(
@@ -114,9 +145,13 @@ def execute_pipeline(
             api_naming_convention,
             source_url,
             destination_table,
+            max_workers=api_max_workers,
+            requests_per_second=api_requests_per_second,
         )
     save_to_new_file(df, source_file, sep=",")
-    process_source_file(
+    expected_geo_ids = len(df) // max(len(group_id), 1)
+    del df
+    output_columns = process_source_file(
         source_file=source_file,
         target_file=target_file,
         chunksize=chunksize,
@@ -129,6 +164,7 @@ def execute_pipeline(
         output_csv_headers=output_csv_headers,
         group_id=group_id,
         state_code=state_code,
+        expected_geo_ids=expected_geo_ids,
     )
     if os.path.exists(target_file):
         upload_file_to_gcs(
@@ -144,6 +180,7 @@ def execute_pipeline(
             schema_filepath=schema_path,
             bucket_name=target_gcs_bucket,
             drop_table="N",
+            output_columns=output_columns,
         )
         if table_exists:
             load_data_to_bq(
@@ -176,37 +213,24 @@ def process_source_file(
     output_csv_headers: typing.List[str],
     group_id: str,
     state_code: str,
-) -> None:
+    expected_geo_ids: int = 0,
+) -> typing.List[str]:
     logging.info(f"Opening source file {source_file}")
     csv.field_size_limit(512 << 10)
     csv.register_dialect("TabDialect", quotechar='"', delimiter=",", strict=True)
+    aggregator = KpiPivotAggregator(group_id, expected_rows=expected_geo_ids)
     with open(source_file) as reader:
-        data = []
+        rows = csv.reader(reader, "TabDialect")
+        next(rows, None)
         chunk_number = 1
-        for index, line in enumerate(csv.reader(reader, "TabDialect"), 0):
-            data.append(line)
-            if index % int(chunksize) == 0 and index > 0:
-                process_dataframe_chunk(
-                    data=data,
-                    input_headers=input_headers,
-                    target_file=target_file,
-                    chunk_number=chunk_number,
-                    data_dtypes=data_dtypes,
-                    geography=geography,
-                    rename_mappings_list=rename_mappings_list,
-                    concat_col_list=concat_col_list,
-                    input_csv_headers=input_csv_headers,
-                    output_csv_headers=output_csv_headers,
-                    group_id=group_id,
-                    state_code=state_code,
-                )
-                data = []
-                chunk_number += 1
-        if index % int(chunksize) != 0 and index > 0:
+        while True:
+            data = list(itertools.islice(rows, int(chunksize)))
+            if not data:
+                break
             process_dataframe_chunk(
                 data=data,
                 input_headers=input_headers,
-                target_file=target_file,
+                aggregator=aggregator,
                 chunk_number=chunk_number,
                 data_dtypes=data_dtypes,
                 geography=geography,
@@ -217,26 +241,20 @@ def process_source_file(
                 group_id=group_id,
                 state_code=state_code,
             )
-    dfcolumns = list(target_df.columns)
-    i = 0
-    while i < (len(output_csv_headers)):
-        if output_csv_headers[i] not in dfcolumns:
-            output_csv_headers.pop(i)
-            i -= 1
-        i += 1
-    logging.info("Reordering headers...")
-    final_df = target_df[output_csv_headers]
-    save_to_new_file(final_df, target_file, sep="|")
-    print("final df -->")
-    print(final_df)
-    print("Opening final file  -->")
-    print(pd.read_csv(target_file, sep="|"))
+            chunk_number += 1
+    output_columns = aggregator.save(
+        target_file, output_csv_headers, chunksize=int(chunksize), sep="|"
+    )
+    logging.info(
+        f"Pivoted {aggregator.row_count} geo_ids x {len(output_columns) - 1} KPIs, peak memory {peak_memory_mb():.0f} MB"
+    )
+    return output_columns
 
 
 def process_dataframe_chunk(
     data: typing.List[str],
     input_headers: typing.List[str],
-    target_file: str,
+    aggregator: "KpiPivotAggregator",
     chunk_number: int,
     data_dtypes: dict,
     geography: str,
@@ -248,15 +266,10 @@ def process_dataframe_chunk(
     state_code: str,
 ) -> None:
     df = pd.DataFrame(data, columns=input_headers)
-    target_file_batch = str(target_file).replace(
-        ".csv", "-" + str(chunk_number) + ".csv"
-    )
     process_chunk(
         df=df,
         chunk_number=chunk_number,
-        target_file_batch=target_file_batch,
-        target_file=target_file,
-        skip_header=0,
+        aggregator=aggregator,
         geography=geography,
         rename_mappings_list=rename_mappings_list,
         concat_col_list=concat_col_list,
@@ -277,9 +290,7 @@ def set_df_datatypes(df: pd.DataFrame, data_dtypes: dict) -> pd.DataFrame:
 def process_chunk(
     df: pd.DataFrame,
     chunk_number: int,
-    target_file_batch: str,
-    target_file: str,
-    skip_header: bool,
+    aggregator: "KpiPivotAggregator",
     geography: str,
     rename_mappings_list: dict,
     concat_col_list: typing.List[str],
@@ -288,21 +299,96 @@ def process_chunk(
     group_id: str,
     state_code: str,
 ) -> None:
-    logging.info(f"Processing batch file {target_file_batch}")
-    logging.info("Replacing values...")
-    df = df.replace(to_replace={"KPI_Name": group_id})
+    logging.info(f"Processing chunk {chunk_number}")
     rename_headers(df, rename_mappings_list)
-    if geography == "censustract" or geography == "blockgroup":
-        df["tract"] = df["tract"].apply(pad_zeroes_to_the_left, args=(6,))
-        df["state"] = df["state"].apply(pad_zeroes_to_the_left, args=(2,))
-        df["county"] = df["county"].apply(pad_zeroes_to_the_left, args=(3,))
-    df = create_geo_id(df, concat_col_list)
-    df = pivot_dataframe(df)
-    save_to_new_file(df, file_path=str(target_file_batch), sep="|")
-    df = append_batch_file(
-        df, chunk_number, target_file_batch, target_file, skip_header, not (skip_header)
-    )
-    logging.info(f"Processing batch file {target_file_batch} completed")
+    logging.info("Creating column geo_id...")
+    df["geo_id"], geo_key = build_geo_id(df, concat_col_list)
+    logging.info("Pivoting the chunk...")
+    aggregator.add(df["geo_id"], df["KPI_Name"], df["KPI_Value"], geo_keys=geo_key)
+    logging.info(f"Processing chunk {chunk_number} completed")
+
+
+class GoogleCloudClients:
+    """Builds BigQuery and Cloud Storage clients on first use and shares them
+    across every helper in the process. All clients ride on one authorized
+    HTTP session with a pool of `pool_size` connections. Client constructions
+    and API round-trips are counted for the end-of-run summary.
+
+    Every image talking to BigQuery or Cloud Storage carries a copy of this
+    block. Edit the new_york_taxi_trips copy and run
+    scripts/sync_shared_helpers.py."""
+
+    def __init__(self, pool_size: int = 10) -> None:
+        self.lock = threading.Lock()
+        self.counts = collections.Counter()
+        self.pool_size = pool_size
+        self.reset()
+
+    def reset(self) -> None:
+        self.pid = os.getpid()
+        self.credentials = None
+        self.default_project = None
+        self.session = None
+        self.clients = {}
+
+    def configure(self, pool_size: int) -> None:
+        with self.lock:
+            self.pool_size = max(pool_size, 1)
+            self.reset()
+
+    def authorized_session(self) -> AuthorizedSession:
+        if self.pid != os.getpid():
+            # A forked worker process builds its own session and clients
+            self.reset()
+        if self.session is None:
+            self.credentials, self.default_project = google.auth.default(
+                scopes=["https://www.googleapis.com/auth/cloud-platform"]
+            )
+            self.counts["credential_lookups"] += 1
+            self.session = AuthorizedSession(self.credentials)
+            self.session.mount(
+                "https://",
+                requests.adapters.HTTPAdapter(
+                    pool_connections=self.pool_size, pool_maxsize=self.pool_size
+                ),
+            )
+            self.session.hooks["response"].append(self.count_round_trip)
+        return self.session
+
+    def count_round_trip(self, response: requests.Response, *args, **kwargs) -> None:
+        with self.lock:
+            self.counts["api_round_trips"] += 1
+
+    def client(
+        self, label: str, client_class: typing.Type, project: str = None
+    ) -> typing.Union[bigquery.Client, storage.Client]:
+        with self.lock:
+            session = self.authorized_session()
+            project = project or self.default_project
+            if (label, project) not in self.clients:
+                client_args = {"credentials": self.credentials, "_http": session}
+                if project:
+                    client_args["project"] = project
+                self.clients[(label, project)] = client_class(**client_args)
+                self.counts[f"{label}_clients"] += 1
+            return self.clients[(label, project)]
+
+    def bigquery(self, project: str = None) -> bigquery.Client:
+        return self.client("bigquery", bigquery.Client, project)
+
+    def storage(self, project: str = None) -> storage.Client:
+        return self.client("storage", storage.Client, project)
+
+    def summary(self) -> None:
+        logging.info(
+            f"Google Cloud clients built: {self.counts['bigquery_clients']} BigQuery, "
+            f"{self.counts['storage_clients']} Cloud Storage; "
+            f"credential lookups: {self.counts['credential_lookups']}; "
+            f"API round-trips: {self.counts['api_round_trips']}"
+        )
+
+
+gcp_clients = GoogleCloudClients()
 
 
 def load_data_to_bq(
@@ -316,7 +402,7 @@ def load_data_to_bq(
     logging.info(
         f"Loading data from {file_path} into {project_id}.{dataset_id}.{table_id} started"
     )
-    client = bigquery.Client(project=project_id)
+    client = gcp_clients.bigquery(project_id)
     table_ref = client.dataset(dataset_id).table(table_id)
     job_config = bigquery.LoadJobConfig()
     job_config.source_format = bigquery.SourceFormat.CSV
@@ -342,10 +428,11 @@ def create_dest_table(
     schema_filepath: list,
     bucket_name: str,
     drop_table: bool = False,
+    output_columns: typing.List[str] = None,
 ) -> bool:
     table_ref = f"{project_id}.{dataset_id}.{table_id}"
     logging.info(f"Attempting to create table {table_ref} if it doesn't already exist")
-    client = bigquery.Client()
+    client = gcp_clients.bigquery()
     table_exists = False
     try:
         table = client.get_table(table_ref)
@@ -364,7 +451,9 @@ def create_dest_table(
             )
         )
         if check_gcs_file_exists(schema_filepath, bucket_name):
-            schema = create_table_schema([], bucket_name, schema_filepath)
+            schema = create_table_schema(
+                [], bucket_name, schema_filepath, output_columns
+            )
             table = bigquery.Table(table_ref, schema=schema)
             client.create_table(table)
             print(f"Table {table_ref} was created".format(table_id))
@@ -382,7 +471,7 @@ def create_dest_table(
 
 
 def check_gcs_file_exists(file_path: str, bucket_name: str) -> bool:
-    storage_client = storage.Client()
+    storage_client = gcp_clients.storage()
     bucket = storage_client.bucket(bucket_name)
     exists = storage.Blob(bucket=bucket, name=file_path).exists(storage_client)
     return exists
@@ -392,23 +481,21 @@ def create_table_schema(
     schema_structure: list,
     bucket_name: str = "",
     schema_filepath: str = "",
+    output_columns: typing.List[str] = None,
 ) -> list:
     logging.info(f"Defining table schema... {bucket_name} ... {schema_filepath}")
     schema = []
     if not (schema_filepath):
         schema_struct = schema_structure
     else:
-        storage_client = storage.Client()
+        storage_client = gcp_clients.storage()
         bucket = storage_client.get_bucket(bucket_name)
         blob = bucket.blob(schema_filepath)
         schema_struct = json.loads(blob.download_as_string(client=None))
-    i = 0
-    dfcolumns = list(target_df.columns)
-    while i < len(schema_struct):
-        if schema_struct[i].get("name") not in dfcolumns:
-            schema_struct.pop(i)
-            i -= 1
-        i += 1
+    if output_columns is not None:
+        schema_struct = [
+            field for field in schema_struct if field.get("name") in output_columns
+        ]
     for schema_field in schema_struct:
         fld_name = schema_field["name"]
         fld_type = schema_field["type"]
@@ -425,13 +512,128 @@ def create_table_schema(
     return schema
 
 
-def pivot_dataframe(df: pd.DataFrame) -> pd.DataFrame:
-    logging.info("Pivoting the dataframe...")
-    df = df[["geo_id", "KPI_Name", "KPI_Value"]]
-    df = df.pivot_table(
-        index="geo_id", columns="KPI_Name", values="KPI_Value", aggfunc=np.sum
-    ).reset_index()
-    return df
+class KpiPivotAggregator:
+    """Pivots long (geo_id, KPI code, KPI value) rows into one wide row per
+    geo_id in a single pass. Values are summed into a float matrix with one
+    column per KPI in `kpi_names`, so a geo_id whose KPIs are split across
+    chunks still ends up as a single row."""
+
+    def __init__(self, kpi_names: dict, expected_rows: int = 0) -> None:
+        self.columns = list(dict.fromkeys(kpi_names.values()))
+        column_position = {name: i for i, name in enumerate(self.columns)}
+        self.kpi_codes = pd.Index(list(kpi_names.keys()))
+        self.kpi_columns = np.array(
+            [column_position[name] for name in kpi_names.values()], dtype=np.intp
+        )
+        self.geo_position = {}
+        self.values = np.full((max(expected_rows, 1), len(self.columns)), np.nan)
+        self.kpi_seen = np.zeros(len(self.columns), dtype=bool)
+        self.unknown_kpis = 0
+
+    @property
+    def row_count(self) -> int:
+        return len(self.geo_position)
+
+    def _reserve(self, rows: int) -> None:
+        capacity = len(self.values)
+        if rows <= capacity:
+            return
+        while capacity < rows:
+            capacity *= 2
+        logging.info(f"Growing pivot matrix to {capacity} rows")
+        values = np.full((capacity, len(self.columns)), np.nan)
+        values[: len(self.values)] = self.values
+        self.values = values
+
+    def add(
+        self,
+        geo_ids: pd.Series,
+        kpi_codes: pd.Series,
+        kpi_values: pd.Series,
+        geo_keys: np.ndarray = None,
+    ) -> None:
+        if geo_keys is None:
+            geo_codes, geo_uniques = pd.factorize(geo_ids, use_na_sentinel=False)
+            # Rows without a geo_id share one row with an empty geo_id
+            geo_uniques = pd.Series(geo_uniques, dtype=object).fillna("").to_numpy()
+        else:
+            geo_codes, _ = pd.factorize(geo_keys)
+            first_rows = np.flatnonzero(~pd.Series(geo_codes).duplicated().to_numpy())
+            geo_uniques = np.asarray(geo_ids, dtype=object)[first_rows]
+        positions = self.geo_position
+        geo_rows = np.fromiter(
+            (positions.setdefault(geo_id, len(positions)) for geo_id in geo_uniques),
+            dtype=np.intp,
+            count=len(geo_uniques),
+        )
+        self._reserve(len(positions))
+        kpi_index = self.kpi_codes.get_indexer(kpi_codes)
+        known = kpi_index >= 0
+        self.unknown_kpis += int(len(known) - known.sum())
+        rows = geo_rows[geo_codes[known]]
+        cols = self.kpi_columns[kpi_index[known]]
+        values = pd.to_numeric(kpi_values, errors="coerce").to_numpy(dtype=float)
+        values = values[known]
+        cells = rows * len(self.columns) + cols
+        if not pd.Index(cells).is_unique:
+            summed = pd.Series(values).groupby(cells, sort=False).sum(min_count=1)
+            rows, cols = np.divmod(summed.index.to_numpy(), len(self.columns))
+            values = summed.to_numpy()
+        current = self.values[rows, cols]
+        self.values[rows, cols] = np.where(
+            np.isnan(current), values, current + np.nan_to_num(values)
+        )
+        self.kpi_seen[cols] = True
+
+    def save(
+        self,
+        file_path: str,
+        output_headers: typing.List[str],
+        chunksize: int,
+        sep: str = "|",
+    ) -> typing.List[str]:
+        if self.unknown_kpis:
+            logging.info(f"Skipped {self.unknown_kpis} rows with an unknown KPI")
+        if not self.row_count:
+            logging.info("No rows to pivot, target file not written")
+            return []
+        geo_ids = np.array(list(self.geo_position), dtype=object)
+        order = np.argsort(geo_ids, kind="stable")
+        values = self.values[: len(geo_ids)]
+        column_position = {
+            name: i for i, name in enumerate(self.columns) if self.kpi_seen[i]
+        }
+        output_columns = [
+            col for col in output_headers if col == "geo_id" or col in column_position
+        ]
+        # Columns that are complete and whole-valued are written as integers,
+        # the same way pd.read_csv would type them.
+        integer_columns = {}
+        for col in output_columns:
+            if col == "geo_id":
+                continue
+            column = values[:, column_position[col]]
+            if not np.isnan(column).any() and np.array_equal(column, np.trunc(column)):
+                integer_columns[col] = "int64"
+        logging.info(f"Saving data to target file.. {file_path} ...")
+        with open(file_path, "w") as target:
+            for start in range(0, len(order), chunksize):
+                block = order[start : start + chunksize]
+                block_values = values[block]
+                df = pd.DataFrame(
+                    {
+                        col: geo_ids[block]
+                        if col == "geo_id"
+                        else block_values[:, column_position[col]]
+                        for col in output_columns
+                    }
+                ).astype(integer_columns)
+                df.to_csv(target, index=False, sep=sep, header=(start == 0))
+        return output_columns
+
+
+def peak_memory_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
 
 
 def string_replace(source_url, replace: dict) -> str:
@@ -440,49 +642,161 @@ def string_replace(source_url, replace: dict) -> str:
     return source_url_new
 
 
+class TokenBucket:
+    """Hands out `rate` tokens per second on average, allowing bursts of up to
+    `capacity`. A rate of 0 disables the limit."""
+
+    def __init__(self, rate: float, capacity: int = 1) -> None:
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if not self.rate:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def http_session(pool_size: int = 1) -> requests.Session:
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class ApiResponseCache:
+    """Keeps parsed Census API responses in a local directory or under a gs://
+    prefix, keyed by the fully substituted request URL, so task retries and
+    sibling tasks skip responses that were already fetched. Entries younger
+    than `ttl_hours` are used as they are; older ones are revalidated with
+    If-None-Match/If-Modified-Since. An empty location disables the cache."""
+
+    def __init__(self, location: str = "", ttl_hours: float = 24) -> None:
+        self.lock = threading.Lock()
+        self.counts = collections.Counter()
+        self.configure(location, ttl_hours)
+
+    def configure(self, location: str, ttl_hours: float) -> None:
+        self.location = location.rstrip("/")
+        self.ttl_seconds = ttl_hours * 3600
+
+    def entry_path(self, source_url: str) -> str:
+        url_hash = hashlib.sha256(source_url.encode("utf-8")).hexdigest()
+        return f"{self.location}/{url_hash}.json"
+
+    def get(self, source_url: str) -> typing.Optional[dict]:
+        if not self.location:
+            return None
+        try:
+            entry = json.loads(self.read(self.entry_path(source_url)))
+        except (FileNotFoundError, NotFound, ValueError):
+            entry = None
+        if not entry or entry.get("url") != source_url:
+            self.count("misses")
+            return None
+        return entry
+
+    def is_fresh(self, entry: dict) -> bool:
+        fresh = time.time() - entry["fetched_at"] < self.ttl_seconds
+        self.count("hits" if fresh else "stale")
+        return fresh
+
+    def validators(self, entry: typing.Optional[dict]) -> dict:
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def put(self, source_url: str, rows: list, response: requests.Response) -> None:
+        if not self.location:
+            return
+        entry = {
+            "url": source_url,
+            "fetched_at": time.time(),
+            "etag": response.headers.get("ETag", ""),
+            "last_modified": response.headers.get("Last-Modified", ""),
+            "rows": rows,
+        }
+        self.write(self.entry_path(source_url), json.dumps(entry).encode("utf-8"))
+        self.count("stored")
+
+    def revalidated(self, source_url: str, entry: dict) -> None:
+        entry["fetched_at"] = time.time()
+        self.write(self.entry_path(source_url), json.dumps(entry).encode("utf-8"))
+        self.count("revalidated")
+
+    def read(self, path: str) -> bytes:
+        if path.startswith("gs://"):
+            bucket_name, blob_name = path[len("gs://") :].split("/", 1)
+            bucket = gcp_clients.storage().bucket(bucket_name)
+            return bucket.blob(blob_name).download_as_bytes()
+        with open(path, "rb") as entry_file:
+            return entry_file.read()
+
+    def write(self, path: str, data: bytes) -> None:
+        if path.startswith("gs://"):
+            bucket_name, blob_name = path[len("gs://") :].split("/", 1)
+            bucket = gcp_clients.storage().bucket(bucket_name)
+            bucket.blob(blob_name).upload_from_string(
+                data, content_type="application/json"
+            )
+            return
+        pathlib.Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(f"{path}.tmp", "wb") as entry_file:
+            entry_file.write(data)
+        os.replace(f"{path}.tmp", path)
+
+    def count(self, name: str) -> None:
+        with self.lock:
+            self.counts[name] += 1
+
+    def summary(self) -> None:
+        if self.location:
+            logging.info(
+                f"API response cache {self.location}: {self.counts['hits']} hits, "
+                f"{self.counts['revalidated']} revalidated, "
+                f"{self.counts['stale']} stale, {self.counts['misses']} misses, "
+                f"{self.counts['stored']} stored"
+            )
+
+
+api_cache = ApiResponseCache()
+
+
 def extract_data_and_convert_to_df_national_level(
     group_id: dict,
     year_report: str,
     api_naming_convention: str,
     source_url: str,
     destination_table: str,
+    max_workers: int = 1,
+    requests_per_second: float = 0,
 ) -> pd.DataFrame:
-    list_temp = []
-    flag = 0
-    for key in group_id:
-        logging.info(f"reading data from API for KPI {key}...")
-        str1 = source_url.replace("~year_report~", year_report)
-        str2 = str1.replace("~group_id~", key[0:-3])
-        str3 = str2.replace("~row_position~", key[-3:])
-        source_url_new = str3.replace("~api_naming_convention~", api_naming_convention)
-        try:
-            r = requests.get(source_url_new, stream=True, verify=False, timeout=200)
-            if r.status_code == 200:
-                logging.info("Data source valid for at least one entity")
-                flag = 1
-                text = r.json()
-                frame = load_nested_list_into_df_without_headers(text)
-                frame["KPI_Name"] = key
-                list_temp.append(frame)
-            elif 400 >= r.status_code <= 499:
-                logging.info(r.status_code)
-            else:
-                logging.info(f"Source url : {source_url_new}")
-                logging.info(f"status code : {r.status_code}")
-        except OSError as e:
-            logging.info(f"error : {e}")
-    if flag == 0:
-        logging.info(f"Data not available for {destination_table} yet")
-        sys.exit(0)
-    logging.info("creating the dataframe...")
-    df = pd.concat(list_temp)
-    return df
-
-
-def load_nested_list_into_df_without_headers(text: typing.List) -> pd.DataFrame:
-    frame = pd.DataFrame(text)
-    frame = frame.iloc[1:, :]
-    return frame
+    api_requests = [
+        (key, census_api_url(source_url, year_report, key, api_naming_convention))
+        for key in group_id
+    ]
+    return extract_census_api_data(
+        api_requests, destination_table, max_workers, requests_per_second
+    )
 
 
 def extract_data_and_convert_to_df_state_level(
@@ -492,57 +806,220 @@ def extract_data_and_convert_to_df_state_level(
     api_naming_convention: str,
     source_url: str,
     destination_table: str,
+    max_workers: int = 1,
+    requests_per_second: float = 0,
 ) -> pd.DataFrame:
-    list_temp = []
-    flag = 0
-    for key in group_id:
-        for sc in state_code:
-            logging.info(f"reading data from API for KPI {key}...")
-            logging.info(f"reading data from API for KPI {sc}...")
-            str1 = source_url.replace("~year_report~", year_report)
-            str2 = str1.replace("~group_id~", key[0:-3])
-            str3 = str2.replace("~row_position~", key[-3:])
-            str4 = str3.replace("~api_naming_convention~", api_naming_convention)
-            source_url_new = str4.replace("~state_code~", sc)
-            try:
-                r = requests.get(source_url_new, stream=True, verify=False, timeout=200)
-                if r.status_code == 200:
-                    logging.info("Data source valid for at least one entity")
-                    flag = 1
-                    text = r.json()
-                    frame = load_nested_list_into_df_without_headers(text)
-                    frame["KPI_Name"] = key
-                    list_temp.append(frame)
-                elif 400 >= r.status_code <= 499:
-                    logging.info(r.status_code)
-                else:
-                    logging.info(f"Source url : {source_url_new}")
-                    logging.info(f"status code : {r.status_code}")
-
-            except OSError as e:
-                logging.info(f"error : {e}")
-    if flag == 0:
+    api_requests = [
+        (
+            key,
+            census_api_url(source_url, year_report, key, api_naming_convention, sc),
+        )
+        for key in group_id
+        for sc in state_code
+    ]
+    return extract_census_api_data(
+        api_requests, destination_table, max_workers, requests_per_second
+    )
+
+
+def census_api_url(
+    source_url: str,
+    year_report: str,
+    key: str,
+    api_naming_convention: str,
+    sc: str = "",
+) -> str:
+    source_url_new = (
+        source_url.replace("~year_report~", year_report)
+        .replace("~group_id~", key[0:-3])
+        .replace("~row_position~", key[-3:])
+        .replace("~api_naming_convention~", api_naming_convention)
+    )
+    if sc:
+        source_url_new = source_url_new.replace("~state_code~", sc)
+    return source_url_new
+
+
+def extract_census_api_data(
+    api_requests: typing.List[typing.Tuple[str, str]],
+    destination_table: str,
+    max_workers: int = 1,
+    requests_per_second: float = 0,
+) -> pd.DataFrame:
+    # Requests run concurrently, but responses are assembled in request order so
+    # the extracted frame is the same as fetching them one at a time
+    logging.info(
+        f"Reading {len(api_requests)} API responses with {max_workers} worker(s)"
+    )
+    session = http_session(pool_size=max_workers)
+    rate_limiters = {
+        urlparse(url).netloc: TokenBucket(
+            rate=requests_per_second, capacity=max_workers
+        )
+        for _, url in api_requests
+    }
+    with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+        responses = [
+            executor.submit(
+                fetch_census_api_columns,
+                session,
+                key,
+                url,
+                rate_limiters[urlparse(url).netloc],
+            )
+            for key, url in api_requests
+        ]
+        response_columns = [response.result() for response in responses]
+    session.close()
+    if all(columns is None for columns in response_columns):
         logging.info(f"Data not available for {destination_table} yet")
         sys.exit(0)
     logging.info("creating the dataframe...")
-    df = pd.concat(list_temp)
-    return df
+    return census_columns_to_df([key for key, _ in api_requests], response_columns)
 
 
-def create_geo_id(df: pd.DataFrame, concat_col: str) -> pd.DataFrame:
-    logging.info("Creating column geo_id...")
-    df = df.drop(0, axis=0)
-    df["geo_id"] = ""
-    for col in concat_col:
-        df["geo_id"] = df["geo_id"] + df[col]
-    return df
+def fetch_census_api_columns(
+    session: requests.Session,
+    key: str,
+    source_url: str,
+    rate_limiter: TokenBucket,
+    max_attempts: int = 5,
+    backoff_seconds: float = 2,
+) -> typing.Optional[typing.List[tuple]]:
+    # Returns the data rows of the response, header row excluded, as columns.
+    # Rate limiting (429), server errors and connection errors are retried
+    # with exponential backoff; other client errors are skipped.
+    logging.info(f"reading data from API for KPI {key}...")
+    cached = api_cache.get(source_url)
+    if cached and api_cache.is_fresh(cached):
+        return census_rows_to_columns(cached["rows"])
+    for attempt in range(1, max_attempts + 1):
+        rate_limiter.acquire()
+        try:
+            r = session.get(
+                source_url, headers=api_cache.validators(cached), timeout=200
+            )
+            if r.status_code == 304 and cached:
+                api_cache.revalidated(source_url, cached)
+                return census_rows_to_columns(cached["rows"])
+            if r.status_code == 200:
+                rows = json.loads(r.content)
+                api_cache.put(source_url, rows, r)
+                return census_rows_to_columns(rows)
+            if 400 <= r.status_code <= 499 and r.status_code != 429:
+                logging.info(r.status_code)
+                return None
+            logging.info(f"Source url : {source_url}")
+            logging.info(f"status code : {r.status_code}")
+        except ValueError as e:
+            logging.info(f"error : {e}")
+            return None
+        except requests.exceptions.RequestException as e:
+            logging.info(f"error : {e}")
+        if attempt < max_attempts:
+            time.sleep(backoff_seconds * 2 ** (attempt - 1))
+    return None
 
 
-def pad_zeroes_to_the_left(val: str, length: int) -> str:
-    if len(str(val)) < length:
-        return ("0" * (length - len(str(val)))) + str(val)
+def census_rows_to_columns(rows: typing.List[list]) -> typing.List[tuple]:
+    width = len(rows[0]) if rows else 0
+    return list(itertools.zip_longest(*rows[1:])) or [()] * width
+
+
+def census_columns_to_df(
+    keys: typing.List[str], response_columns: typing.List[typing.List[tuple]]
+) -> pd.DataFrame:
+    # Every response is copied straight into columns sized for the whole
+    # extract, instead of building one DataFrame per response and concatenating.
+    responses = [
+        (key, columns)
+        for key, columns in zip(keys, response_columns)
+        if columns is not None
+    ]
+    width = max(len(columns) for _, columns in responses)
+    total_rows = sum(len(columns[0]) for _, columns in responses if columns)
+    data = {col: np.empty(total_rows, dtype=object) for col in range(width)}
+    data["KPI_Name"] = np.empty(total_rows, dtype=object)
+    row_position = 0
+    for key, columns in responses:
+        row_count = len(columns[0]) if columns else 0
+        for col, values in enumerate(columns):
+            data[col][row_position : row_position + row_count] = values
+        data["KPI_Name"][row_position : row_position + row_count] = key
+        row_position += row_count
+    return pd.DataFrame(data)
+
+
+FIPS_CODE_WIDTHS = {
+    "state": 2,
+    "county": 3,
+    "tract": 6,
+    "block_group": 1,
+    "place": 5,
+    "congressional_district": 2,
+}
+
+
+def build_geo_id(
+    df: pd.DataFrame, columns: typing.List[str], widths: dict = FIPS_CODE_WIDTHS
+) -> typing.Tuple[pd.Series, typing.Optional[np.ndarray]]:
+    """Zero-pads each FIPS component in `columns` to its width and concatenates
+    them into a geo_id. Also returns the geo_id as an int64 key for joins, or
+    None when the ids are not all numeric and of the same length."""
+    # Padding and concatenation run once per distinct combination of
+    # components, which is a few thousand per chunk rather than every row.
+    codes = np.zeros(len(df), dtype=np.int64)
+    for col in columns:
+        # Missing components get a code of their own instead of -1, which
+        # could collide with another combination
+        col_codes, col_uniques = pd.factorize(df[col], use_na_sentinel=False)
+        codes, _ = pd.factorize(codes * max(len(col_uniques), 1) + col_codes)
+    first_rows = np.flatnonzero(~pd.Series(codes).duplicated().to_numpy())
+    components = [pd.Series(df[col].to_numpy()[first_rows]) for col in columns]
+    parts = [
+        fips_component_text(component).str.zfill(widths.get(col, 0))
+        for col, component in zip(columns, components)
+    ]
+    if not parts:
+        unique_ids = pd.Series([""] * len(first_rows), dtype=object)
+    elif len(parts) == 1:
+        unique_ids = parts[0]
     else:
-        return str(val)
+        unique_ids = parts[0].str.cat(parts[1:])
+    incomplete = np.zeros(len(first_rows), dtype=bool)
+    for component in components:
+        incomplete |= component.isna().to_numpy()
+    if incomplete.any():
+        missing_rows = int(incomplete[codes].sum())
+        logging.info(
+            f"Leaving geo_id empty on {missing_rows} row(s) missing one of {columns}"
+        )
+        unique_ids = unique_ids.mask(incomplete)
+    unique_keys = geo_id_key(unique_ids)
+    geo_id = pd.Series(unique_ids.to_numpy()[codes], index=df.index)
+    geo_key = None if unique_keys is None else unique_keys[codes]
+    return geo_id, geo_key
+
+
+def fips_component_text(component: pd.Series) -> pd.Series:
+    # pd.read_csv types a component column as float once a chunk holds a
+    # blank, which would render 1 as "1.0"
+    if pd.api.types.is_float_dtype(component):
+        component = component.astype("Int64")
+    return component.astype(str)
+
+
+def geo_id_key(geo_id: pd.Series) -> typing.Optional[np.ndarray]:
+    lengths = geo_id.str.len()
+    if (
+        geo_id.empty
+        or geo_id.isna().any()
+        or lengths.nunique() != 1
+        or lengths.iloc[0] > 18
+        or not geo_id.str.isdigit().all()
+    ):
+        return None
+    return geo_id.astype(np.int64).to_numpy()
 
 
 def rename_headers(df: pd.DataFrame, rename_mappings: dict) -> None:
@@ -555,46 +1032,6 @@ def save_to_new_file(df: pd.DataFrame, file_path: str, sep: str = ",") -> None:
     df.to_csv(file_path, index=False, sep=sep)
 
 
-def append_batch_file(
-    df: pd.DataFrame,
-    chunk_number: int,
-    batch_file_path: str,
-    target_file_path: str,
-    skip_header: bool,
-    truncate_file: bool,
-) -> pd.DataFrame:
-    global target_df
-    truncate_file = True
-    with open(batch_file_path, "r") as data_file:
-        if truncate_file:
-            open(target_file_path, "w+").close()
-        with open(target_file_path, "w"):
-            if skip_header:
-                logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path} with skip header"
-                )
-                next(data_file)
-            else:
-                logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path}"
-                )
-            batch_df = pd.read_csv(data_file, sep="|")
-            logging.info("Making batch df -- >")
-            if chunk_number == 1:
-                target_df = batch_df
-                target_df.to_csv(target_file_path, index=False, sep="|")
-            else:
-                batchdfcols = list(batch_df.columns)
-                targetdfcols = dict.fromkeys(list(target_df.columns))
-                logging.info(f"Removing common columns from batch : {chunk_number}")
-                for columns in batchdfcols:
-                    if columns in targetdfcols:
-                        batch_df.drop(columns, axis=1, inplace=True)
-                target_df = pd.concat([target_df, batch_df], axis=1, ignore_index=False)
-                target_df.to_csv(target_file_path, index=False, sep="|")
-        return target_df
-
-
 def upload_file_to_gcs(
     file_path: pathlib.Path,
     target_gcs_bucket: str,
@@ -605,7 +1042,7 @@ def upload_file_to_gcs(
         logging.info(
             f"Uploading output file to gs://{target_gcs_bucket}/{target_gcs_path}"
         )
-        storage_client = storage.Client(project=project_id)
+        storage_client = gcp_clients.storage(project_id)
         bucket = storage_client.bucket(target_gcs_bucket)
         blob = bucket.blob(target_gcs_path)
         blob.upload_from_filename(file_path)
@@ -638,4 +1075,9 @@ if __name__ == "__main__":
         rename_mappings_list=json.loads(os.environ.get("RENAME_MAPPINGS_LIST", r"{}")),
         input_csv_headers=json.loads(os.environ.get("INPUT_CSV_HEADERS", r"[]")),
         output_csv_headers=json.loads(os.environ.get("OUTPUT_CSV_HEADERS", r"[]")),
+        client_pool_size=os.environ.get("CLIENT_POOL_SIZE", "10"),
+        api_max_workers=os.environ.get("API_MAX_WORKERS", "8"),
+        api_requests_per_second=os.environ.get("API_REQUESTS_PER_SECOND", "10"),
+        api_cache_location=os.environ.get("API_CACHE_LOCATION", ""),
+        api_cache_ttl_hours=os.environ.get("API_CACHE_TTL_HOURS", "24"),
     )
@@ -71,6 +71,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "cbsa_2019_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.cbsa_2019_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "metropolitan%20statistical%20area/micropolitan%20statistical%20area",
@@ -107,6 +108,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "cbsa_2020_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.cbsa_2020_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "metropolitan%20statistical%20area/micropolitan%20statistical%20area",
@@ -143,6 +145,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "cbsa_2021_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.cbsa_2021_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "metropolitan%20statistical%20area/micropolitan%20statistical%20area",
@@ -179,6 +182,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "cbsa_2019_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.cbsa_2019_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "metropolitan%20statistical%20area/micropolitan%20statistical%20area",
@@ -215,6 +219,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "cbsa_2020_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.cbsa_2020_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "metropolitan%20statistical%20area/micropolitan%20statistical%20area",
@@ -251,6 +256,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "cbsa_2021_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.cbsa_2021_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "metropolitan%20statistical%20area/micropolitan%20statistical%20area",
@@ -287,6 +293,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "censustract_2019_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.censustract_2019_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "tract",
@@ -323,6 +330,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "censustract_2020_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.censustract_2020_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "tract",
@@ -359,6 +367,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "censustract_2021_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.censustract_2021_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "tract",
@@ -395,6 +404,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "congressionaldistrict_2019_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.congressionaldistrict_2019_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "congressional%20district",
@@ -431,6 +441,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "congressionaldistrict_2020_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.congressionaldistrict_2020_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "congressional%20district",
@@ -467,6 +478,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "congressionaldistrict_2021_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.congressionaldistrict_2021_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "congressional%20district",
@@ -503,6 +515,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "congressionaldistrict_2019_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.congressionaldistrict_2019_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "congressional%20district",
@@ -539,6 +552,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "congressionaldistrict_2020_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.congressionaldistrict_2020_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "congressional%20district",
@@ -575,6 +589,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "congressionaldistrict_2021_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.congressionaldistrict_2021_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "congressional%20district",
@@ -611,6 +626,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "county_2019_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.county_2019_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "county",
@@ -647,6 +663,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "county_2020_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.county_2020_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "county",
@@ -683,6 +700,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "county_2021_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.county_2021_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "county",
@@ -719,6 +737,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "county_2019_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.county_2019_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "county",
@@ -755,6 +774,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "county_2020_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.county_2020_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "county",
@@ -791,6 +811,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "county_2021_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.county_2021_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "county",
@@ -827,6 +848,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "place_2019_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.place_2019_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "place",
@@ -863,6 +885,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "place_2020_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.place_2020_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "place",
@@ -899,6 +922,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "place_2021_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.place_2021_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "place",
@@ -935,6 +959,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "place_2019_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.place_2019_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "place",
@@ -971,6 +996,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "place_2020_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.place_2020_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "place",
@@ -1007,6 +1033,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "place_2021_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.place_2021_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "place",
@@ -1043,6 +1070,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "puma_2019_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.puma_2019_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "public%20use%20microdata%20area",
@@ -1079,6 +1107,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "puma_2020_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.puma_2020_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "public%20use%20microdata%20area",
@@ -1115,6 +1144,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "puma_2021_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.puma_2021_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "public%20use%20microdata%20area",
@@ -1151,6 +1181,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "puma_2019_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.puma_2019_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "public%20use%20microdata%20area",
@@ -1187,6 +1218,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "puma_2020_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.puma_2020_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "public%20use%20microdata%20area",
@@ -1223,6 +1255,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "puma_2021_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.puma_2021_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "public%20use%20microdata%20area",
@@ -1259,6 +1292,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictelementary_2016_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictelementary_2016_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "school%20district%20(elementary)",
@@ -1295,6 +1329,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictelementary_2017_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictelementary_2017_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "school%20district%20(elementary)",
@@ -1331,6 +1366,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictelementary_2018_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictelementary_2018_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "school%20district%20(elementary)",
@@ -1367,6 +1403,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictelementary_2019_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictelementary_2019_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "school%20district%20(elementary)",
@@ -1403,6 +1440,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictelementary_2020_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictelementary_2020_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "school%20district%20(elementary)",
@@ -1439,6 +1477,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictelementary_2021_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictelementary_2021_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "school%20district%20(elementary)",
@@ -1475,6 +1514,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictelementary_2016_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictelementary_2016_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "school%20district%20(elementary)",
@@ -1511,6 +1551,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictelementary_2017_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictelementary_2017_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "school%20district%20(elementary)",
@@ -1547,6 +1588,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictelementary_2018_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictelementary_2018_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "school%20district%20(elementary)",
@@ -1583,6 +1625,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictelementary_2019_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictelementary_2019_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "school%20district%20(elementary)",
@@ -1619,6 +1662,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictelementary_2020_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictelementary_2020_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "school%20district%20(elementary)",
@@ -1655,6 +1699,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictelementary_2021_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictelementary_2021_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "school%20district%20(elementary)",
@@ -1691,6 +1736,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictsecondary_2016_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictsecondary_2016_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "school%20district%20(secondary)",
@@ -1727,6 +1773,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictsecondary_2017_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictsecondary_2017_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "school%20district%20(secondary)",
@@ -1763,6 +1810,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictsecondary_2018_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictsecondary_2018_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "school%20district%20(secondary)",
@@ -1799,6 +1847,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictsecondary_2019_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictsecondary_2019_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "school%20district%20(secondary)",
@@ -1835,6 +1884,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictsecondary_2020_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictsecondary_2020_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "school%20district%20(secondary)",
@@ -1871,6 +1921,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictsecondary_2021_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictsecondary_2021_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "school%20district%20(secondary)",
@@ -1907,6 +1958,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictsecondary_2016_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictsecondary_2016_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "school%20district%20(secondary)",
@@ -1943,6 +1995,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictsecondary_2017_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictsecondary_2017_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "school%20district%20(secondary)",
@@ -1979,6 +2032,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictsecondary_2018_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictsecondary_2018_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "school%20district%20(secondary)",
@@ -2015,6 +2069,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictsecondary_2019_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictsecondary_2019_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "school%20district%20(secondary)",
@@ -2051,6 +2106,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictsecondary_2020_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictsecondary_2020_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "school%20district%20(secondary)",
@@ -2087,6 +2143,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictsecondary_2021_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictsecondary_2021_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "school%20district%20(secondary)",
@@ -2123,6 +2180,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictunified_2016_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictunified_2016_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "school%20district%20(unified)",
@@ -2159,6 +2217,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictunified_2017_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictunified_2017_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "school%20district%20(unified)",
@@ -2195,6 +2254,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictunified_2018_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictunified_2018_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "school%20district%20(unified)",
@@ -2231,6 +2291,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictunified_2019_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictunified_2019_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "school%20district%20(unified)",
@@ -2267,6 +2328,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictunified_2020_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictunified_2020_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "school%20district%20(unified)",
@@ -2303,6 +2365,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictunified_2021_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictunified_2021_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "school%20district%20(unified)",
@@ -2339,6 +2402,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictunified_2016_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictunified_2016_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "school%20district%20(unified)",
@@ -2375,6 +2439,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictunified_2017_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictunified_2017_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "school%20district%20(unified)",
@@ -2411,6 +2476,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictunified_2018_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictunified_2018_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "school%20district%20(unified)",
@@ -2447,6 +2513,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictunified_2019_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictunified_2019_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "school%20district%20(unified)",
@@ -2483,6 +2550,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictunified_2020_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictunified_2020_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "school%20district%20(unified)",
@@ -2519,6 +2587,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "schooldistrictunified_2021_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.schooldistrictunified_2021_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "school%20district%20(unified)",
@@ -2555,6 +2624,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "state_2019_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.state_2019_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "state",
@@ -2591,6 +2661,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "state_2020_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.state_2020_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "state",
@@ -2627,6 +2698,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "state_2021_1yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.state_2021_1yr.target_gcs_path }}",
             "YEAR_REPORT": "1",
             "API_NAMING_CONVENTION": "state",
@@ -2663,6 +2735,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "state_2019_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.state_2019_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "state",
@@ -2699,6 +2772,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "state_2020_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.state_2020_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "state",
@@ -2735,6 +2809,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "state_2021_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.state_2021_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "state",
@@ -2771,6 +2846,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "zcta_2019_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.zcta_2019_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "zip%20code%20tabulation%20area",
@@ -2807,6 +2883,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "zcta_2020_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.zcta_2020_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "zip%20code%20tabulation%20area",
@@ -2843,6 +2920,7 @@ with DAG(
             "SCHEMA_PATH": "{{ var.json.census_bureau_acs.schema_path }}",
             "PIPELINE_NAME": "zcta_2021_5yr",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
+            "API_CACHE_LOCATION": "gs://{{ var.value.composer_bucket }}/data/census_bureau_acs/api_cache",
             "TARGET_GCS_PATH": "{{ var.json.census_bureau_acs.zcta_2021_5yr.target_gcs_path }}",
             "YEAR_REPORT": "5",
             "API_NAMING_CONVENTION": "zip%20code%20tabulation%20area",
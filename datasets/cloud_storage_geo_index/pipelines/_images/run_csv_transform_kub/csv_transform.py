@@ -13,7 +13,6 @@
 # limitations under the License.
 
 import datetime
-import gzip
 import json
 import logging
 import os
@@ -29,7 +28,6 @@ from google.cloud import bigquery, storage
 def main(
     source_url: str,
     source_zipfile: pathlib.Path,
-    source_file: pathlib.Path,
     target_file: pathlib.Path,
     pipeline_name: str,
     chunksize: str,
@@ -57,7 +55,6 @@ def main(
     execute_pipeline(
         source_url=source_url,
         source_zipfile=source_zipfile,
-        source_file=source_file,
         target_file=target_file,
         chunksize=chunksize,
         project_id=project_id,
@@ -85,7 +82,6 @@ def main(
 def execute_pipeline(
     source_url: str,
     source_zipfile: pathlib.Path,
-    source_file: pathlib.Path,
     target_file: pathlib.Path,
     chunksize: str,
     project_id: str,
@@ -108,10 +104,10 @@ def execute_pipeline(
     table_partition_field_type: str,
 ) -> None:
     download_file(source_url, source_zipfile)
-    gz_decompress(infile=source_zipfile, tofile=source_file, delete_zipfile=True)
+    # pandas decompresses the .gz source as it reads each chunk
     process_source_file(
         source_url=source_url,
-        source_file=source_file,
+        source_file=source_zipfile,
         target_file=target_file,
         chunksize=chunksize,
         input_headers=input_csv_headers,
@@ -149,7 +145,7 @@ def execute_pipeline(
                 field_delimiter="|",
             )
             if remove_source_file == "Y":
-                os.remove(source_file)
+                os.remove(source_zipfile)
             else:
                 pass
             if delete_target_file == "Y":
@@ -165,15 +161,6 @@ def execute_pipeline(
         )
 
 
-def gz_decompress(infile: str, tofile: str, delete_zipfile: bool = False) -> None:
-    logging.info(f"Decompressing {infile}")
-    with open(infile, "rb") as inf, open(tofile, "w", encoding="utf8") as tof:
-        decom_str = gzip.decompress(inf.read()).decode("utf-8")
-        tof.write(decom_str)
-    if delete_zipfile:
-        os.remove(infile)
-
-
 def process_source_file(
     source_url: str,
     source_file: str,
@@ -287,8 +274,9 @@ def process_chunk(
     df = rename_headers(df, rename_headers_list)
     df = reorder_headers(df, reorder_headers_list)
     df = add_metadata_cols(df, source_url)
-    save_to_new_file(df, file_path=str(target_file_batch), sep="|")
-    append_batch_file(target_file_batch, target_file, skip_header, not (skip_header))
+    append_batch_to_target_file(
+        df, target_file, include_header=not skip_header, truncate_file=not skip_header
+    )
     logging.info(f"Processing batch file {target_file_batch} completed")
 
 
@@ -440,30 +428,24 @@ def add_metadata_cols(df: pd.DataFrame, source_url: str) -> pd.DataFrame:
     return df
 
 
-def save_to_new_file(df: pd.DataFrame, file_path: str, sep: str = "|") -> None:
-    logging.info(f"Saving data to target file.. {file_path} ...")
-    df.to_csv(file_path, index=False, sep=sep)
-
-
-def append_batch_file(
-    batch_file_path: str, target_file_path: str, skip_header: bool, truncate_file: bool
+def append_batch_to_target_file(
+    df: pd.DataFrame,
+    target_file_path: str,
+    include_header: bool,
+    truncate_file: bool,
+    sep: str = "|",
 ) -> None:
-    with open(batch_file_path, "r") as data_file:
-        if truncate_file:
-            target_file = open(target_file_path, "w+").close()
-        with open(target_file_path, "a+") as target_file:
-            if skip_header:
-                logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path} with skip header"
-                )
-                next(data_file)
-            else:
-                logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path}"
-                )
-            target_file.write(data_file.read())
-            if os.path.exists(batch_file_path):
-                os.remove(batch_file_path)
+    logging.info(
+        f"Appending batch to {target_file_path} with include_header={include_header} and truncate_file={truncate_file}"
+    )
+    # Each chunk goes straight into the target file rather than via a batch file
+    df.to_csv(
+        target_file_path,
+        sep=sep,
+        index=False,
+        header=include_header,
+        mode=("w" if truncate_file else "a"),
+    )
 
 
 def download_file(source_url: str, source_file: pathlib.Path) -> None:
@@ -500,7 +482,6 @@ if __name__ == "__main__":
     main(
         source_url=os.environ["SOURCE_URL"],
         source_zipfile=pathlib.Path(os.environ["SOURCE_ZIPFILE"]).expanduser(),
-        source_file=pathlib.Path(os.environ["SOURCE_FILE"]).expanduser(),
         target_file=pathlib.Path(os.environ["TARGET_FILE"]).expanduser(),
         pipeline_name=os.environ["PIPELINE_NAME"],
         chunksize=os.environ["CHUNKSIZE"],
@@ -63,7 +63,6 @@ with DAG(
             "PIPELINE_NAME": "Cloud Storage GEO Index - Landsat Index",
             "SOURCE_URL": "https://storage.googleapis.com/gcp-public-data-landsat/index.csv.gz",
             "SOURCE_ZIPFILE": "files/cloud_storage_geo_index-landsat_index-data.csv.gz",
-            "SOURCE_FILE": "files/cloud_storage_geo_index-landsat_index-data.csv",
             "TARGET_FILE": "files/cloud_storage_geo_index-landsat_index-data_output.csv",
             "CHUNKSIZE": "1000000",
             "PROJECT_ID": "{{ var.value.gcp_project }}",
@@ -102,7 +101,6 @@ with DAG(
             "PIPELINE_NAME": "Cloud Storage GEO Index - Sentinel 2 Index",
             "SOURCE_URL": "https://storage.googleapis.com/gcp-public-data-sentinel-2/index.csv.gz",
             "SOURCE_ZIPFILE": "files/cloud_storage_geo_index-sentinel_2-data.csv.gz",
-            "SOURCE_FILE": "files/cloud_storage_geo_index-sentinel_2-data.csv",
             "TARGET_FILE": "files/cloud_storage_geo_index-sentinel_2-data_output.csv",
             "CHUNKSIZE": "1000000",
             "PROJECT_ID": "{{ var.value.gcp_project }}",
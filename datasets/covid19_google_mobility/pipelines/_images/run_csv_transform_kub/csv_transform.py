@@ -13,11 +13,13 @@
 # limitations under the License.
 
 
+import collections
 import datetime
 import json
 import logging
 import os
 import pathlib
+import threading
 import typing
 
 import pandas as pd
@@ -46,8 +48,11 @@ def main(
     data_dtypes: dict,
     rename_headers_list: dict,
     table_description: str,
+    csv_engine: str,
+    csv_shadow_rows: str,
 ) -> None:
     logging.info(f"{pipeline_name} process started")
+    csv_readers.configure(engine=csv_engine, shadow_rows=int(csv_shadow_rows))
     pathlib.Path("./files").mkdir(parents=True, exist_ok=True)
     execute_pipeline(
         source_url=source_url,
@@ -69,6 +74,7 @@ def main(
         rename_headers_list=rename_headers_list,
         table_description=table_description,
     )
+    csv_readers.summary()
     logging.info(f"{pipeline_name} process completed")
 
 
@@ -158,9 +164,8 @@ def process_source_file(
 ) -> None:
     logging.info(f"Opening source file {source_file}")
     if header_row_ordinal is None or header_row_ordinal == "None":
-        with pd.read_csv(
+        with csv_readers.read_csv(
             source_file,
-            engine="python",
             encoding="utf-8",
             quotechar='"',
             chunksize=int(chunksize),  # size of batch data, in no. of records
@@ -187,9 +192,8 @@ def process_source_file(
     else:
         header = int(header_row_ordinal)
         if data_dtypes != "[]":
-            with pd.read_csv(
+            with csv_readers.read_csv(
                 source_file,
-                engine="python",
                 encoding="utf-8",
                 quotechar='"',
                 chunksize=int(chunksize),  # size of batch data, in no. of records
@@ -214,9 +218,8 @@ def process_source_file(
                         rename_headers_list=rename_headers_list,
                     )
         else:
-            with pd.read_csv(
+            with csv_readers.read_csv(
                 source_file,
-                engine="python",
                 encoding="utf-8",
                 quotechar='"',
                 chunksize=int(chunksize),  # size of batch data, in no. of records
@@ -410,6 +413,175 @@ def append_batch_file(
                 os.remove(batch_file_path)
 
 
+class CsvReaderFactory:
+    """Opens pd.read_csv readers on the fastest engine that supports the
+    requested options. "auto" uses the C parser, which keeps pandas' own type
+    inference, and falls back to the python parser only for options the C
+    parser lacks. With `shadow_rows` set, the first `shadow_rows` rows of each
+    file are also parsed by the python engine and any difference sends that
+    file back to it. Only that sample is compared, so a difference further
+    into a file goes unnoticed.
+
+    Every image reading CSVs this way carries a copy of this block. Edit the
+    new_york_taxi_trips copy and run scripts/sync_shared_helpers.py."""
+
+    def __init__(self, engine: str = "auto", shadow_rows: int = 0) -> None:
+        self.lock = threading.Lock()
+        self.counts = collections.Counter()
+        self.engine = engine
+        self.shadow_rows = shadow_rows
+
+    def configure(self, engine: str = "auto", shadow_rows: int = 0) -> None:
+        self.engine = engine or "auto"
+        self.shadow_rows = max(shadow_rows, 0)
+
+    def pick_engine(self, options: dict) -> str:
+        sep = options.get("sep", options.get("delimiter", ","))
+        dtype = options.get("dtype")
+        if (
+            self.engine == "python"
+            or sep is None
+            or (len(sep) > 1 and sep != r"\s+")
+            or len(options.get("quotechar", '"')) > 1
+            or options.get("skipfooter")
+            or callable(options.get("on_bad_lines"))
+            or (
+                not isinstance(dtype, dict)
+                and pd.api.types.is_datetime64_any_dtype(dtype)
+            )
+        ):
+            return "python"
+        return "c"
+
+    def read_csv(
+        self, source_file: str, **options
+    ) -> typing.Union[pd.DataFrame, pd.io.parsers.TextFileReader]:
+        engine = self.pick_engine(options)
+        if engine != "python" and self.shadow_rows:
+            sample_options = {
+                key: value
+                for key, value in options.items()
+                if key not in ("chunksize", "iterator")
+            }
+            sample_options["nrows"] = self.shadow_rows
+            if not self.frames_match(
+                source_file,
+                engine,
+                self.open(source_file, engine, sample_options, count=False),
+                self.open(source_file, "python", sample_options, count=False),
+            ):
+                engine = "python"
+        return self.open(source_file, engine, options)
+
+    def open(
+        self, source_file: str, engine: str, options: dict, count: bool = True
+    ) -> typing.Union[pd.DataFrame, pd.io.parsers.TextFileReader]:
+        datetime_dtypes = {}
+        if engine == "c":
+            # Parse floats exactly as the python engine does and infer each
+            # chunk's types from the whole chunk rather than per internal block
+            options = {"float_precision": "round_trip", "low_memory": False, **options}
+            # The C parser rejects datetime64 in dtype, so those columns are
+            # read as text and cast afterwards, as the python parser does
+            dtype = options.get("dtype")
+            if isinstance(dtype, dict):
+                datetime_dtypes = {
+                    column: column_dtype
+                    for column, column_dtype in dtype.items()
+                    if pd.api.types.is_datetime64_any_dtype(column_dtype)
+                }
+                if datetime_dtypes:
+                    options = {
+                        **options,
+                        "dtype": {
+                            **dtype,
+                            **{column: object for column in datetime_dtypes},
+                        },
+                    }
+        if count:
+            logging.info(f"Reading {source_file} with the {engine} CSV engine")
+            with self.lock:
+                self.counts[engine] += 1
+        reader = pd.read_csv(source_file, engine=engine, **options)
+        if not datetime_dtypes:
+            return reader
+        if isinstance(reader, pd.DataFrame):
+            return cast_datetime_columns(reader, datetime_dtypes)
+        return DatetimeCastingReader(reader, datetime_dtypes)
+
+    def frames_match(
+        self,
+        source_file: str,
+        engine: str,
+        engine_df: pd.DataFrame,
+        python_df: pd.DataFrame,
+    ) -> bool:
+        try:
+            pd.testing.assert_frame_equal(engine_df, python_df)
+        except AssertionError as e:
+            logging.warning(
+                f"The {engine} engine parsed {source_file} differently from the python engine, using python instead: {e}"
+            )
+            with self.lock:
+                self.counts["shadow_mismatches"] += 1
+            return False
+        with self.lock:
+            self.counts["shadow_matches"] += 1
+        return True
+
+    def summary(self) -> None:
+        logging.info(
+            f"CSV readers opened: {self.counts['c']} c, "
+            f"{self.counts['python']} python; shadow checks matched: "
+            f"{self.counts['shadow_matches']}, differed: {self.counts['shadow_mismatches']}"
+        )
+
+
+class DatetimeCastingReader:
+    """Wraps a chunked pd.read_csv reader and casts the datetime64 columns of
+    every chunk it hands out."""
+
+    def __init__(
+        self, reader: pd.io.parsers.TextFileReader, datetime_dtypes: dict
+    ) -> None:
+        self.reader = reader
+        self.datetime_dtypes = datetime_dtypes
+
+    def __enter__(self) -> "DatetimeCastingReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __iter__(self) -> "DatetimeCastingReader":
+        return self
+
+    def __next__(self) -> pd.DataFrame:
+        return cast_datetime_columns(next(self.reader), self.datetime_dtypes)
+
+    def get_chunk(self, size: int = None) -> pd.DataFrame:
+        return cast_datetime_columns(self.reader.get_chunk(size), self.datetime_dtypes)
+
+    def close(self) -> None:
+        self.reader.close()
+
+
+def cast_datetime_columns(df: pd.DataFrame, datetime_dtypes: dict) -> pd.DataFrame:
+    for column, column_dtype in datetime_dtypes.items():
+        if column not in df.columns:
+            continue
+        try:
+            df[column] = df[column].astype(column_dtype)
+        except (TypeError, ValueError) as error:
+            raise ValueError(
+                f"Unable to convert column {column} to type {column_dtype}"
+            ) from error
+    return df
+
+
+csv_readers = CsvReaderFactory()
+
+
 def download_file(source_url: str, source_file: pathlib.Path) -> None:
     logging.info(f"Downloading {source_url} into {source_file}")
     r = requests.get(source_url, stream=True)
@@ -461,4 +633,6 @@ if __name__ == "__main__":
         data_dtypes=json.loads(os.environ.get("DATA_DTYPES", r"{}")),
         rename_headers_list=json.loads(os.environ.get("RENAME_HEADERS_LIST", r"{}")),
         table_description=os.environ.get("TABLE_DESCRIPTION", ""),
+        csv_engine=os.environ.get("CSV_ENGINE", "auto"),
+        csv_shadow_rows=os.environ.get("CSV_SHADOW_ROWS", "0"),
     )
@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import datetime
 import json
 import logging
 import os
@@ -203,46 +202,94 @@ def resolve_date_format(
     logging.info("Resolving Date Format")
     for col in date_col_list:
         logging.info(f"Resolving datetime on {col}")
-        df[col] = df[col].apply(
-            lambda x: convert_dt_format(str(x), from_format, to_format, is_date)
+        df[col] = convert_dt_format(
+            df[col].astype(str), from_format, to_format, is_date
         )
     return df
 
 
 def convert_dt_format(
-    dt_str: str, from_format: str, to_format: str, is_date: bool
-) -> str:
-    rtnval = "<initial_value>"
-    if not dt_str or str(dt_str).lower() == "nan" or str(dt_str).lower() == "nat":
-        rtnval = ""
-    elif len(dt_str) > 20:
-        rtnval = ""
-    elif len(dt_str.strip()) == 10:
-        # if there is no time format
-        rtnval = dt_str + " 00:00:00"
-    elif (
-        is_date
-    ):  # and from_format == "%Y%m%d" and to_format == "%Y-%m-%d") or (len(dt_str.strip()) == 8):
+    dt_str: pd.Series, from_format: str, to_format: str, is_date: bool
+) -> pd.Series:
+    rtnval = pd.Series("<initial_value>", index=dt_str.index, dtype=object)
+    dt_str_stripped = dt_str.str.strip()
+    is_blank = (
+        (dt_str == "")
+        | dt_str.str.lower().isin(["nan", "nat"])
+        | (dt_str.str.len() > 20)
+    )
+    # if there is no time format
+    has_date_only = ~is_blank & (dt_str_stripped.str.len() == 10)
+    remaining = ~is_blank & ~has_date_only
+    rtnval[is_blank] = ""
+    rtnval[has_date_only] = dt_str[has_date_only] + " 00:00:00"
+    if is_date:
         # if there is only a date in YYYYMMDD format then add dashes
-        rtnval = (
-            dt_str.strip()[:4] + "-" + dt_str.strip()[4:6] + "-" + dt_str.strip()[6:8]
+        stripped = dt_str_stripped[remaining]
+        rtnval[remaining] = (
+            stripped.str[:4] + "-" + stripped.str[4:6] + "-" + stripped.str[6:8]
         )
-    elif len(dt_str.strip().split(" ")[1]) == 8:
-        # if format of time portion is 00:00:00 then use 00:00 format
-        dt_str = dt_str[:-3]
-        rtnval = datetime.datetime.strptime(dt_str, from_format).strftime(to_format)
-    elif (len(dt_str.strip().split("-")[0]) == 4) and (
-        len(from_format.strip().split("/")[0]) == 2
-    ):
-        # if the format of the date portion of the data is in YYYY-MM-DD format
-        # and from_format is in MM-DD-YYYY then resolve this by modifying the from_format
-        # to use the YYYY-MM-DD.  This resolves mixed date formats in files
-        from_format = "%Y-%m-%d " + from_format.strip().split(" ")[1]
     else:
-        dt_str = "<blank>"
+        time_part = dt_str_stripped.str.split(" ").str[1]
+        no_time = remaining & time_part.isna()
+        if no_time.any():
+            raise IndexError(
+                f"{no_time.sum()} value(s) have no time portion, e.g. {dt_str[no_time].iloc[0]!r}"
+            )
+        # if format of time portion is 00:00:00 then use 00:00 format
+        has_seconds = remaining & (time_part.str.len() == 8)
+        converted = convert_dt_format_series(
+            dt_str[has_seconds].str[:-3], from_format, to_format
+        )
+        unparsed = converted.isna()
+        if unparsed.any():
+            raise ValueError(
+                f"{unparsed.sum()} value(s) do not match format {from_format!r}, "
+                f"e.g. {dt_str[has_seconds][unparsed].iloc[0]!r}"
+            )
+        rtnval[has_seconds] = converted
     return rtnval
 
 
+def convert_dt_format_series(
+    values: pd.Series,
+    from_format: str,
+    to_format: str,
+    fallback: typing.Callable[[str], str] = None,
+) -> pd.Series:
+    # Reformats one (column, from_format, to_format) spec. Dates repeat heavily,
+    # so only the distinct values are parsed. Values which do not match
+    # from_format go through fallback when one is given, otherwise become NaN.
+    codes, uniques = pd.factorize(values)
+    uniques = pd.Series(uniques, dtype=object)
+    parsed = pd.to_datetime(uniques, format=from_format, errors="coerce")
+    converted = format_dt_series(parsed, to_format)
+    if fallback:
+        # Sub-second values keep their fraction, so leave those to fallback too
+        converted = converted.where(parsed == parsed.dt.floor("s"))
+        unmatched = converted.isna()
+        converted[unmatched] = uniques[unmatched].apply(fallback)
+    # Missing values are coded -1, which picks up the trailing NaN
+    return pd.Series(
+        np.append(converted.to_numpy(dtype=object), np.nan)[codes], index=values.index
+    )
+
+
+def format_dt_series(parsed: pd.Series, to_format: str) -> pd.Series:
+    unit = {"%Y-%m-%d": "D", "%Y-%m-%d %H:%M:%S": "s"}.get(to_format)
+    if not unit:
+        return parsed.dt.strftime(to_format)
+    # NumPy renders these two layouts well over twice as fast as strftime
+    iso_text = np.datetime_as_string(
+        parsed.to_numpy().astype(f"datetime64[{unit}]"), unit=unit
+    )
+    return (
+        pd.Series(iso_text, index=parsed.index, dtype=object)
+        .str.replace("T", " ", regex=False)
+        .where(parsed.notna())
+    )
+
+
 def trim_whitespace(df: pd.DataFrame) -> pd.DataFrame:
     logging.info("Trimming whitespace")
     for col in df.columns:
@@ -12,16 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import datetime
 import json
 import logging
 import os
 import pathlib
+import threading
 import typing
 
+import google.auth
 import pandas as pd
 import requests
 from google.api_core.exceptions import NotFound
+from google.auth.transport.requests import AuthorizedSession
 from google.cloud import bigquery, storage
 
 
@@ -54,8 +58,13 @@ def main(
     regex_list: typing.List[typing.List],
     crash_field_list: typing.List[typing.List],
     date_format_list: typing.List[typing.List],
+    csv_engine: str,
+    csv_shadow_rows: str,
+    client_pool_size: str,
 ) -> None:
     logging.info(f"{pipeline_name} process started")
+    gcp_clients.configure(pool_size=int(client_pool_size))
+    csv_readers.configure(engine=csv_engine, shadow_rows=int(csv_shadow_rows))
     pathlib.Path("./files").mkdir(parents=True, exist_ok=True)
     successful_completion = execute_pipeline(
         source_url=source_url,
@@ -86,6 +95,8 @@ def main(
         date_format_list=date_format_list,
         reorder_headers_list=reorder_headers_list,
     )
+    csv_readers.summary()
+    gcp_clients.summary()
     if successful_completion:
         logging.info(f"{pipeline_name} process completed")
     else:
@@ -216,11 +227,11 @@ def download_and_merge_source_files(
     download_file_json(
         source_url_status_json, source_file_status_json, source_file_status_csv
     )
-    df_stations = pd.read_csv(
-        source_file_stations_csv, engine="python", encoding="utf-8", quotechar='"'
+    df_stations = csv_readers.read_csv(
+        source_file_stations_csv, encoding="utf-8", quotechar='"'
     )
-    df_status = pd.read_csv(
-        source_file_status_csv, engine="python", encoding="utf-8", quotechar='"'
+    df_status = csv_readers.read_csv(
+        source_file_status_csv, encoding="utf-8", quotechar='"'
     )
     logging.info("Merging files")
     df = df_stations.merge(df_status, left_on="station_id", right_on="station_id")
@@ -233,6 +244,175 @@ def download_and_merge_source_files(
     save_to_new_file(df, source_file)
 
 
+class CsvReaderFactory:
+    """Opens pd.read_csv readers on the fastest engine that supports the
+    requested options. "auto" uses the C parser, which keeps pandas' own type
+    inference, and falls back to the python parser only for options the C
+    parser lacks. With `shadow_rows` set, the first `shadow_rows` rows of each
+    file are also parsed by the python engine and any difference sends that
+    file back to it. Only that sample is compared, so a difference further
+    into a file goes unnoticed.
+
+    Every image reading CSVs this way carries a copy of this block. Edit the
+    new_york_taxi_trips copy and run scripts/sync_shared_helpers.py."""
+
+    def __init__(self, engine: str = "auto", shadow_rows: int = 0) -> None:
+        self.lock = threading.Lock()
+        self.counts = collections.Counter()
+        self.engine = engine
+        self.shadow_rows = shadow_rows
+
+    def configure(self, engine: str = "auto", shadow_rows: int = 0) -> None:
+        self.engine = engine or "auto"
+        self.shadow_rows = max(shadow_rows, 0)
+
+    def pick_engine(self, options: dict) -> str:
+        sep = options.get("sep", options.get("delimiter", ","))
+        dtype = options.get("dtype")
+        if (
+            self.engine == "python"
+            or sep is None
+            or (len(sep) > 1 and sep != r"\s+")
+            or len(options.get("quotechar", '"')) > 1
+            or options.get("skipfooter")
+            or callable(options.get("on_bad_lines"))
+            or (
+                not isinstance(dtype, dict)
+                and pd.api.types.is_datetime64_any_dtype(dtype)
+            )
+        ):
+            return "python"
+        return "c"
+
+    def read_csv(
+        self, source_file: str, **options
+    ) -> typing.Union[pd.DataFrame, pd.io.parsers.TextFileReader]:
+        engine = self.pick_engine(options)
+        if engine != "python" and self.shadow_rows:
+            sample_options = {
+                key: value
+                for key, value in options.items()
+                if key not in ("chunksize", "iterator")
+            }
+            sample_options["nrows"] = self.shadow_rows
+            if not self.frames_match(
+                source_file,
+                engine,
+                self.open(source_file, engine, sample_options, count=False),
+                self.open(source_file, "python", sample_options, count=False),
+            ):
+                engine = "python"
+        return self.open(source_file, engine, options)
+
+    def open(
+        self, source_file: str, engine: str, options: dict, count: bool = True
+    ) -> typing.Union[pd.DataFrame, pd.io.parsers.TextFileReader]:
+        datetime_dtypes = {}
+        if engine == "c":
+            # Parse floats exactly as the python engine does and infer each
+            # chunk's types from the whole chunk rather than per internal block
+            options = {"float_precision": "round_trip", "low_memory": False, **options}
+            # The C parser rejects datetime64 in dtype, so those columns are
+            # read as text and cast afterwards, as the python parser does
+            dtype = options.get("dtype")
+            if isinstance(dtype, dict):
+                datetime_dtypes = {
+                    column: column_dtype
+                    for column, column_dtype in dtype.items()
+                    if pd.api.types.is_datetime64_any_dtype(column_dtype)
+                }
+                if datetime_dtypes:
+                    options = {
+                        **options,
+                        "dtype": {
+                            **dtype,
+                            **{column: object for column in datetime_dtypes},
+                        },
+                    }
+        if count:
+            logging.info(f"Reading {source_file} with the {engine} CSV engine")
+            with self.lock:
+                self.counts[engine] += 1
+        reader = pd.read_csv(source_file, engine=engine, **options)
+        if not datetime_dtypes:
+            return reader
+        if isinstance(reader, pd.DataFrame):
+            return cast_datetime_columns(reader, datetime_dtypes)
+        return DatetimeCastingReader(reader, datetime_dtypes)
+
+    def frames_match(
+        self,
+        source_file: str,
+        engine: str,
+        engine_df: pd.DataFrame,
+        python_df: pd.DataFrame,
+    ) -> bool:
+        try:
+            pd.testing.assert_frame_equal(engine_df, python_df)
+        except AssertionError as e:
+            logging.warning(
+                f"The {engine} engine parsed {source_file} differently from the python engine, using python instead: {e}"
+            )
+            with self.lock:
+                self.counts["shadow_mismatches"] += 1
+            return False
+        with self.lock:
+            self.counts["shadow_matches"] += 1
+        return True
+
+    def summary(self) -> None:
+        logging.info(
+            f"CSV readers opened: {self.counts['c']} c, "
+            f"{self.counts['python']} python; shadow checks matched: "
+            f"{self.counts['shadow_matches']}, differed: {self.counts['shadow_mismatches']}"
+        )
+
+
+class DatetimeCastingReader:
+    """Wraps a chunked pd.read_csv reader and casts the datetime64 columns of
+    every chunk it hands out."""
+
+    def __init__(
+        self, reader: pd.io.parsers.TextFileReader, datetime_dtypes: dict
+    ) -> None:
+        self.reader = reader
+        self.datetime_dtypes = datetime_dtypes
+
+    def __enter__(self) -> "DatetimeCastingReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __iter__(self) -> "DatetimeCastingReader":
+        return self
+
+    def __next__(self) -> pd.DataFrame:
+        return cast_datetime_columns(next(self.reader), self.datetime_dtypes)
+
+    def get_chunk(self, size: int = None) -> pd.DataFrame:
+        return cast_datetime_columns(self.reader.get_chunk(size), self.datetime_dtypes)
+
+    def close(self) -> None:
+        self.reader.close()
+
+
+def cast_datetime_columns(df: pd.DataFrame, datetime_dtypes: dict) -> pd.DataFrame:
+    for column, column_dtype in datetime_dtypes.items():
+        if column not in df.columns:
+            continue
+        try:
+            df[column] = df[column].astype(column_dtype)
+        except (TypeError, ValueError) as error:
+            raise ValueError(
+                f"Unable to convert column {column} to type {column_dtype}"
+            ) from error
+    return df
+
+
+csv_readers = CsvReaderFactory()
+
+
 def download_file_json(
     source_url: str, source_file_json: pathlib.Path, source_file_csv: pathlib.Path
 ) -> None:
@@ -302,9 +482,8 @@ def process_source_file(
     sep: str = ",",
 ) -> None:
     logging.info(f"Processing file {source_file}")
-    with pd.read_csv(
+    with csv_readers.read_csv(
         source_file,
-        engine="python",
         encoding="utf-8",
         quotechar='"',
         chunksize=int(chunksize),
@@ -340,6 +519,89 @@ def process_source_file(
             )
 
 
+class GoogleCloudClients:
+    """Builds BigQuery and Cloud Storage clients on first use and shares them
+    across every helper in the process. All clients ride on one authorized
+    HTTP session with a pool of `pool_size` connections. Client constructions
+    and API round-trips are counted for the end-of-run summary.
+
+    Every image talking to BigQuery or Cloud Storage carries a copy of this
+    block. Edit the new_york_taxi_trips copy and run
+    scripts/sync_shared_helpers.py."""
+
+    def __init__(self, pool_size: int = 10) -> None:
+        self.lock = threading.Lock()
+        self.counts = collections.Counter()
+        self.pool_size = pool_size
+        self.reset()
+
+    def reset(self) -> None:
+        self.pid = os.getpid()
+        self.credentials = None
+        self.default_project = None
+        self.session = None
+        self.clients = {}
+
+    def configure(self, pool_size: int) -> None:
+        with self.lock:
+            self.pool_size = max(pool_size, 1)
+            self.reset()
+
+    def authorized_session(self) -> AuthorizedSession:
+        if self.pid != os.getpid():
+            # A forked worker process builds its own session and clients
+            self.reset()
+        if self.session is None:
+            self.credentials, self.default_project = google.auth.default(
+                scopes=["https://www.googleapis.com/auth/cloud-platform"]
+            )
+            self.counts["credential_lookups"] += 1
+            self.session = AuthorizedSession(self.credentials)
+            self.session.mount(
+                "https://",
+                requests.adapters.HTTPAdapter(
+                    pool_connections=self.pool_size, pool_maxsize=self.pool_size
+                ),
+            )
+            self.session.hooks["response"].append(self.count_round_trip)
+        return self.session
+
+    def count_round_trip(self, response: requests.Response, *args, **kwargs) -> None:
+        with self.lock:
+            self.counts["api_round_trips"] += 1
+
+    def client(
+        self, label: str, client_class: typing.Type, project: str = None
+    ) -> typing.Union[bigquery.Client, storage.Client]:
+        with self.lock:
+            session = self.authorized_session()
+            project = project or self.default_project
+            if (label, project) not in self.clients:
+                client_args = {"credentials": self.credentials, "_http": session}
+                if project:
+                    client_args["project"] = project
+                self.clients[(label, project)] = client_class(**client_args)
+                self.counts[f"{label}_clients"] += 1
+            return self.clients[(label, project)]
+
+    def bigquery(self, project: str = None) -> bigquery.Client:
+        return self.client("bigquery", bigquery.Client, project)
+
+    def storage(self, project: str = None) -> storage.Client:
+        return self.client("storage", storage.Client, project)
+
+    def summary(self) -> None:
+        logging.info(
+            f"Google Cloud clients built: {self.counts['bigquery_clients']} BigQuery, "
+            f"{self.counts['storage_clients']} Cloud Storage; "
+            f"credential lookups: {self.counts['credential_lookups']}; "
+            f"API round-trips: {self.counts['api_round_trips']}"
+        )
+
+
+gcp_clients = GoogleCloudClients()
+
+
 def load_data_to_bq(
     project_id: str,
     dataset_id: str,
@@ -350,7 +612,7 @@ def load_data_to_bq(
     logging.info(
         f"Loading data from {file_path} into {project_id}.{dataset_id}.{table_id} started"
     )
-    client = bigquery.Client(project=project_id)
+    client = gcp_clients.bigquery(project_id)
     table_ref = client.dataset(dataset_id).table(table_id)
     job_config = bigquery.LoadJobConfig()
     job_config.source_format = bigquery.SourceFormat.CSV
@@ -378,7 +640,7 @@ def create_dest_table(
 ) -> bool:
     table_ref = f"{project_id}.{dataset_id}.{table_id}"
     logging.info(f"Attempting to create table {table_ref} if it doesn't already exist")
-    client = bigquery.Client()
+    client = gcp_clients.bigquery()
     table_exists = False
     try:
         table = client.get_table(table_ref)
@@ -411,7 +673,7 @@ def create_dest_table(
 
 
 def check_gcs_file_exists(file_path: str, bucket_name: str) -> bool:
-    storage_client = storage.Client()
+    storage_client = gcp_clients.storage()
     bucket = storage_client.bucket(bucket_name)
     exists = storage.Blob(bucket=bucket, name=file_path).exists(storage_client)
     return exists
@@ -425,7 +687,7 @@ def create_table_schema(
     if not (schema_filepath):
         schema_struct = schema_structure
     else:
-        storage_client = storage.Client()
+        storage_client = gcp_clients.storage()
         bucket = storage_client.get_bucket(bucket_name)
         blob = bucket.blob(schema_filepath)
         schema_struct = json.loads(blob.download_as_string(client=None))
@@ -703,7 +965,7 @@ def upload_file_to_gcs(
         logging.info(
             f"Uploading output file to gs://{target_gcs_bucket}/{target_gcs_path}"
         )
-        storage_client = storage.Client()
+        storage_client = gcp_clients.storage()
         bucket = storage_client.bucket(target_gcs_bucket)
         blob = bucket.blob(target_gcs_path)
         blob.upload_from_filename(file_path)
@@ -751,4 +1013,7 @@ if __name__ == "__main__":
         regex_list=json.loads(os.environ.get("REGEX_LIST", "[]")),
         crash_field_list=json.loads(os.environ.get("CRASH_FIELD_LIST", "[]")),
         date_format_list=json.loads(os.environ.get("DATE_FORMAT_LIST", "[]")),
+        csv_engine=os.environ.get("CSV_ENGINE", "auto"),
+        csv_shadow_rows=os.environ.get("CSV_SHADOW_ROWS", "0"),
+        client_pool_size=os.environ.get("CLIENT_POOL_SIZE", "10"),
     )
@@ -12,15 +12,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
+import concurrent.futures
 import json
 import logging
 import os
 import pathlib
+import threading
 import typing
 from datetime import datetime
 
+import google.auth
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import requests
+from google.auth.transport.requests import AuthorizedSession
 from google.cloud import bigquery, storage
 from google.cloud.exceptions import NotFound
 
@@ -43,8 +51,16 @@ def main(
     input_headers: typing.List[str],
     data_dtypes: dict,
     output_headers: typing.List[str],
+    output_file_format: str,
+    max_parallel_months: str,
+    month_memory_budget_gb: str,
+    client_pool_size: str,
+    csv_engine: str,
+    csv_shadow_rows: str,
 ) -> None:
     logging.info(f"New York taxi trips - {pipeline_name} process started")
+    gcp_clients.configure(pool_size=int(client_pool_size))
+    csv_readers.configure(engine=csv_engine, shadow_rows=int(csv_shadow_rows))
     pathlib.Path("./files").mkdir(parents=True, exist_ok=True)
     execute_pipeline(
         source_url,
@@ -64,7 +80,12 @@ def main(
         input_headers,
         data_dtypes,
         output_headers,
+        output_file_format,
+        int(max_parallel_months),
+        float(month_memory_budget_gb),
     )
+    csv_readers.summary()
+    gcp_clients.summary()
     logging.info(f"New York taxi trips - {pipeline_name} process completed")
 
 
@@ -86,9 +107,32 @@ def execute_pipeline(
     input_headers: typing.List[str],
     data_dtypes: dict,
     output_headers: typing.List[str],
+    output_file_format: str,
+    max_parallel_months: int = 1,
+    month_memory_budget_gb: float = 0,
 ) -> None:
-    for year_number in range(datetime.now().year, (start_year - 1), -1):
-        process_year_data(
+    max_workers = parallel_month_workers(max_parallel_months, month_memory_budget_gb)
+    output_schema = None
+    if output_file_format == "parquet":
+        # Read once here rather than by every month in every worker
+        output_schema = bq_schema_to_arrow_schema(
+            create_table_schema([], target_gcs_bucket, schema_path), output_headers
+        )
+    executor = None
+    if max_workers > 1:
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
+    year_numbers = range(datetime.now().year, (start_year - 1), -1)
+    loaded_months = loaded_months_index(
+        project_id=project_id,
+        dataset_id=dataset_id,
+        table_id=table_id,
+        data_file_year_field=data_file_year_field,
+        data_file_month_field=data_file_month_field,
+        year_numbers=year_numbers,
+    )
+    pending_months = []
+    for year_number in year_numbers:
+        pending_months += process_year_data(
             source_url=source_url,
             year_number=int(year_number),
             source_file=source_file,
@@ -96,8 +140,7 @@ def execute_pipeline(
             project_id=project_id,
             dataset_id=dataset_id,
             table_id=table_id,
-            data_file_year_field=data_file_year_field,
-            data_file_month_field=data_file_month_field,
+            loaded_months=loaded_months,
             schema_path=schema_path,
             chunksize=chunksize,
             target_gcs_bucket=target_gcs_bucket,
@@ -106,7 +149,80 @@ def execute_pipeline(
             input_headers=input_headers,
             data_dtypes=data_dtypes,
             output_headers=output_headers,
+            output_file_format=output_file_format,
+            output_schema=output_schema,
+            defer_months=executor is not None,
+        )
+    if executor:
+        # Loads are issued in submission order, so each yearly table receives its
+        # months in sequence while later months are still being transformed.
+        # Only a few months per worker are submitted ahead of the loads, so
+        # transformed files cannot pile up on the pod's disk.
+        try:
+            for load_args, output_file in transform_months_in_order(
+                pending_months,
+                executor,
+                window=MONTHS_IN_FLIGHT_PER_WORKER * max_workers,
+            ):
+                if output_file:
+                    load_month(output_file=output_file, **load_args)
+        finally:
+            executor.shutdown()
+
+
+MONTHS_IN_FLIGHT_PER_WORKER = 2
+
+
+def transform_months_in_order(
+    pending_months: typing.List[typing.Tuple[dict, dict]],
+    executor: concurrent.futures.Executor,
+    window: int,
+) -> typing.Iterator[typing.Tuple[dict, str]]:
+    # Yields (load_args, transform_month(**transform_args)) in input order,
+    # keeping at most `window` months submitted ahead of the consumer
+    pending = collections.deque()
+    try:
+        for transform_args, load_args in pending_months:
+            pending.append(
+                (load_args, executor.submit(transform_month, **transform_args))
+            )
+            if len(pending) >= max(window, 1):
+                load_args, transform_job = pending.popleft()
+                yield load_args, transform_job.result()
+        while pending:
+            load_args, transform_job = pending.popleft()
+            yield load_args, transform_job.result()
+    finally:
+        for _, transform_job in pending:
+            transform_job.cancel()
+
+
+def parallel_month_workers(
+    max_parallel_months: int, month_memory_budget_gb: float
+) -> int:
+    max_workers = max(1, max_parallel_months)
+    if max_workers > 1 and month_memory_budget_gb > 0:
+        memory_workers = int(
+            available_memory_bytes() // (month_memory_budget_gb * 1024**3)
         )
+        max_workers = max(1, min(max_workers, memory_workers))
+    logging.info(f"Processing up to {max_workers} month(s) in parallel")
+    return max_workers
+
+
+def available_memory_bytes() -> int:
+    memory_bytes = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    # Prefer the container memory limit (cgroup v2, then v1) when one is set
+    for limit_file in [
+        "/sys/fs/cgroup/memory.max",
+        "/sys/fs/cgroup/memory/memory.limit_in_bytes",
+    ]:
+        if os.path.exists(limit_file):
+            with open(limit_file) as limit_reader:
+                limit = limit_reader.read().strip()
+            if limit.isdigit():
+                return min(memory_bytes, int(limit))
+    return memory_bytes
 
 
 def process_year_data(
@@ -117,8 +233,7 @@ def process_year_data(
     project_id: str,
     dataset_id: str,
     table_id: str,
-    data_file_year_field: str,
-    data_file_month_field: str,
+    loaded_months: typing.Set[typing.Tuple[int, int]],
     schema_path: str,
     chunksize: str,
     target_gcs_bucket: str,
@@ -127,28 +242,52 @@ def process_year_data(
     input_headers: typing.List[str],
     data_dtypes: dict,
     output_headers: typing.List[str],
-) -> None:
+    output_file_format: str,
+    output_schema: pa.Schema = None,
+    defer_months: bool = False,
+) -> typing.List[typing.Tuple[dict, dict]]:
     logging.info(f"Processing year {year_number}")
     destination_table = f"{table_id}_{year_number}"
+    pending_months = []
     for month_number in range(1, 13):
         padded_month = str(month_number).zfill(2)
         process_year_month = f"{year_number}-{padded_month}"
         logging.info(f"Processing month {process_year_month}")
-        month_data_already_loaded = table_has_month_data(
-            project_id=project_id,
-            dataset_id=dataset_id,
-            table_name=destination_table,
-            data_file_year_field=data_file_year_field,
-            year_number=year_number,
-            data_file_month_field=data_file_month_field,
-            month_number=month_number,
-        )
-        if month_data_already_loaded:
+        if (year_number, month_number) in loaded_months:
             logging.info(f"{process_year_month} data is already loaded. Skipping.")
         else:
             target_file_name = str.replace(
                 target_file, ".csv", f"_{year_number}-{month_number}.csv"
             )
+            if defer_months:
+                transform_args = {
+                    "source_url": source_url,
+                    "year_number": year_number,
+                    "month_number": month_number,
+                    "source_file": source_file,
+                    "target_file": target_file,
+                    "target_file_name": target_file_name,
+                    "chunksize": chunksize,
+                    "input_headers": input_headers,
+                    "data_dtypes": data_dtypes,
+                    "output_headers": output_headers,
+                    "pipeline_name": pipeline_name,
+                    "output_file_format": output_file_format,
+                    "output_schema": output_schema,
+                }
+                load_args = {
+                    "year_number": year_number,
+                    "month_number": month_number,
+                    "project_id": project_id,
+                    "dataset_id": dataset_id,
+                    "table_id": destination_table,
+                    "schema_path": schema_path,
+                    "target_gcs_bucket": target_gcs_bucket,
+                    "target_gcs_path": target_gcs_path,
+                    "output_file_format": output_file_format,
+                }
+                pending_months += [(transform_args, load_args)]
+                continue
             process_month(
                 source_url=source_url,
                 year_number=year_number,
@@ -167,44 +306,54 @@ def process_year_data(
                 data_dtypes=data_dtypes,
                 output_headers=output_headers,
                 pipeline_name=pipeline_name,
+                output_file_format=output_file_format,
+                output_schema=output_schema,
             )
     logging.info(f"Processing year {year_number} completed")
+    return pending_months
 
 
-def table_has_month_data(
+def loaded_months_index(
     project_id: str,
     dataset_id: str,
-    table_name: str,
+    table_id: str,
     data_file_year_field: str,
-    year_number: int,
     data_file_month_field: str,
-    month_number: int,
-) -> bool:
-    check_field_exists = field_exists(
-        project_id, dataset_id, table_name, data_file_month_field
-    )
-    if check_field_exists:
-        client = bigquery.Client(project=project_id)
-        query = f"""
-            SELECT count(1) AS number_of_rows
-            FROM {dataset_id}.{table_name}
-            WHERE {data_file_year_field} = {year_number}
-              AND {data_file_month_field} = {month_number}
-        """
-        job_config = bigquery.QueryJobConfig()
-        query_job = client.query(query, job_config=job_config)
-        for row in query_job.result():
-            count_rows = row.number_of_rows
-        if int(count_rows) > 0:
-            return True
-        else:
-            return False
-    else:
-        return None
+    year_numbers: typing.Iterable[int],
+) -> typing.Set[typing.Tuple[int, int]]:
+    logging.info(f"Fetching loaded months from yearly tables {table_id}_YYYY")
+    client = gcp_clients.bigquery(project_id)
+    dataset_tables = [tbl.table_id for tbl in client.list_tables(dataset_id)]
+    month_queries = []
+    for year_number in year_numbers:
+        table_name = f"{table_id}_{year_number}"
+        if table_name not in dataset_tables:
+            continue
+        tbl_schema = client.get_table(f"{dataset_id}.{table_name}").schema
+        field_names = [field.name for field in tbl_schema]
+        if data_file_year_field in field_names and data_file_month_field in field_names:
+            month_queries += [
+                f"""
+                SELECT {data_file_year_field} AS year_number,
+                       {data_file_month_field} AS month_number
+                FROM {dataset_id}.{table_name}
+                GROUP BY year_number, month_number
+                """
+            ]
+    if not month_queries:
+        return set()
+    query = " UNION ALL ".join(month_queries)
+    query_job = client.query(query, job_config=bigquery.QueryJobConfig())
+    loaded_months = set()
+    for row in query_job.result():
+        if row.year_number is not None and row.month_number is not None:
+            loaded_months.add((int(row.year_number), int(row.month_number)))
+    logging.info(f"Found {len(loaded_months)} month(s) already loaded")
+    return loaded_months
 
 
 def table_exists(project_id: str, dataset_id: str, table_name: str) -> bool:
-    client = bigquery.Client(project=project_id)
+    client = gcp_clients.bigquery(project_id)
     tables = client.list_tables(dataset_id)
     found_table = False
     for tbl in tables:
@@ -213,20 +362,87 @@ def table_exists(project_id: str, dataset_id: str, table_name: str) -> bool:
     return found_table
 
 
-def field_exists(
-    project_id: str, dataset_id: str, table_name: str, field_name: str
-) -> bool:
-    if table_exists(project_id, dataset_id, table_name):
-        client = bigquery.Client(project=project_id)
-        table_ref = f"{dataset_id}.{table_name}"
-        tbl_schema = client.get_table(table_ref).schema
-        found_field = False
-        for field in tbl_schema:
-            if field.name == field_name:
-                found_field = True
-        return found_field
-    else:
-        return False
+class GoogleCloudClients:
+    """Builds BigQuery and Cloud Storage clients on first use and shares them
+    across every helper in the process. All clients ride on one authorized
+    HTTP session with a pool of `pool_size` connections. Client constructions
+    and API round-trips are counted for the end-of-run summary.
+
+    Every image talking to BigQuery or Cloud Storage carries a copy of this
+    block. Edit the new_york_taxi_trips copy and run
+    scripts/sync_shared_helpers.py."""
+
+    def __init__(self, pool_size: int = 10) -> None:
+        self.lock = threading.Lock()
+        self.counts = collections.Counter()
+        self.pool_size = pool_size
+        self.reset()
+
+    def reset(self) -> None:
+        self.pid = os.getpid()
+        self.credentials = None
+        self.default_project = None
+        self.session = None
+        self.clients = {}
+
+    def configure(self, pool_size: int) -> None:
+        with self.lock:
+            self.pool_size = max(pool_size, 1)
+            self.reset()
+
+    def authorized_session(self) -> AuthorizedSession:
+        if self.pid != os.getpid():
+            # A forked worker process builds its own session and clients
+            self.reset()
+        if self.session is None:
+            self.credentials, self.default_project = google.auth.default(
+                scopes=["https://www.googleapis.com/auth/cloud-platform"]
+            )
+            self.counts["credential_lookups"] += 1
+            self.session = AuthorizedSession(self.credentials)
+            self.session.mount(
+                "https://",
+                requests.adapters.HTTPAdapter(
+                    pool_connections=self.pool_size, pool_maxsize=self.pool_size
+                ),
+            )
+            self.session.hooks["response"].append(self.count_round_trip)
+        return self.session
+
+    def count_round_trip(self, response: requests.Response, *args, **kwargs) -> None:
+        with self.lock:
+            self.counts["api_round_trips"] += 1
+
+    def client(
+        self, label: str, client_class: typing.Type, project: str = None
+    ) -> typing.Union[bigquery.Client, storage.Client]:
+        with self.lock:
+            session = self.authorized_session()
+            project = project or self.default_project
+            if (label, project) not in self.clients:
+                client_args = {"credentials": self.credentials, "_http": session}
+                if project:
+                    client_args["project"] = project
+                self.clients[(label, project)] = client_class(**client_args)
+                self.counts[f"{label}_clients"] += 1
+            return self.clients[(label, project)]
+
+    def bigquery(self, project: str = None) -> bigquery.Client:
+        return self.client("bigquery", bigquery.Client, project)
+
+    def storage(self, project: str = None) -> storage.Client:
+        return self.client("storage", storage.Client, project)
+
+    def summary(self) -> None:
+        logging.info(
+            f"Google Cloud clients built: {self.counts['bigquery_clients']} BigQuery, "
+            f"{self.counts['storage_clients']} Cloud Storage; "
+            f"credential lookups: {self.counts['credential_lookups']}; "
+            f"API round-trips: {self.counts['api_round_trips']}"
+        )
+
+
+gcp_clients = GoogleCloudClients()
 
 
 def load_data_to_bq(
@@ -235,16 +451,18 @@ def load_data_to_bq(
     table_id: str,
     file_path: str,
     field_delimiter: str,
+    source_format: str = bigquery.SourceFormat.CSV,
 ) -> None:
     logging.info(
         f"Loading data from {file_path} into {project_id}.{dataset_id}.{table_id} started"
     )
-    client = bigquery.Client(project=project_id)
+    client = gcp_clients.bigquery(project_id)
     table_ref = client.dataset(dataset_id).table(table_id)
     job_config = bigquery.LoadJobConfig()
-    job_config.source_format = bigquery.SourceFormat.CSV
-    job_config.field_delimiter = field_delimiter
-    job_config.skip_leading_rows = 1  # ignore the header
+    job_config.source_format = source_format
+    if source_format == bigquery.SourceFormat.CSV:
+        job_config.field_delimiter = field_delimiter
+        job_config.skip_leading_rows = 1  # ignore the header
     job_config.autodetect = False
     with open(file_path, "rb") as source_file:
         job = client.load_table_from_file(source_file, table_ref, job_config=job_config)
@@ -263,7 +481,7 @@ def create_dest_table(
 ) -> None:
     table_ref = f"{project_id}.{dataset_id}.{table_id}"
     logging.info(f"Attempting to create table {table_ref} if it doesn't already exist")
-    client = bigquery.Client()
+    client = gcp_clients.bigquery()
     try:
         table_exists_id = client.get_table(table_ref).table_id
         logging.info(f"Table {table_exists_id} currently exists.")
@@ -287,7 +505,7 @@ def create_table_schema(
     if not (schema_filepath):
         schema_struct = schema_structure
     else:
-        storage_client = storage.Client()
+        storage_client = gcp_clients.storage()
         bucket = storage_client.get_bucket(bucket_name)
         blob = bucket.blob(schema_filepath)
         schema_struct = json.loads(blob.download_as_string(client=None))
@@ -325,7 +543,56 @@ def process_month(
     data_dtypes: dict,
     output_headers: typing.List[str],
     pipeline_name: str,
+    output_file_format: str = "csv",
+    output_schema: pa.Schema = None,
 ) -> None:
+    output_file = transform_month(
+        source_url=source_url,
+        year_number=year_number,
+        month_number=month_number,
+        source_file=source_file,
+        target_file=target_file,
+        target_file_name=target_file_name,
+        chunksize=chunksize,
+        input_headers=input_headers,
+        data_dtypes=data_dtypes,
+        output_headers=output_headers,
+        pipeline_name=pipeline_name,
+        output_file_format=output_file_format,
+        output_schema=output_schema,
+    )
+    if output_file:
+        load_month(
+            year_number=year_number,
+            month_number=month_number,
+            project_id=project_id,
+            dataset_id=dataset_id,
+            table_id=table_id,
+            output_file=output_file,
+            schema_path=schema_path,
+            target_gcs_bucket=target_gcs_bucket,
+            target_gcs_path=target_gcs_path,
+            output_file_format=output_file_format,
+        )
+
+
+def transform_month(
+    source_url: str,
+    year_number: int,
+    month_number: int,
+    source_file: str,
+    target_file: str,
+    target_file_name: str,
+    chunksize: str,
+    input_headers: typing.List[str],
+    data_dtypes: dict,
+    output_headers: typing.List[str],
+    pipeline_name: str,
+    output_file_format: str = "csv",
+    output_schema: pa.Schema = None,
+) -> str:
+    # Every file name below embeds the year and month, so concurrent months
+    # never share a temp file.
     padded_month = str(month_number).zfill(2)
     process_year_month = f"{year_number}-{padded_month}"
     source_url_to_process = f"{source_url}{process_year_month}.parquet"
@@ -336,76 +603,370 @@ def process_month(
         ".csv", f"_{process_year_month}.csv"
     )
     successful_download = download_file(source_url_to_process, source_parquet_file)
-    if successful_download:
+    if successful_download and output_file_format == "parquet":
+        target_parquet_file = str(target_file_name).replace(".csv", ".parquet")
+        try:
+            transform_parquet_file(
+                source_parquet_file=source_parquet_file,
+                target_parquet_file=target_parquet_file,
+                chunksize=chunksize,
+                input_headers=input_headers,
+                output_headers=output_headers,
+                output_schema=output_schema,
+                pipeline_name=pipeline_name,
+                year_number=year_number,
+                month_number=month_number,
+            )
+        except BaseException as error:
+            logging.info(f" ... Unable to obtain or read parquet file ... {error}")
+            logging.info(f"Processing {process_year_month} failed")
+            return ""
+        return target_parquet_file
+    elif successful_download:
         try:
             df_parquet = pd.read_parquet(source_parquet_file)
         except BaseException as error:
             logging.info(f" ... Unable to obtain or read parquet file ... {error}")
             logging.info(f"Processing {process_year_month} failed")
-        else:
-            df_parquet.to_csv(source_file_to_process, sep="|", index=False)
-            with pd.read_csv(
-                source_file_to_process,
-                engine="python",
-                encoding="utf-8",
-                quotechar='"',
-                chunksize=int(chunksize),
-                sep="|",
-                names=input_headers,
-                skiprows=1,
-                dtype=data_dtypes,
-            ) as reader:
-                for chunk_number, chunk in enumerate(reader):
-                    logging.info(
-                        f"Processing chunk #{chunk_number} of file {process_year_month} started"
-                    )
-                    target_file_batch = str(target_file).replace(
-                        ".csv", f"-{process_year_month}-{chunk_number}.csv"
-                    )
-                    df = pd.DataFrame()
-                    df = pd.concat([df, chunk])
-                    process_chunk(
-                        df,
-                        target_file_batch,
-                        target_file_name,
-                        month_number == 1 and chunk_number == 0,
-                        month_number == 1 and chunk_number == 0,
-                        output_headers,
-                        pipeline_name,
-                        year_number,
-                        month_number,
-                    )
-                    logging.info(
-                        f"Processing chunk #{chunk_number} of file {process_year_month} completed"
-                    )
-            if not table_exists(project_id, dataset_id, table_id):
-                # Destination able doesn't exist
-                create_dest_table(
-                    project_id=project_id,
-                    dataset_id=dataset_id,
-                    table_id=table_id,
-                    schema_filepath=schema_path,
-                    bucket_name=target_gcs_bucket,
+            return ""
+        df_parquet.to_csv(source_file_to_process, sep="|", index=False)
+        del df_parquet
+        with csv_readers.read_csv(
+            source_file_to_process,
+            encoding="utf-8",
+            quotechar='"',
+            chunksize=int(chunksize),
+            sep="|",
+            names=input_headers,
+            skiprows=1,
+            dtype=data_dtypes,
+        ) as reader:
+            for chunk_number, chunk in enumerate(reader):
+                logging.info(
+                    f"Processing chunk #{chunk_number} of file {process_year_month} started"
                 )
-            load_data_to_bq(
-                project_id=project_id,
-                dataset_id=dataset_id,
-                table_id=table_id,
-                file_path=target_file_name,
-                field_delimiter="|",
-            )
-            upload_file_to_gcs(
-                file_path=target_file_name,
-                target_gcs_bucket=target_gcs_bucket,
-                target_gcs_path=str(target_gcs_path).replace(
-                    ".csv", f"_{process_year_month}.csv"
-                ),
-            )
-            logging.info(f"Processing {process_year_month} completed")
+                target_file_batch = str(target_file).replace(
+                    ".csv", f"-{process_year_month}-{chunk_number}.csv"
+                )
+                df = pd.DataFrame()
+                df = pd.concat([df, chunk])
+                process_chunk(
+                    df,
+                    target_file_batch,
+                    target_file_name,
+                    month_number == 1 and chunk_number == 0,
+                    month_number == 1 and chunk_number == 0,
+                    output_headers,
+                    pipeline_name,
+                    year_number,
+                    month_number,
+                )
+                logging.info(
+                    f"Processing chunk #{chunk_number} of file {process_year_month} completed"
+                )
+        return target_file_name
     else:
         logging.info(
             f"Informational: The data file {target_file_name} was not generated because no data was available for year {year_number}.  Continuing."
         )
+        return ""
+
+
+def load_month(
+    year_number: int,
+    month_number: int,
+    project_id: str,
+    dataset_id: str,
+    table_id: str,
+    output_file: str,
+    schema_path: str,
+    target_gcs_bucket: str,
+    target_gcs_path: str,
+    output_file_format: str = "csv",
+) -> None:
+    process_year_month = f"{year_number}-{str(month_number).zfill(2)}"
+    if not table_exists(project_id, dataset_id, table_id):
+        # Destination able doesn't exist
+        create_dest_table(
+            project_id=project_id,
+            dataset_id=dataset_id,
+            table_id=table_id,
+            schema_filepath=schema_path,
+            bucket_name=target_gcs_bucket,
+        )
+    if output_file_format == "parquet":
+        source_format = bigquery.SourceFormat.PARQUET
+    else:
+        source_format = bigquery.SourceFormat.CSV
+    load_data_to_bq(
+        project_id=project_id,
+        dataset_id=dataset_id,
+        table_id=table_id,
+        file_path=output_file,
+        field_delimiter="|",
+        source_format=source_format,
+    )
+    upload_file_to_gcs(
+        file_path=output_file,
+        target_gcs_bucket=target_gcs_bucket,
+        target_gcs_path=str(target_gcs_path).replace(
+            ".csv", f"_{process_year_month}.{output_file_format}"
+        ),
+    )
+    logging.info(f"Processing {process_year_month} completed")
+
+
+def transform_parquet_file(
+    source_parquet_file: str,
+    target_parquet_file: str,
+    chunksize: str,
+    input_headers: typing.List[str],
+    output_headers: typing.List[str],
+    output_schema: pa.Schema,
+    pipeline_name: str,
+    year_number: int,
+    month_number: int,
+) -> None:
+    logging.info(
+        f"Transforming parquet file {source_parquet_file} into {target_parquet_file}"
+    )
+    # Render STRING columns the way the csv round-trip did, eg. 1.0 -> "1.0"
+    string_columns = [
+        field.name for field in output_schema if pa.types.is_string(field.type)
+    ]
+    source = pq.ParquetFile(source_parquet_file)
+    with pq.ParquetWriter(target_parquet_file, output_schema) as writer:
+        for batch_number, batch in enumerate(
+            source.iter_batches(batch_size=int(chunksize))
+        ):
+            logging.info(
+                f"Processing batch #{batch_number} of file {source_parquet_file}"
+            )
+            df = batch.to_pandas()
+            df.columns = input_headers
+            df = process_chunk_columnar(
+                df, output_headers, pipeline_name, year_number, month_number
+            )
+            df[string_columns] = df[string_columns].astype("string")
+            writer.write_table(
+                pa.Table.from_pandas(df, preserve_index=False).cast(
+                    output_schema, safe=False
+                )
+            )
+
+
+def process_chunk_columnar(
+    df: pd.DataFrame,
+    output_headers: typing.List[str],
+    pipeline_name: str,
+    year_number: int,
+    month_number: int,
+) -> pd.DataFrame:
+    if pipeline_name == "tlc_green_trips":
+        df["distance_between_service"] = None
+        df["time_between_service"] = None
+    df["data_file_year"] = year_number
+    df["data_file_month"] = month_number
+    # Equivalent of the "%Y-%m-%d %H:%M:%S" formatting applied in the csv path
+    df["pickup_datetime"] = df["pickup_datetime"].dt.floor("s")
+    df["dropoff_datetime"] = df["dropoff_datetime"].dt.floor("s")
+    passenger_count = pd.to_numeric(df["passenger_count"], errors="coerce")
+    passenger_count = passenger_count.where(
+        (passenger_count >= 0) & np.isfinite(passenger_count)
+    )
+    df["passenger_count"] = np.trunc(passenger_count).astype("Int64")
+    df = remove_null_rows(df)
+    return df[output_headers]
+
+
+def bq_schema_to_arrow_schema(
+    schema: typing.List[bigquery.SchemaField], output_headers: typing.List[str]
+) -> pa.Schema:
+    arrow_types = {
+        "STRING": pa.string(),
+        "INTEGER": pa.int64(),
+        "INT64": pa.int64(),
+        "NUMERIC": pa.decimal128(38, 9),
+        "FLOAT": pa.float64(),
+        "FLOAT64": pa.float64(),
+        "BOOLEAN": pa.bool_(),
+        "DATE": pa.date32(),
+        "DATETIME": pa.timestamp("us"),
+        "TIMESTAMP": pa.timestamp("us", tz="UTC"),
+    }
+    fields = {field.name: arrow_types[field.field_type.upper()] for field in schema}
+    return pa.schema(
+        [(field_name, fields[field_name]) for field_name in output_headers]
+    )
+
+
+class CsvReaderFactory:
+    """Opens pd.read_csv readers on the fastest engine that supports the
+    requested options. "auto" uses the C parser, which keeps pandas' own type
+    inference, and falls back to the python parser only for options the C
+    parser lacks. With `shadow_rows` set, the first `shadow_rows` rows of each
+    file are also parsed by the python engine and any difference sends that
+    file back to it. Only that sample is compared, so a difference further
+    into a file goes unnoticed.
+
+    Every image reading CSVs this way carries a copy of this block. Edit the
+    new_york_taxi_trips copy and run scripts/sync_shared_helpers.py."""
+
+    def __init__(self, engine: str = "auto", shadow_rows: int = 0) -> None:
+        self.lock = threading.Lock()
+        self.counts = collections.Counter()
+        self.engine = engine
+        self.shadow_rows = shadow_rows
+
+    def configure(self, engine: str = "auto", shadow_rows: int = 0) -> None:
+        self.engine = engine or "auto"
+        self.shadow_rows = max(shadow_rows, 0)
+
+    def pick_engine(self, options: dict) -> str:
+        sep = options.get("sep", options.get("delimiter", ","))
+        dtype = options.get("dtype")
+        if (
+            self.engine == "python"
+            or sep is None
+            or (len(sep) > 1 and sep != r"\s+")
+            or len(options.get("quotechar", '"')) > 1
+            or options.get("skipfooter")
+            or callable(options.get("on_bad_lines"))
+            or (
+                not isinstance(dtype, dict)
+                and pd.api.types.is_datetime64_any_dtype(dtype)
+            )
+        ):
+            return "python"
+        return "c"
+
+    def read_csv(
+        self, source_file: str, **options
+    ) -> typing.Union[pd.DataFrame, pd.io.parsers.TextFileReader]:
+        engine = self.pick_engine(options)
+        if engine != "python" and self.shadow_rows:
+            sample_options = {
+                key: value
+                for key, value in options.items()
+                if key not in ("chunksize", "iterator")
+            }
+            sample_options["nrows"] = self.shadow_rows
+            if not self.frames_match(
+                source_file,
+                engine,
+                self.open(source_file, engine, sample_options, count=False),
+                self.open(source_file, "python", sample_options, count=False),
+            ):
+                engine = "python"
+        return self.open(source_file, engine, options)
+
+    def open(
+        self, source_file: str, engine: str, options: dict, count: bool = True
+    ) -> typing.Union[pd.DataFrame, pd.io.parsers.TextFileReader]:
+        datetime_dtypes = {}
+        if engine == "c":
+            # Parse floats exactly as the python engine does and infer each
+            # chunk's types from the whole chunk rather than per internal block
+            options = {"float_precision": "round_trip", "low_memory": False, **options}
+            # The C parser rejects datetime64 in dtype, so those columns are
+            # read as text and cast afterwards, as the python parser does
+            dtype = options.get("dtype")
+            if isinstance(dtype, dict):
+                datetime_dtypes = {
+                    column: column_dtype
+                    for column, column_dtype in dtype.items()
+                    if pd.api.types.is_datetime64_any_dtype(column_dtype)
+                }
+                if datetime_dtypes:
+                    options = {
+                        **options,
+                        "dtype": {
+                            **dtype,
+                            **{column: object for column in datetime_dtypes},
+                        },
+                    }
+        if count:
+            logging.info(f"Reading {source_file} with the {engine} CSV engine")
+            with self.lock:
+                self.counts[engine] += 1
+        reader = pd.read_csv(source_file, engine=engine, **options)
+        if not datetime_dtypes:
+            return reader
+        if isinstance(reader, pd.DataFrame):
+            return cast_datetime_columns(reader, datetime_dtypes)
+        return DatetimeCastingReader(reader, datetime_dtypes)
+
+    def frames_match(
+        self,
+        source_file: str,
+        engine: str,
+        engine_df: pd.DataFrame,
+        python_df: pd.DataFrame,
+    ) -> bool:
+        try:
+            pd.testing.assert_frame_equal(engine_df, python_df)
+        except AssertionError as e:
+            logging.warning(
+                f"The {engine} engine parsed {source_file} differently from the python engine, using python instead: {e}"
+            )
+            with self.lock:
+                self.counts["shadow_mismatches"] += 1
+            return False
+        with self.lock:
+            self.counts["shadow_matches"] += 1
+        return True
+
+    def summary(self) -> None:
+        logging.info(
+            f"CSV readers opened: {self.counts['c']} c, "
+            f"{self.counts['python']} python; shadow checks matched: "
+            f"{self.counts['shadow_matches']}, differed: {self.counts['shadow_mismatches']}"
+        )
+
+
+class DatetimeCastingReader:
+    """Wraps a chunked pd.read_csv reader and casts the datetime64 columns of
+    every chunk it hands out."""
+
+    def __init__(
+        self, reader: pd.io.parsers.TextFileReader, datetime_dtypes: dict
+    ) -> None:
+        self.reader = reader
+        self.datetime_dtypes = datetime_dtypes
+
+    def __enter__(self) -> "DatetimeCastingReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __iter__(self) -> "DatetimeCastingReader":
+        return self
+
+    def __next__(self) -> pd.DataFrame:
+        return cast_datetime_columns(next(self.reader), self.datetime_dtypes)
+
+    def get_chunk(self, size: int = None) -> pd.DataFrame:
+        return cast_datetime_columns(self.reader.get_chunk(size), self.datetime_dtypes)
+
+    def close(self) -> None:
+        self.reader.close()
+
+
+def cast_datetime_columns(df: pd.DataFrame, datetime_dtypes: dict) -> pd.DataFrame:
+    for column, column_dtype in datetime_dtypes.items():
+        if column not in df.columns:
+            continue
+        try:
+            df[column] = df[column].astype(column_dtype)
+        except (TypeError, ValueError) as error:
+            raise ValueError(
+                f"Unable to convert column {column} to type {column_dtype}"
+            ) from error
+    return df
+
+
+csv_readers = CsvReaderFactory()
 
 
 def download_file(source_url: str, source_file: pathlib.Path) -> bool:
@@ -521,7 +1082,7 @@ def upload_file_to_gcs(
         logging.info(
             f"Uploading output file {file_path} to gs://{target_gcs_bucket}/{target_gcs_path}"
         )
-        storage_client = storage.Client()
+        storage_client = gcp_clients.storage()
         bucket = storage_client.bucket(target_gcs_bucket)
         blob = bucket.blob(target_gcs_path)
         blob.upload_from_filename(file_path)
@@ -552,4 +1113,10 @@ if __name__ == "__main__":
         input_headers=json.loads(os.environ.get("INPUT_CSV_HEADERS", "")),
         data_dtypes=json.loads(os.environ.get("DATA_DTYPES", "")),
         output_headers=json.loads(os.environ.get("OUTPUT_CSV_HEADERS", "")),
+        output_file_format=os.environ.get("OUTPUT_FILE_FORMAT", "csv"),
+        max_parallel_months=os.environ.get("MAX_PARALLEL_MONTHS", "1"),
+        month_memory_budget_gb=os.environ.get("MONTH_MEMORY_BUDGET_GB", "0"),
+        client_pool_size=os.environ.get("CLIENT_POOL_SIZE", "10"),
+        csv_engine=os.environ.get("CSV_ENGINE", "auto"),
+        csv_shadow_rows=os.environ.get("CSV_SHADOW_ROWS", "0"),
     )
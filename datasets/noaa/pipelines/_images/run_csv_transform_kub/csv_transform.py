@@ -12,30 +12,38 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
+import contextlib
 import csv
 import datetime
 import ftplib
 import glob
 import gzip
+import io
 import json
 import logging
 import math
 import os
 import pathlib
+import queue
 import re
 import shutil
 import sys
+import threading
 import time
 import typing
 import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from urllib.request import Request, urlopen
 
 import geopandas as geo
+import google.auth
 import numpy as np
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 from google.api_core.exceptions import NotFound
+from google.auth.transport.requests import AuthorizedSession
 from google.cloud import bigquery, storage
 from sh import sed
 
@@ -77,8 +85,17 @@ def main(
     number_of_header_rows: str,
     int_date_list: typing.List[str],
     gen_location_list: dict,
+    output_shard_size_mb: str,
+    download_max_workers: str,
+    download_requests_per_second: str,
+    reader_engine: str,
+    max_parallel_years: str,
+    client_pool_size: str,
+    schema_cache_dir: str,
 ) -> None:
     logging.info(f"{pipeline_name} process started")
+    gcp_clients.configure(pool_size=int(client_pool_size))
+    schema_cache.configure(cache_dir=schema_cache_dir)
     pathlib.Path("./files").mkdir(parents=True, exist_ok=True)
     execute_pipeline(
         pipeline_name=pipeline_name,
@@ -117,7 +134,13 @@ def main(
         number_of_header_rows=int(number_of_header_rows),
         int_date_list=int_date_list,
         gen_location_list=gen_location_list,
+        output_shard_size_mb=int(output_shard_size_mb),
+        download_max_workers=int(download_max_workers),
+        download_requests_per_second=float(download_requests_per_second),
+        reader_engine=reader_engine,
+        max_parallel_years=int(max_parallel_years),
     )
+    gcp_clients.summary()
     logging.info(f"{pipeline_name} process completed")
 
 
@@ -158,43 +181,65 @@ def execute_pipeline(
     number_of_header_rows: int,
     int_date_list: typing.List[str],
     gen_location_list: dict,
+    output_shard_size_mb: int = 0,
+    download_max_workers: int = 1,
+    download_requests_per_second: float = 0,
+    reader_engine: str = "csv",
+    max_parallel_years: int = 1,
 ) -> None:
     if pipeline_name == "GHCND by year":
         if full_data_load == "N":
             start = str(datetime.datetime.now().year - 6)
         else:
             start = start_year
-        ftp_batch = 1
-        for yr in range(int(start), datetime.datetime.now().year + 1):
-            yr_str = str(yr)
-            source_zipfile = str.replace(str(source_file), ".csv", f"_{yr_str}.csv.gz")
-            source_file_unzipped = str.replace(str(source_zipfile), ".csv.gz", ".csv")
-            target_file_year = str.replace(str(target_file), ".csv", f"_{yr_str}.csv")
-            destination_table_year = f"{destination_table}_{yr_str}"
-            source_url_year = str.replace(
+        years = [str(yr) for yr in range(int(start), datetime.datetime.now().year + 1)]
+        ftp_pool = FtpSessionPool(ftp_host, ftp_dir, size=download_max_workers)
+        # Allow bursts of ftp_batch_size files, averaging one batch per sleep period
+        rate_limiter = TokenBucket(
+            rate=(
+                int(ftp_batch_size) / int(ftp_batch_sleep_time)
+                if int(ftp_batch_sleep_time) > 0
+                else 0
+            ),
+            capacity=int(ftp_batch_size),
+        )
+        metrics = DownloadMetrics(pipeline_name, total_files=len(years))
+
+        def year_zipfile(yr_str: str) -> str:
+            return str.replace(str(source_file), ".csv", f"_{yr_str}.csv.gz")
+
+        def year_source_url(yr_str: str) -> str:
+            return str.replace(
                 source_url["ghcnd_by_year"], ".csv.gz", f"{yr_str}.csv.gz"
             )
-            target_gcs_path_year = str.replace(
-                target_gcs_path, ".csv", f"_{yr_str}.csv"
-            )
-            if ftp_batch == int(ftp_batch_size):
-                logging.info("Sleeping...")
-                time.sleep(int(ftp_batch_sleep_time))
-                ftp_batch = 1
-            else:
-                ftp_batch += 1
-            download_file_ftp(
-                ftp_host=ftp_host,
-                ftp_dir=ftp_dir,
+
+        def download_year(yr_str: str) -> None:
+            download_file_ftp_pooled(
+                ftp_pool=ftp_pool,
                 ftp_filename=f"{yr_str}.csv.gz",
-                local_file=source_zipfile,
-                source_url=source_url_year,
+                local_file=year_zipfile(yr_str),
+                source_url=year_source_url(yr_str),
+                rate_limiter=rate_limiter,
+                metrics=metrics,
             )
-            gz_decompress(
-                infile=source_zipfile, tofile=source_file_unzipped, delete_zipfile=True
+
+        # Later years download while the current one is being transformed
+        for yr_str, _ in prefetch_in_order(
+            years,
+            download_year,
+            max_workers=download_max_workers,
+            window=download_max_workers,
+        ):
+            source_zipfile = year_zipfile(yr_str)
+            target_file_year = str.replace(str(target_file), ".csv", f"_{yr_str}.csv")
+            destination_table_year = f"{destination_table}_{yr_str}"
+            source_url_year = year_source_url(yr_str)
+            target_gcs_path_year = str.replace(
+                target_gcs_path, ".csv", f"_{yr_str}.csv"
             )
+            # The year file is read straight from the gzip stream and removed after
             process_and_load_table(
-                source_file=source_file_unzipped,
+                source_file=source_zipfile,
                 target_file=target_file_year,
                 pipeline_name=pipeline_name,
                 source_url=source_url_year,
@@ -216,11 +261,15 @@ def execute_pipeline(
                 regex_list=regex_list,
                 trim_whitespace_list=trim_whitespace_list,
                 rename_headers_list=rename_headers_list,
-                remove_source_file=remove_source_file,
+                remove_source_file=True,
                 delete_target_file=delete_target_file,
                 int_date_list=int_date_list,
                 gen_location_list=gen_location_list,
+                output_shard_size_mb=output_shard_size_mb,
+                reader_engine=reader_engine,
             )
+        ftp_pool.close()
+        metrics.summary()
         return None
     if pipeline_name in ["NOAA GHCN-M"]:
         for file_id in source_url:
@@ -316,6 +365,7 @@ def execute_pipeline(
             delete_target_file=delete_target_file,
             int_date_list=int_date_list,
             gen_location_list=gen_location_list,
+            reader_engine=reader_engine,
         )
         return None
     if pipeline_name in [
@@ -361,36 +411,32 @@ def execute_pipeline(
             delete_target_file=delete_target_file,
             int_date_list=int_date_list,
             gen_location_list=gen_location_list,
+            reader_engine=reader_engine,
         )
         return None
     if pipeline_name in ["NOAA GSOD 2020", "NOAA GSOD 2022"]:
         src_url_root = source_url[pipeline_name.replace(" ", "_").lower()]
         files = url_directory_list(source_url_path=src_url_root, file_pattern=".csv")
-        file_cnt = len(files)
-        file_ptr = 1
-        for file_name in files:
-            if file_name == files[0]:
-                logging.info(f"Writing file {file_name} to {source_file} with header")
-                download_file_http(file_name, source_file, True, True)
-            else:
-                url_filename = os.path.basename(file_name).replace(".csv", "")
-                source_file_tmpname = str(source_file).replace(
-                    ".csv", f"_{url_filename}.csv"
-                )
-                download_file_http(file_name, source_file_tmpname, True, True)
-                os.system(f"sed -i 1d {source_file_tmpname} 2> /dev/null")
-                os.system(f"cat {source_file_tmpname} >> {source_file}")
-                os.system(f"rm {source_file_tmpname}")
-                time.sleep(0.5)
-            if ((file_ptr % 100) == 0) or (file_ptr == file_cnt):
-                logging.info(f"Appended {file_ptr} files of total {file_cnt} files")
-            file_ptr += 1
-        if number_of_header_rows > 0:
-            remove_header_rows(source_file, number_of_header_rows=number_of_header_rows)
-        else:
-            pass
+        session = http_session(pool_size=download_max_workers)
+        rate_limiter = TokenBucket(
+            rate=download_requests_per_second, capacity=download_max_workers
+        )
+        metrics = DownloadMetrics(pipeline_name, total_files=len(files))
+        logging.info(f"Streaming {len(files)} files into the transform")
+        # The station files are transformed as they arrive, without being
+        # concatenated into source_file first
+        source_lines = concatenated_lines(
+            prefetch_in_order(
+                files,
+                lambda url: fetch_url_content(session, url, rate_limiter, metrics),
+                max_workers=download_max_workers,
+                window=download_max_workers * 4,
+            ),
+            number_of_header_rows=number_of_header_rows,
+        )
         process_and_load_table(
             source_file=source_file,
+            source_lines=source_lines,
             target_file=target_file,
             pipeline_name=pipeline_name,
             source_url=src_url_root,
@@ -416,7 +462,10 @@ def execute_pipeline(
             delete_target_file=delete_target_file,
             int_date_list=int_date_list,
             gen_location_list=gen_location_list,
+            reader_engine=reader_engine,
         )
+        session.close()
+        metrics.summary()
         return None
     if pipeline_name in ("NOAA NWS Forecast Regions"):
         src_url_root = source_url[pipeline_name.replace(" ", "_").lower()]
@@ -459,6 +508,7 @@ def execute_pipeline(
             delete_target_file=delete_target_file,
             int_date_list=int_date_list,
             gen_location_list=gen_location_list,
+            reader_engine=reader_engine,
         )
         return None
     if pipeline_name in [
@@ -502,6 +552,7 @@ def execute_pipeline(
             delete_target_file=delete_target_file,
             int_date_list=int_date_list,
             gen_location_list=gen_location_list,
+            reader_engine=reader_engine,
         )
         return None
     if pipeline_name == "GHCND hurricanes":
@@ -538,6 +589,7 @@ def execute_pipeline(
             delete_target_file=delete_target_file,
             int_date_list=int_date_list,
             gen_location_list=gen_location_list,
+            reader_engine=reader_engine,
         )
         return None
     if pipeline_name == "NOAA lightning strikes by year":
@@ -572,6 +624,7 @@ def execute_pipeline(
             number_of_header_rows=number_of_header_rows,
             int_date_list=int_date_list,
             gen_location_list=gen_location_list,
+            reader_engine=reader_engine,
         )
         return None
     if pipeline_name == "NOAA Storms database by year":
@@ -591,6 +644,7 @@ def execute_pipeline(
             date_format_list=date_format_list,
             rename_headers_list=rename_headers_list,
             gen_location_list=gen_location_list,
+            max_parallel_years=max_parallel_years,
         )
         return None
 
@@ -646,7 +700,7 @@ def process_ghcn_m_file(
 def download_file_gs(source_url: str, source_file: pathlib.Path) -> None:
     logging.info(f"Downloading {source_url} to {source_file}")
     with open(source_file, "wb+") as file_obj:
-        storage.Client().download_blob_to_file(source_url, file_obj)
+        gcp_clients.storage().download_blob_to_file(source_url, file_obj)
 
 
 def process_storms_database_by_year(
@@ -665,6 +719,7 @@ def process_storms_database_by_year(
     date_format_list: typing.List[typing.List[str]],
     rename_headers_list: dict,
     gen_location_list: dict,
+    max_parallel_years: int = 1,
 ) -> None:
     host = source_url["root"].split("ftp://")[1].split("/")[0]
     cwd = source_url["root"].split("ftp://")[1][len(host) :]
@@ -674,143 +729,249 @@ def process_storms_database_by_year(
     list_of_locations_files = sorted(
         ftp_list_of_files(host=host, cwd=cwd, filter_expr="StormEvents_locations")
     )
-    for year_to_process in range(int(start_year), datetime.date.today().year + 1):
-        locations_file = list(
-            filter(
-                lambda x: x.startswith(
-                    f"StormEvents_locations-ftp_v1.0_d{str(year_to_process)}"
-                ),
-                list_of_locations_files,
+    years_to_process = range(int(start_year), datetime.date.today().year + 1)
+    transform_args = {
+        "source_url": source_url,
+        "host": host,
+        "cwd": cwd,
+        "list_of_details_files": list_of_details_files,
+        "list_of_locations_files": list_of_locations_files,
+        "source_file": source_file,
+        "target_file": target_file,
+        "reorder_headers_list": reorder_headers_list,
+        "date_format_list": date_format_list,
+        "rename_headers_list": rename_headers_list,
+        "gen_location_list": gen_location_list,
+    }
+    load_args = {
+        "project_id": project_id,
+        "dataset_id": dataset_id,
+        "destination_table": destination_table,
+        "target_gcs_bucket": target_gcs_bucket,
+        "target_gcs_path": target_gcs_path,
+        "schema_path": schema_path,
+        "drop_dest_table": drop_dest_table,
+    }
+    if max_parallel_years <= 1:
+        for year_to_process in years_to_process:
+            targ_file_yr = transform_storms_year(
+                year_to_process=year_to_process, **transform_args
             )
-        )
-        details_file = list(
-            filter(
-                lambda x: x.startswith(
-                    f"StormEvents_details-ftp_v1.0_d{str(year_to_process)}"
+            load_storms_year(
+                year_to_process=year_to_process, targ_file_yr=targ_file_yr, **load_args
+            )
+        return None
+    logging.info(f"Processing up to {max_parallel_years} year(s) in parallel")
+    with ProcessPoolExecutor(max_workers=max_parallel_years) as executor:
+        transform_jobs = [
+            (
+                year_to_process,
+                executor.submit(
+                    transform_storms_year,
+                    year_to_process=year_to_process,
+                    **transform_args,
                 ),
-                list_of_details_files,
             )
+            for year_to_process in years_to_process
+        ]
+        # Years are loaded in order as their transforms complete, so each yearly
+        # table ends up exactly as the sequential path would leave it.
+        try:
+            for year_to_process, transform_job in transform_jobs:
+                load_storms_year(
+                    year_to_process=year_to_process,
+                    targ_file_yr=transform_job.result(),
+                    **load_args,
+                )
+        finally:
+            for _, transform_job in transform_jobs:
+                transform_job.cancel()
+
+
+def transform_storms_year(
+    year_to_process: int,
+    source_url: dict,
+    host: str,
+    cwd: str,
+    list_of_details_files: typing.List[str],
+    list_of_locations_files: typing.List[str],
+    source_file: pathlib.Path,
+    target_file: pathlib.Path,
+    reorder_headers_list: typing.List[str],
+    date_format_list: typing.List[typing.List[str]],
+    rename_headers_list: dict,
+    gen_location_list: dict,
+) -> str:
+    locations_file = list(
+        filter(
+            lambda x: x.startswith(
+                f"StormEvents_locations-ftp_v1.0_d{str(year_to_process)}"
+            ),
+            list_of_locations_files,
         )
-        if locations_file:
-            ftp_filename = locations_file[0]
-            local_file = str(source_file).replace(
-                ".csv", f"_{str(year_to_process)}_locations.csv"
-            )
-            local_zipfile = f"{os.path.dirname(local_file)}/{ftp_filename}"
-            ftp_zipfile_path = f'{source_url["root"]}/{ftp_filename}'
-            logging.info("Processing Storms Locations File  ...")
-            logging.info(
-                f"     host={host} cwd={cwd} ftp_filename={ftp_filename} local_file={local_file} local_zipfile={local_zipfile} source_url={ftp_zipfile_path} "
-            )
-            df_locations = FTP_to_DF(
-                host=host,
-                cwd=cwd,
-                ftp_filename=ftp_filename,
-                local_file=local_zipfile,
-                source_url=ftp_zipfile_path,
-            )
-        else:
-            logging.info("Storms Locations File does not exist!")
-            df_locations = create_storms_locations_df()
-        ftp_filename = details_file[0]
+    )
+    details_file = list(
+        filter(
+            lambda x: x.startswith(
+                f"StormEvents_details-ftp_v1.0_d{str(year_to_process)}"
+            ),
+            list_of_details_files,
+        )
+    )
+    if locations_file:
+        ftp_filename = locations_file[0]
         local_file = str(source_file).replace(
-            ".csv", f"_{str(year_to_process)}_detail.csv"
+            ".csv", f"_{str(year_to_process)}_locations.csv"
         )
         local_zipfile = f"{os.path.dirname(local_file)}/{ftp_filename}"
         ftp_zipfile_path = f'{source_url["root"]}/{ftp_filename}'
-        logging.info("Processing Storms Detail File ...")
+        logging.info("Processing Storms Locations File  ...")
         logging.info(
             f"     host={host} cwd={cwd} ftp_filename={ftp_filename} local_file={local_file} local_zipfile={local_zipfile} source_url={ftp_zipfile_path} "
         )
-        df_details = FTP_to_DF(
+        df_locations = FTP_to_DF(
             host=host,
             cwd=cwd,
             ftp_filename=ftp_filename,
             local_file=local_zipfile,
             source_url=ftp_zipfile_path,
         )
-        logging.info("Merging Details and Locations files")
-        df = pd.merge(
-            df_details,
-            df_locations,
-            left_on="EVENT_ID",
-            right_on="EVENT_ID",
-            how="left",
-        )
-        df = rename_headers(df=df, rename_headers_list=rename_headers_list)
-        df["event_latitude"] = df["event_latitude"].apply(
-            lambda x: x - 60 if x > 90 else x
-        )
-        df = generate_location(df, gen_location_list)
-        df = reorder_headers(df, reorder_headers_list=reorder_headers_list)
-        for dt_fld in date_format_list:
-            logging.info(f"Resolving date formats in field {dt_fld}")
-            df[dt_fld[0]] = df[dt_fld[0]].apply(
-                lambda x: pd.to_datetime(str(x), format="%d-%b-%y %H:%M:%S")
-            )
-            df[dt_fld[0]] = df[dt_fld[0]].apply(
-                lambda x: f"{year_to_process}-{str(x)[5:]}"
-            )
-        df = fix_data_anomolies_storms(df)
-        targ_file_yr = str.replace(str(target_file), ".csv", f"_{year_to_process}.csv")
-        save_to_new_file(df=df, file_path=targ_file_yr, sep="|", quotechar="^")
-        sed(["-i", "s/|nan|/||/g", targ_file_yr])
-        sed(["-i", "s/|<NA>/|/g", targ_file_yr])
-        upload_file_to_gcs(
-            file_path=targ_file_yr,
-            target_gcs_bucket=target_gcs_bucket,
-            target_gcs_path=target_gcs_path,
+    else:
+        logging.info("Storms Locations File does not exist!")
+        df_locations = create_storms_locations_df()
+    ftp_filename = details_file[0]
+    local_file = str(source_file).replace(".csv", f"_{str(year_to_process)}_detail.csv")
+    local_zipfile = f"{os.path.dirname(local_file)}/{ftp_filename}"
+    ftp_zipfile_path = f'{source_url["root"]}/{ftp_filename}'
+    logging.info("Processing Storms Detail File ...")
+    logging.info(
+        f"     host={host} cwd={cwd} ftp_filename={ftp_filename} local_file={local_file} local_zipfile={local_zipfile} source_url={ftp_zipfile_path} "
+    )
+    df_details = FTP_to_DF(
+        host=host,
+        cwd=cwd,
+        ftp_filename=ftp_filename,
+        local_file=local_zipfile,
+        source_url=ftp_zipfile_path,
+    )
+    logging.info("Merging Details and Locations files")
+    df = pd.merge(
+        df_details,
+        df_locations,
+        left_on="EVENT_ID",
+        right_on="EVENT_ID",
+        how="left",
+    )
+    df = rename_headers(df=df, rename_headers_list=rename_headers_list)
+    df["event_latitude"] = df["event_latitude"].mask(
+        df["event_latitude"] > 90, df["event_latitude"] - 60
+    )
+    df = generate_location(df, gen_location_list)
+    df = reorder_headers(df, reorder_headers_list=reorder_headers_list)
+    for dt_fld in date_format_list:
+        logging.info(f"Resolving date formats in field {dt_fld}")
+        # The two-digit source years are replaced by the year being processed
+        df[dt_fld[0]] = f"{year_to_process}-" + convert_dt_format_series(
+            df[dt_fld[0]].astype(str),
+            from_format="%d-%b-%y %H:%M:%S",
+            to_format="%m-%d %H:%M:%S",
         )
-        drop_table = drop_dest_table == "Y"
-        table_exists = create_dest_table(
+    df = fix_data_anomolies_storms(df)
+    targ_file_yr = str.replace(str(target_file), ".csv", f"_{year_to_process}.csv")
+    save_to_new_file(df=df, file_path=targ_file_yr, sep="|", quotechar="^")
+    replace_in_file(
+        infile=targ_file_yr,
+        tofile=targ_file_yr,
+        replacements=[(b"|nan|", b"||"), (b"|<NA>", b"|")],
+    )
+    return targ_file_yr
+
+
+def load_storms_year(
+    year_to_process: int,
+    targ_file_yr: str,
+    project_id: str,
+    dataset_id: str,
+    destination_table: str,
+    target_gcs_bucket: str,
+    target_gcs_path: str,
+    schema_path: str,
+    drop_dest_table: str,
+) -> None:
+    upload_file_to_gcs(
+        file_path=targ_file_yr,
+        target_gcs_bucket=target_gcs_bucket,
+        target_gcs_path=target_gcs_path,
+    )
+    drop_table = drop_dest_table == "Y"
+    table_exists = create_dest_table(
+        project_id=project_id,
+        dataset_id=dataset_id,
+        table_id=f"{destination_table}_{str(year_to_process)}",
+        schema_filepath=schema_path,
+        bucket_name=target_gcs_bucket,
+        drop_table=drop_table,
+    )
+    if table_exists:
+        load_data_to_bq(
             project_id=project_id,
             dataset_id=dataset_id,
             table_id=f"{destination_table}_{str(year_to_process)}",
-            schema_filepath=schema_path,
-            bucket_name=target_gcs_bucket,
-            drop_table=drop_table,
+            file_path=targ_file_yr,
+            truncate_table=True,
+            field_delimiter="|",
+            quotechar="^",
         )
-        if table_exists:
-            load_data_to_bq(
-                project_id=project_id,
-                dataset_id=dataset_id,
-                table_id=f"{destination_table}_{str(year_to_process)}",
-                file_path=targ_file_yr,
-                truncate_table=True,
-                field_delimiter="|",
-                quotechar="^",
-            )
 
 
-def clean_source_file(source_file: str) -> None:
+def replace_in_file(
+    infile: str,
+    tofile: str,
+    replacements: typing.List[typing.Tuple[bytes, bytes]],
+) -> None:
+    # Streams the file line by line, applying each literal replacement in turn,
+    # which matches running one global sed substitution per replacement.
+    # A gzipped infile is decompressed in the same pass.
+    work_file = f"{tofile}.tmp" if tofile == infile else tofile
+    open_infile = gzip.open if str(infile).endswith(".gz") else open
+    with open_infile(infile, "rb") as inf, open(work_file, "wb") as outf:
+        for line in inf:
+            for old_value, new_value in replacements:
+                line = line.replace(old_value, new_value)
+            outf.write(line)
+    if work_file != tofile:
+        os.replace(work_file, tofile)
+
+
+def clean_source_file(source_file: str, target_file: str = "") -> None:
     logging.info("Cleaning source file")
-    sed(["-i", 's/,\\"\\"\\"/,\\"\\|\\\'\\|\\\'/g;', source_file])
-    sed(["-i", "s/\\\"\\\" /\\|\\'\\|\\' /g;", source_file])
-    sed(["-i", "s/ \\\"\\\"/ \\|\\'\\|\\'/g;", source_file])
-    sed(["-i", "s/ \\\"/ \\|\\'/g;", source_file])
-    sed(["-i", "s/\\\" /\\|\\' /g;", source_file])
+    # Embedded double quotes are swapped for |' so the python csv engine can
+    # read the details file; FTP_to_DF swaps them back afterwards.
+    replace_in_file(
+        infile=source_file,
+        tofile=target_file or source_file,
+        replacements=[
+            (b',"""', b",\"|'|'"),
+            (b'"" ', b"|'|' "),
+            (b' ""', b" |'|'"),
+            (b' "', b" |'"),
+            (b'" ', b"|' "),
+        ],
+    )
 
 
 def fix_data_anomolies_storms(df: pd.DataFrame) -> pd.DataFrame:
     logging.info("Cleansing data")
     df["damage_property"] = (
-        df["damage_property"]
-        .apply(lambda x: shorthand_to_number(x))
-        .fillna(0)
-        .astype(np.int64)
+        shorthand_to_number_series(df["damage_property"]).fillna(0).astype(np.int64)
     )
     df["damage_crops"] = (
-        df["damage_crops"]
-        .apply(lambda x: shorthand_to_number(x))
-        .fillna(0)
-        .astype(np.int64)
-    )
-    df["event_type"] = df["event_type"].apply(lambda x: str(x).lower())
-    df["state"] = df["state"].apply(
-        lambda x: f"{str.capitalize(x)[0]}{str.lower(x)[1]}"
+        shorthand_to_number_series(df["damage_crops"]).fillna(0).astype(np.int64)
     )
-    df["event_point"] = df["event_point"].apply(
-        lambda x: str(x).replace("POINT(nan nan)", "")
+    df["event_type"] = df["event_type"].astype(str).str.lower()
+    df["state"] = df["state"].str[0].str.upper() + df["state"].str[1].str.lower()
+    df["event_point"] = (
+        df["event_point"].astype(str).str.replace("POINT(nan nan)", "", regex=False)
     )
     return df
 
@@ -841,6 +1002,39 @@ def shorthand_to_number(x) -> float:
     return 0.0
 
 
+def shorthand_to_number_series(values: pd.Series) -> pd.Series:
+    # Vectorized shorthand_to_number: "1.5K" -> 1500.0, a bare "M" -> 1000000,
+    # text without a known suffix -> 0.0 and non-text values pass through.
+    # Damage amounts repeat heavily, so only the distinct values are parsed.
+    if values.dtype != object:
+        return values
+    codes, uniques = pd.factorize(values)
+    uniques = pd.Series(uniques, dtype=object)
+    is_text = uniques.str.len().notna()
+    text = uniques.where(is_text, "")
+    multiplier = pd.Series(0.0, index=uniques.index)
+    digits = text
+    for suffix, power in [("K", 3), ("M", 6), ("B", 9), ("T", 12), ("Q", 15)]:
+        has_suffix = (multiplier == 0) & text.str.contains(suffix, regex=False)
+        multiplier = multiplier.mask(has_suffix, float(10**power))
+        digits = digits.mask(has_suffix, text.str.replace(suffix, "", regex=False))
+    amount = pd.to_numeric(digits.mask(digits == "", "1"), errors="coerce")
+    converted = (amount * multiplier).where(is_text, uniques).to_numpy(dtype=float)
+    # Missing values are coded -1, which picks up the trailing NaN
+    return pd.Series(np.append(converted, np.nan)[codes], index=values.index)
+
+
+def generate_spc_timestamp(df: pd.DataFrame) -> pd.DataFrame:
+    logging.info("Creating Timestamp Column")
+    df["time"] = df["time"].str.zfill(4)
+    df["month"] = df["month"].str.zfill(2)
+    df["day"] = df["day"].str.zfill(2)
+    df["timestamp"] = (
+        df["year"] + "-" + df["month"] + "-" + df["day"] + " " + df["time"] + "00"
+    )
+    return df
+
+
 def generate_location(df: pd.DataFrame, gen_location_list: dict) -> pd.DataFrame:
     logging.info("Generating location data")
     for key, values in gen_location_list.items():
@@ -872,12 +1066,12 @@ def FTP_to_DF(
     )
     logging.info(f"Loading file {local_file} into DataFrame")
     decompressed_source_file = local_file.replace(".gz", "")
-    gz_decompress(
-        infile=local_file,
-        tofile=decompressed_source_file,
-        delete_zipfile=False,
-    )
     if "locations" in decompressed_source_file:
+        gz_decompress(
+            infile=local_file,
+            tofile=decompressed_source_file,
+            delete_zipfile=False,
+        )
         df = pd.read_csv(
             decompressed_source_file,
             engine="python",
@@ -890,7 +1084,8 @@ def FTP_to_DF(
             na_values=[" "],
         )
     else:
-        clean_source_file(decompressed_source_file)
+        # Decompresses and cleans the details file in a single pass
+        clean_source_file(local_file, decompressed_source_file)
         df = pd.read_csv(
             decompressed_source_file,
             engine="python",
@@ -904,7 +1099,7 @@ def FTP_to_DF(
         for col in df:
             if str(df[col].dtype) == "object":
                 logging.info(f"Replacing values in column {col}")
-                df[col] = df[col].apply(lambda x: str(x).replace("|'", '"'))
+                df[col] = df[col].astype(str).str.replace("|'", '"', regex=False)
             else:
                 pass
     return df
@@ -982,6 +1177,7 @@ def process_lightning_strikes_by_year(
     number_of_header_rows: int,
     int_date_list: typing.List[str],
     gen_location_list: dict,
+    reader_engine: str = "csv",
 ) -> None:
     url_path = os.path.split(source_url)[0]
     file_pattern = str.split(os.path.split(source_url)[1], "*")[0]
@@ -1046,6 +1242,7 @@ def process_lightning_strikes_by_year(
                     int_date_list=int_date_list,
                     gen_location_list=gen_location_list,
                     truncate_table=False,
+                    reader_engine=reader_engine,
                 )
 
 
@@ -1078,7 +1275,19 @@ def process_and_load_table(
     gen_location_list: dict,
     truncate_table: bool = True,
     encoding: str = "utf-8",
+    output_shard_size_mb: int = 0,
+    source_lines: typing.Iterable[str] = None,
+    reader_engine: str = "csv",
 ) -> None:
+    shard_writer = None
+    if output_shard_size_mb > 0:
+        shard_writer = ShardedGcsWriter(
+            target_file=target_file,
+            target_gcs_bucket=target_gcs_bucket,
+            target_gcs_path=target_gcs_path,
+            shard_size_bytes=output_shard_size_mb << 20,
+            delete_local_shards=delete_target_file,
+        )
     process_source_file(
         source_url=source_url,
         source_file=source_file,
@@ -1099,6 +1308,9 @@ def process_and_load_table(
         int_date_list=int_date_list,
         gen_location_list=gen_location_list,
         encoding=encoding,
+        shard_writer=shard_writer,
+        source_lines=source_lines,
+        reader_engine=reader_engine,
     )
     post_processing(
         target_file=target_file,
@@ -1112,6 +1324,7 @@ def process_and_load_table(
         drop_dest_table=drop_dest_table,
         delete_target_file=delete_target_file,
         truncate_table=truncate_table,
+        source_uri=(shard_writer.close() if shard_writer else ""),
     )
 
 
@@ -1127,13 +1340,16 @@ def post_processing(
     drop_dest_table: str,
     delete_target_file: bool,
     truncate_table: bool = True,
+    source_uri: str = "",
 ) -> None:
-    if os.path.exists(target_file):
-        upload_file_to_gcs(
-            file_path=target_file,
-            target_gcs_bucket=target_gcs_bucket,
-            target_gcs_path=target_gcs_path,
-        )
+    # A source_uri means the output was already uploaded as shards
+    if source_uri or os.path.exists(target_file):
+        if not source_uri:
+            upload_file_to_gcs(
+                file_path=target_file,
+                target_gcs_bucket=target_gcs_bucket,
+                target_gcs_path=target_gcs_path,
+            )
         if drop_dest_table == "Y":
             drop_table = True
         else:
@@ -1155,11 +1371,12 @@ def post_processing(
                 truncate_table=truncate_table,
                 source_url=source_url,
                 field_delimiter="|",
+                source_uri=source_uri,
             )
         else:
             error_msg = f"Error: Data was not loaded because the destination table {project_id}.{dataset_id}.{destination_table} does not exist and/or could not be created."
             raise ValueError(error_msg)
-        if delete_target_file:
+        if delete_target_file and not source_uri:
             logging.info(f"Removing target file {target_file}")
             os.remove(target_file)
     else:
@@ -1188,17 +1405,54 @@ def process_source_file(
     gen_location_list: dict,
     encoding: str = "utf8",
     remove_source_file: bool = False,
+    shard_writer: "ShardedGcsWriter" = None,
+    source_lines: typing.Iterable[str] = None,
+    reader_engine: str = "csv",
 ) -> None:
     logging.info(f"Opening source file {source_file}")
+    if reader_engine == "columnar" and source_lines is None:
+        for chunk_number, df in enumerate(
+            read_source_chunks_columnar(
+                source_file=source_file,
+                input_csv_headers=input_csv_headers,
+                input_field_delimiter=input_field_delimiter,
+                chunksize=int(chunksize),
+                encoding=encoding,
+            ),
+            1,
+        ):
+            process_dataframe_chunk(
+                data=df,
+                pipeline_name=pipeline_name,
+                input_csv_headers=input_csv_headers,
+                data_dtypes=data_dtypes,
+                source_url=source_url,
+                target_file=target_file,
+                chunk_number=chunk_number,
+                reorder_headers_list=reorder_headers_list,
+                date_format_list=date_format_list,
+                null_rows_list=null_rows_list,
+                slice_column_list=slice_column_list,
+                regex_list=regex_list,
+                trim_whitespace_list=trim_whitespace_list,
+                rename_headers_list=rename_headers_list,
+                int_date_list=int_date_list,
+                gen_location_list=gen_location_list,
+                shard_writer=shard_writer,
+            )
+        if remove_source_file:
+            os.remove(source_file)
+        return
     csv.field_size_limit(sys.maxsize)
     csv.register_dialect(
         "TabDialect", quotechar='"', delimiter=input_field_delimiter, strict=True
     )
-    with open(
-        source_file,
-        encoding=encoding,
-        mode="r",
-    ) as reader:
+    if source_lines is not None:
+        logging.info("Reading source lines from stream")
+        source = contextlib.nullcontext(source_lines)
+    else:
+        source = open_source_file(source_file, encoding=encoding)
+    with source as reader:
         data = []
         chunk_number = 1
         for index, line in enumerate(
@@ -1223,6 +1477,7 @@ def process_source_file(
                     rename_headers_list=rename_headers_list,
                     int_date_list=int_date_list,
                     gen_location_list=gen_location_list,
+                    shard_writer=shard_writer,
                 )
                 data = []
                 chunk_number += 1
@@ -1245,13 +1500,98 @@ def process_source_file(
                 rename_headers_list=rename_headers_list,
                 int_date_list=int_date_list,
                 gen_location_list=gen_location_list,
+                shard_writer=shard_writer,
             )
-        if remove_source_file:
+        if remove_source_file and source_lines is None:
             os.remove(source_file)
 
 
+def open_source_file(source_file: str, encoding: str = "utf8") -> typing.TextIO:
+    if str(source_file).endswith(".gz"):
+        return gzip.open(source_file, mode="rt", encoding=encoding)
+    return open(source_file, encoding=encoding, mode="r")
+
+
+class NulFilterReader(io.RawIOBase):
+    """Binary stream wrapper which drops NUL bytes before the CSV parser sees them."""
+
+    def __init__(self, raw: typing.BinaryIO) -> None:
+        self.raw = raw
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: bytearray) -> int:
+        while True:
+            data = self.raw.read(len(buffer))
+            if not data:
+                return 0
+            data = data.replace(b"\0", b"")
+            if data:
+                buffer[: len(data)] = data
+                return len(data)
+
+    def close(self) -> None:
+        self.raw.close()
+        super().close()
+
+
+def read_source_chunks_columnar(
+    source_file: str,
+    input_csv_headers: typing.List[str],
+    input_field_delimiter: str,
+    chunksize: int,
+    encoding: str = "utf8",
+) -> typing.Iterator[pd.DataFrame]:
+    # Parses the source with the pandas C engine. Every field is read as a string
+    # and empty fields stay "", matching what the csv.reader path builds.
+    if str(source_file).endswith(".gz"):
+        raw = gzip.open(source_file, mode="rb")
+    else:
+        raw = open(source_file, mode="rb")
+    with io.BufferedReader(NulFilterReader(raw), buffer_size=1 << 20) as reader:
+        with pd.read_csv(
+            reader,
+            engine="c",
+            sep=input_field_delimiter,
+            quotechar='"',
+            header=None,
+            names=input_csv_headers,
+            dtype=str,
+            na_filter=False,
+            encoding=encoding,
+            chunksize=chunksize,
+        ) as chunks:
+            yield from chunks
+
+
+def concatenated_lines(
+    contents: typing.Iterable[typing.Tuple[str, typing.Optional[bytes]]],
+    number_of_header_rows: int = 0,
+    encoding: str = "utf-8",
+) -> typing.Iterator[str]:
+    # Yields the lines of the given (url, content) files as one stream, where only
+    # the first file keeps its header row. The first number_of_header_rows lines
+    # of the combined stream are skipped, as remove_header_rows would do.
+    first_file = True
+    skip_rows = number_of_header_rows
+    for source_url, content in contents:
+        if content is None:
+            logging.info(f"Skipping {source_url}, which could not be downloaded")
+            continue
+        lines = io.TextIOWrapper(io.BytesIO(content), encoding=encoding)
+        if not first_file:
+            next(lines, None)
+        first_file = False
+        for line in lines:
+            if skip_rows:
+                skip_rows -= 1
+                continue
+            yield line if line.endswith("\n") else line + "\n"
+
+
 def process_dataframe_chunk(
-    data: typing.List[str],
+    data: typing.Union[typing.List[str], pd.DataFrame],
     pipeline_name: str,
     input_csv_headers: typing.List[str],
     data_dtypes: dict,
@@ -1267,9 +1607,13 @@ def process_dataframe_chunk(
     rename_headers_list: dict,
     int_date_list: typing.List[str],
     gen_location_list: dict,
+    shard_writer: "ShardedGcsWriter" = None,
 ) -> None:
     logging.info(f"Processing chunk #{chunk_number}")
-    df = pd.DataFrame(data, columns=input_csv_headers)
+    if isinstance(data, pd.DataFrame):
+        df = data
+    else:
+        df = pd.DataFrame(data, columns=input_csv_headers)
     set_df_datatypes(df, data_dtypes)
     target_file_batch = str(target_file).replace(
         ".csv", "-" + str(chunk_number) + ".csv"
@@ -1290,6 +1634,7 @@ def process_dataframe_chunk(
         rename_headers_list=rename_headers_list,
         int_date_list=int_date_list,
         gen_location_list=gen_location_list,
+        shard_writer=shard_writer,
     )
 
 
@@ -1316,46 +1661,18 @@ def process_chunk(
     rename_headers_list: dict,
     int_date_list: typing.List[str],
     gen_location_list: dict,
+    shard_writer: "ShardedGcsWriter" = None,
 ) -> None:
     if pipeline_name == "GHCND by year":
         df = filter_null_rows(df, null_rows_list=null_rows_list)
         df = add_metadata_cols(df, source_url=source_url)
         df = source_convert_date_formats(df, date_format_list=date_format_list)
         df = reorder_headers(df, reorder_headers_list=reorder_headers_list)
-    if pipeline_name == "NOAA SPC Hail":
-        df = rename_headers(df, rename_headers_list=rename_headers_list)
-        df["time"] = df["time"].apply(lambda x: str.zfill(x, 4))
-        df["month"] = df["month"].apply(lambda x: str.zfill(x, 2))
-        df["day"] = df["day"].apply(lambda x: str.zfill(x, 2))
-        logging.info("Creating Timestamp Column")
-        df["timestamp"] = df.apply(
-            lambda x: f"{x.year}-{x.month}-{x.day} {x.time}00", axis=1
-        )
-        df = source_convert_date_formats(df, date_format_list=date_format_list)
-        df = generate_location(df, gen_location_list=gen_location_list)
-        df = reorder_headers(df, reorder_headers_list=reorder_headers_list)
-    if pipeline_name == "NOAA SPC Wind":
-        df = rename_headers(df, rename_headers_list=rename_headers_list)
-        df["speed"] = df["speed"].apply(lambda x: re.sub(r"^UNK$", "", x))
-        df["time"] = df["time"].apply(lambda x: str.zfill(x, 4))
-        df["month"] = df["month"].apply(lambda x: str.zfill(x, 2))
-        df["day"] = df["day"].apply(lambda x: str.zfill(x, 2))
-        logging.info("Creating Timestamp Column")
-        df["timestamp"] = df.apply(
-            lambda x: f"{x.year}-{x.month}-{x.day} {x.time}00", axis=1
-        )
-        df = source_convert_date_formats(df, date_format_list=date_format_list)
-        df = generate_location(df, gen_location_list=gen_location_list)
-        df = reorder_headers(df, reorder_headers_list=reorder_headers_list)
-    if pipeline_name == "NOAA SPC Tornado":
+    if pipeline_name in ["NOAA SPC Hail", "NOAA SPC Wind", "NOAA SPC Tornado"]:
         df = rename_headers(df, rename_headers_list=rename_headers_list)
-        df["time"] = df["time"].apply(lambda x: str.zfill(x, 4))
-        df["month"] = df["month"].apply(lambda x: str.zfill(x, 2))
-        df["day"] = df["day"].apply(lambda x: str.zfill(x, 2))
-        logging.info("Creating Timestamp Column")
-        df["timestamp"] = df.apply(
-            lambda x: f"{x.year}-{x.month}-{x.day} {x.time}00", axis=1
-        )
+        if pipeline_name == "NOAA SPC Wind":
+            df["speed"] = df["speed"].replace("UNK", "")
+        df = generate_spc_timestamp(df)
         df = source_convert_date_formats(df, date_format_list=date_format_list)
         df = generate_location(df, gen_location_list=gen_location_list)
         df = reorder_headers(df, reorder_headers_list=reorder_headers_list)
@@ -1372,19 +1689,7 @@ def process_chunk(
         df = rename_headers(df, rename_headers_list=rename_headers_list)
         df = reorder_headers(df, reorder_headers_list=reorder_headers_list)
     if pipeline_name in ["NOAA GSOD 2020", "NOAA GSOD 2022"]:
-        df["stn"] = df["STATION"].apply(lambda x: "" if x == "" else x[0:6])
-        df["wban"] = df["STATION"].apply(lambda x: "" if x == "" else x[6:11])
-        df["year"] = df["DATE"].apply(lambda x: "" if x == "" else x[0:4])
-        df["mo"] = df["DATE"].apply(lambda x: "" if x == "" else x[5:7])
-        df["da"] = df["DATE"].apply(lambda x: "" if x == "" else x[8:10])
-        df["fog"] = df["FRSHTT"].apply(lambda x: "" if x == "" else x[0:1])
-        df["rain_drizzle"] = df["FRSHTT"].apply(lambda x: "" if x == "" else x[1:2])
-        df["snow_ice_pellets"] = df["FRSHTT"].apply(lambda x: "" if x == "" else x[2:3])
-        df["hail"] = df["FRSHTT"].apply(lambda x: "" if x == "" else x[3:4])
-        df["thunder"] = df["FRSHTT"].apply(lambda x: "" if x == "" else x[4:5])
-        df["tornado_funnel_cloud"] = df["FRSHTT"].apply(
-            lambda x: "" if x == "" else x[5:6]
-        )
+        df = slice_column(df, slice_column_list)
         df = rename_headers(df, rename_headers_list=rename_headers_list)
         df = trim_whitespace(df, trim_whitespace_list=trim_whitespace_list)
         df = reorder_headers(df, reorder_headers_list=reorder_headers_list)
@@ -1419,8 +1724,15 @@ def process_chunk(
         df = generate_location(df, gen_location_list=gen_location_list)
         df = add_metadata_cols(df, source_url=source_url)
         df = reorder_headers(df, reorder_headers_list=reorder_headers_list)
-    save_to_new_file(df, file_path=str(target_file_batch))
-    append_batch_file(target_file_batch, target_file, skip_header, not (skip_header))
+    if shard_writer:
+        shard_writer.write(df)
+    else:
+        append_batch_to_target_file(
+            df,
+            target_file,
+            include_header=not skip_header,
+            truncate_file=not skip_header,
+        )
 
 
 def trim_whitespace(
@@ -1496,11 +1808,12 @@ def reorder_headers(
     return df[reorder_headers_list]
 
 
-def gz_decompress(infile: str, tofile: str, delete_zipfile: bool = False) -> None:
+def gz_decompress(
+    infile: str, tofile: str, delete_zipfile: bool = False, block_size: int = 1 << 20
+) -> None:
     logging.info(f"Decompressing {infile}")
-    with open(infile, "rb") as inf, open(tofile, "w", encoding="utf8") as tof:
-        decom_str = gzip.decompress(inf.read()).decode("utf-8")
-        tof.write(decom_str)
+    with gzip.open(infile, "rb") as inf, open(tofile, "wb") as tof:
+        shutil.copyfileobj(inf, tof, block_size)
     if delete_zipfile:
         os.remove(infile)
 
@@ -1514,13 +1827,43 @@ def filter_null_rows(
     return df
 
 
-def convert_dt_format(
-    dt_str: str, from_format: str = "%Y%m%d", to_format: str = "%Y-%m-%d"
-) -> str:
-    if not dt_str or dt_str.lower() == "nan":
-        return dt_str
-    else:
-        return str(datetime.datetime.strptime(dt_str, from_format).strftime(to_format))
+def convert_dt_format_series(
+    values: pd.Series,
+    from_format: str,
+    to_format: str,
+    fallback: typing.Callable[[str], str] = None,
+) -> pd.Series:
+    # Reformats one (column, from_format, to_format) spec. Dates repeat heavily,
+    # so only the distinct values are parsed. Values which do not match
+    # from_format go through fallback when one is given, otherwise become NaN.
+    codes, uniques = pd.factorize(values)
+    uniques = pd.Series(uniques, dtype=object)
+    parsed = pd.to_datetime(uniques, format=from_format, errors="coerce")
+    converted = format_dt_series(parsed, to_format)
+    if fallback:
+        # Sub-second values keep their fraction, so leave those to fallback too
+        converted = converted.where(parsed == parsed.dt.floor("s"))
+        unmatched = converted.isna()
+        converted[unmatched] = uniques[unmatched].apply(fallback)
+    # Missing values are coded -1, which picks up the trailing NaN
+    return pd.Series(
+        np.append(converted.to_numpy(dtype=object), np.nan)[codes], index=values.index
+    )
+
+
+def format_dt_series(parsed: pd.Series, to_format: str) -> pd.Series:
+    unit = {"%Y-%m-%d": "D", "%Y-%m-%d %H:%M:%S": "s"}.get(to_format)
+    if not unit:
+        return parsed.dt.strftime(to_format)
+    # NumPy renders these two layouts well over twice as fast as strftime
+    iso_text = np.datetime_as_string(
+        parsed.to_numpy().astype(f"datetime64[{unit}]"), unit=unit
+    )
+    return (
+        pd.Series(iso_text, index=parsed.index, dtype=object)
+        .str.replace("T", " ", regex=False)
+        .where(parsed.notna())
+    )
 
 
 def source_convert_date_formats(
@@ -1529,11 +1872,16 @@ def source_convert_date_formats(
 ) -> pd.DataFrame:
     logging.info("Converting Date Format..")
     for fld, from_format, to_format in date_format_list:
-        df[fld] = df[fld].apply(
-            lambda x, from_format, to_format: convert_dt_format(
-                x, from_format, to_format
-            ),
-            args=(from_format, to_format),
+        # Blank and "nan" values are passed through untouched
+        keep_values = (df[fld].fillna("") == "") | (
+            df[fld].astype(str).str.lower() == "nan"
+        )
+        df[fld] = (
+            convert_dt_format_series(
+                df[fld].where(~keep_values), from_format, to_format
+            )
+            .where(~keep_values, df[fld])
+            .fillna("")
         )
     return df
 
@@ -1541,38 +1889,32 @@ def source_convert_date_formats(
 def slice_column(
     df: pd.DataFrame, slice_column_list: dict, pipeline_name: str = ""
 ) -> pd.DataFrame:
+    # slice_column_list maps each destination column to
+    # [source column, start position, end position (blank = to end of value)]
+    # with an optional fourth "N" entry to keep surrounding whitespace.
     logging.info("Extracting column data..")
-    for key, values in slice_column_list.items():
-        src_col = values[0]
-        dest_col = key
-        start_pos = values[1]
-        end_pos = values[2]
-        if pipeline_name == "GHCND states":
-            if dest_col == "name":
+    slices_by_source = {}
+    for dest_col, values in slice_column_list.items():
+        slices_by_source.setdefault(values[0], []).append((dest_col, values))
+    for src_col, slices in slices_by_source.items():
+        # Slice each distinct source value once and broadcast the results
+        # back to the rows; station ids, dates and flags repeat heavily.
+        codes, uniques = pd.factorize(df[src_col], use_na_sentinel=False)
+        src_values = pd.Series(uniques, dtype=object).astype(str)
+        for dest_col, values in slices:
+            start_pos = int(values[1])
+            end_pos = int(values[2]) if values[2] != "" else None
+            dest_values = src_values.str.slice(start_pos, end_pos)
+            if len(values) < 4 or values[3] != "N":
+                dest_values = dest_values.str.strip()
+            if pipeline_name == "GHCND states" and dest_col == "name":
                 # Work-around for Alabama - bad data
-                df[dest_col] = df[src_col].apply(
-                    lambda x: "ALABAMA"
-                    if str(x)[0:2] == "AL"
-                    else str(x)[int(start_pos) :].strip()
-                )
-            else:
-                if end_pos == "":
-                    df[dest_col] = df[src_col].apply(
-                        lambda x: str(x)[int(start_pos) :].strip()
-                    )
-                else:
-                    df[dest_col] = df[src_col].apply(
-                        lambda x: str(x)[int(start_pos) : int(end_pos)].strip()
-                    )
-        else:
-            if end_pos == "":
-                df[dest_col] = df[src_col].apply(
-                    lambda x: str(x)[int(start_pos) :].strip()
-                )
-            else:
-                df[dest_col] = df[src_col].apply(
-                    lambda x: str(x)[int(start_pos) : int(end_pos)].strip()
+                dest_values = dest_values.where(
+                    src_values.str.slice(0, 2) != "AL", "ALABAMA"
                 )
+            df[dest_col] = pd.Series(
+                dest_values.to_numpy()[codes], index=df.index, dtype=object
+            )
     return df
 
 
@@ -1598,6 +1940,137 @@ def apply_regex(df: pd.DataFrame, regex_list: dict) -> pd.DataFrame:
     return df
 
 
+class GoogleCloudClients:
+    """Builds BigQuery and Cloud Storage clients on first use and shares them
+    across every helper in the process. All clients ride on one authorized
+    HTTP session with a pool of `pool_size` connections. Client constructions
+    and API round-trips are counted for the end-of-run summary.
+
+    Every image talking to BigQuery or Cloud Storage carries a copy of this
+    block. Edit the new_york_taxi_trips copy and run
+    scripts/sync_shared_helpers.py."""
+
+    def __init__(self, pool_size: int = 10) -> None:
+        self.lock = threading.Lock()
+        self.counts = collections.Counter()
+        self.pool_size = pool_size
+        self.reset()
+
+    def reset(self) -> None:
+        self.pid = os.getpid()
+        self.credentials = None
+        self.default_project = None
+        self.session = None
+        self.clients = {}
+
+    def configure(self, pool_size: int) -> None:
+        with self.lock:
+            self.pool_size = max(pool_size, 1)
+            self.reset()
+
+    def authorized_session(self) -> AuthorizedSession:
+        if self.pid != os.getpid():
+            # A forked worker process builds its own session and clients
+            self.reset()
+        if self.session is None:
+            self.credentials, self.default_project = google.auth.default(
+                scopes=["https://www.googleapis.com/auth/cloud-platform"]
+            )
+            self.counts["credential_lookups"] += 1
+            self.session = AuthorizedSession(self.credentials)
+            self.session.mount(
+                "https://",
+                requests.adapters.HTTPAdapter(
+                    pool_connections=self.pool_size, pool_maxsize=self.pool_size
+                ),
+            )
+            self.session.hooks["response"].append(self.count_round_trip)
+        return self.session
+
+    def count_round_trip(self, response: requests.Response, *args, **kwargs) -> None:
+        with self.lock:
+            self.counts["api_round_trips"] += 1
+
+    def client(
+        self, label: str, client_class: typing.Type, project: str = None
+    ) -> typing.Union[bigquery.Client, storage.Client]:
+        with self.lock:
+            session = self.authorized_session()
+            project = project or self.default_project
+            if (label, project) not in self.clients:
+                client_args = {"credentials": self.credentials, "_http": session}
+                if project:
+                    client_args["project"] = project
+                self.clients[(label, project)] = client_class(**client_args)
+                self.counts[f"{label}_clients"] += 1
+            return self.clients[(label, project)]
+
+    def bigquery(self, project: str = None) -> bigquery.Client:
+        return self.client("bigquery", bigquery.Client, project)
+
+    def storage(self, project: str = None) -> storage.Client:
+        return self.client("storage", storage.Client, project)
+
+    def summary(self) -> None:
+        logging.info(
+            f"Google Cloud clients built: {self.counts['bigquery_clients']} BigQuery, "
+            f"{self.counts['storage_clients']} Cloud Storage; "
+            f"credential lookups: {self.counts['credential_lookups']}; "
+            f"API round-trips: {self.counts['api_round_trips']}"
+        )
+
+
+gcp_clients = GoogleCloudClients()
+
+
+class SchemaCache:
+    """Fetches each table schema file from GCS once per pod. A missing file is
+    returned as None, so the fetch doubles as the existence check. With a
+    `cache_dir`, schema files are also kept on local disk keyed by bucket,
+    path and object generation."""
+
+    def __init__(self, cache_dir: str = "") -> None:
+        self.lock = threading.Lock()
+        self.configure(cache_dir)
+
+    def configure(self, cache_dir: str) -> None:
+        self.cache_dir = cache_dir
+        self.schemas = {}
+
+    def get(self, bucket_name: str, schema_filepath: str) -> typing.Optional[list]:
+        with self.lock:
+            if (bucket_name, schema_filepath) not in self.schemas:
+                self.schemas[(bucket_name, schema_filepath)] = self.fetch(
+                    bucket_name, schema_filepath
+                )
+            return self.schemas[(bucket_name, schema_filepath)]
+
+    def fetch(self, bucket_name: str, schema_filepath: str) -> typing.Optional[list]:
+        blob = gcp_clients.storage().bucket(bucket_name).get_blob(schema_filepath)
+        if blob is None:
+            return None
+        cache_file = ""
+        if self.cache_dir:
+            cache_file = os.path.join(
+                self.cache_dir, bucket_name, f"{schema_filepath}.{blob.generation}"
+            )
+            if os.path.exists(cache_file):
+                logging.info(f"Using cached schema file {cache_file}")
+                with open(cache_file, "rb") as schema_file:
+                    return json.loads(schema_file.read())
+        logging.info(f"Fetching schema file gs://{bucket_name}/{schema_filepath}")
+        schema_bytes = blob.download_as_bytes(if_generation_match=blob.generation)
+        if cache_file:
+            pathlib.Path(cache_file).parent.mkdir(parents=True, exist_ok=True)
+            with open(f"{cache_file}.tmp", "wb") as schema_file:
+                schema_file.write(schema_bytes)
+            os.replace(f"{cache_file}.tmp", cache_file)
+        return json.loads(schema_bytes)
+
+
+schema_cache = SchemaCache()
+
+
 def load_data_to_bq(
     project_id: str,
     dataset_id: str,
@@ -1607,11 +2080,14 @@ def load_data_to_bq(
     source_url: str = "",
     field_delimiter: str = "|",
     quotechar: str = '"',
+    source_uri: str = "",
 ) -> None:
+    if source_uri:
+        file_path = source_uri
     logging.info(
         f"Loading data from {file_path} into {project_id}.{dataset_id}.{table_id} started"
     )
-    client = bigquery.Client(project=project_id)
+    client = gcp_clients.bigquery(project_id)
     table_ref = client.dataset(dataset_id).table(table_id)
     job_config = bigquery.LoadJobConfig()
     job_config.source_format = bigquery.SourceFormat.CSV
@@ -1633,8 +2109,13 @@ def load_data_to_bq(
     job_config.autodetect = False
     job_config.allow_quoted_newlines = True
     job_config.quote_character = quotechar
-    with open(file_path, "rb") as source_file:
-        job = client.load_table_from_file(source_file, table_ref, job_config=job_config)
+    if source_uri:
+        job = client.load_table_from_uri(source_uri, table_ref, job_config=job_config)
+    else:
+        with open(file_path, "rb") as source_file:
+            job = client.load_table_from_file(
+                source_file, table_ref, job_config=job_config
+            )
     job.result()
     logging.info(
         f"Loading data from {file_path} into {project_id}.{dataset_id}.{table_id} completed"
@@ -1651,7 +2132,7 @@ def create_dest_table(
 ) -> bool:
     table_ref = f"{project_id}.{dataset_id}.{table_id}"
     logging.info(f"Attempting to create table {table_ref} if it doesn't already exist")
-    client = bigquery.Client()
+    client = gcp_clients.bigquery()
     table_exists = False
     try:
         table = client.get_table(table_ref)
@@ -1669,8 +2150,10 @@ def create_dest_table(
                 f"Table {table_ref} currently does not exist.  Attempting to create table."
             )
         )
-        if check_gcs_file_exists(schema_filepath, bucket_name):
-            schema = create_table_schema([], bucket_name, schema_filepath)
+        # The cached fetch doubles as the schema file existence check
+        schema_struct = schema_cache.get(bucket_name, schema_filepath)
+        if schema_struct is not None:
+            schema = create_table_schema(schema_struct)
             table = bigquery.Table(table_ref, schema=schema)
             client.create_table(table)
             print(f"Table {table_ref} was created".format(table_id))
@@ -1687,20 +2170,13 @@ def create_dest_table(
     return table_exists
 
 
-def check_gcs_file_exists(file_path: str, bucket_name: str) -> bool:
-    storage_client = storage.Client()
-    bucket = storage_client.bucket(bucket_name)
-    exists = storage.Blob(bucket=bucket, name=file_path).exists(storage_client)
-    return exists
-
-
 def delete_source_file_data_from_bq(
     project_id: str, dataset_id: str, table_id: str, source_url: str
 ) -> None:
     logging.info(
         f"Deleting data from {project_id}.{dataset_id}.{table_id} where source_url = '{source_url}'"
     )
-    client = bigquery.Client()
+    client = gcp_clients.bigquery()
     query = f"""
         DELETE
         FROM {project_id}.{dataset_id}.{table_id}
@@ -1726,10 +2202,9 @@ def create_table_schema(
     if not (schema_filepath):
         schema_struct = schema_structure
     else:
-        storage_client = storage.Client()
-        bucket = storage_client.get_bucket(bucket_name)
-        blob = bucket.blob(schema_filepath)
-        schema_struct = json.loads(blob.download_as_bytes(client=None))
+        schema_struct = schema_cache.get(bucket_name, schema_filepath)
+        if schema_struct is None:
+            raise NotFound(f"Schema file gs://{bucket_name}/{schema_filepath}")
     for schema_field in schema_struct:
         fld_name = schema_field["name"]
         fld_type = schema_field["type"]
@@ -1753,25 +2228,315 @@ def save_to_new_file(
     df.to_csv(file_path, index=False, sep=sep, quotechar=quotechar)
 
 
-def append_batch_file(
-    batch_file_path: str, target_file_path: str, skip_header: bool, truncate_file: bool
+def append_batch_to_target_file(
+    df: pd.DataFrame,
+    target_file_path: str,
+    include_header: bool,
+    truncate_file: bool,
+    sep: str = "|",
 ) -> None:
-    with open(batch_file_path, "r") as data_file:
-        if truncate_file:
-            target_file = open(target_file_path, "w+").close()
-        with open(target_file_path, "a+") as target_file:
-            if skip_header:
+    logging.info(
+        f"Appending batch to {target_file_path} with include_header={include_header} and truncate_file={truncate_file}"
+    )
+    # Each chunk goes straight into the target file rather than via a batch file
+    df.to_csv(
+        target_file_path,
+        sep=sep,
+        index=False,
+        header=include_header,
+        mode=("w" if truncate_file else "a"),
+    )
+
+
+class ShardedGcsWriter:
+    """Writes processed chunks into size-bounded CSV shards, each with its own
+    header, and uploads every completed shard to GCS in the background while
+    later chunks are still being transformed."""
+
+    def __init__(
+        self,
+        target_file: str,
+        target_gcs_bucket: str,
+        target_gcs_path: str,
+        shard_size_bytes: int,
+        delete_local_shards: bool = True,
+        max_upload_workers: int = 4,
+    ) -> None:
+        self.target_file = str(target_file)
+        self.target_gcs_bucket = target_gcs_bucket
+        self.target_gcs_path = target_gcs_path
+        self.shard_size_bytes = shard_size_bytes
+        self.delete_local_shards = delete_local_shards
+        self.shard_count = 0
+        self.shard_file = ""
+        self.uploads = []
+        self.executor = ThreadPoolExecutor(max_workers=max_upload_workers)
+        # Shards left over from an earlier, larger run would match the wildcard
+        storage_client = gcp_clients.storage()
+        for blob in storage_client.list_blobs(
+            target_gcs_bucket, prefix=self.shard_name(target_gcs_path, "")
+        ):
+            if re.search(r"-\d{5}\.csv$", blob.name):
                 logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path} with skip header"
+                    f"Removing stale shard gs://{target_gcs_bucket}/{blob.name}"
                 )
-                next(data_file)
-            else:
+                blob.delete()
+
+    @staticmethod
+    def shard_name(path: str, shard_id: str) -> str:
+        return str.replace(str(path), ".csv", f"-{shard_id}", 1)
+
+    def write(self, df: pd.DataFrame, sep: str = "|") -> None:
+        new_shard = not self.shard_file
+        if new_shard:
+            self.shard_file = self.shard_name(
+                self.target_file, f"{self.shard_count:05d}.csv"
+            )
+        df.to_csv(
+            self.shard_file,
+            sep=sep,
+            index=False,
+            header=new_shard,
+            mode=("w" if new_shard else "a"),
+        )
+        if os.path.getsize(self.shard_file) >= self.shard_size_bytes:
+            self.complete_shard()
+
+    def complete_shard(self) -> None:
+        gcs_path = self.shard_name(self.target_gcs_path, f"{self.shard_count:05d}.csv")
+        logging.info(f"Queueing upload of shard {self.shard_file}")
+        self.uploads.append(
+            self.executor.submit(self.upload_shard, self.shard_file, gcs_path)
+        )
+        self.shard_count += 1
+        self.shard_file = ""
+
+    def upload_shard(self, shard_file: str, gcs_path: str) -> None:
+        upload_file_to_gcs(
+            file_path=shard_file,
+            target_gcs_bucket=self.target_gcs_bucket,
+            target_gcs_path=gcs_path,
+        )
+        if self.delete_local_shards:
+            os.remove(shard_file)
+
+    def close(self) -> str:
+        if self.shard_file:
+            self.complete_shard()
+        try:
+            for upload in self.uploads:
+                upload.result()
+        finally:
+            self.executor.shutdown()
+        if not self.shard_count:
+            return ""
+        # One wildcard URI lets a single load job pick up every shard
+        return f"gs://{self.target_gcs_bucket}/{self.shard_name(self.target_gcs_path, '*.csv')}"
+
+
+class TokenBucket:
+    """Hands out `rate` tokens per second on average, allowing bursts of up to
+    `capacity`. A rate of 0 disables the limit."""
+
+    def __init__(self, rate: float, capacity: int = 1) -> None:
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if not self.rate:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class DownloadMetrics:
+    """Thread-safe per-file download counters, logged as progress and summary."""
+
+    def __init__(self, label: str, total_files: int = 0) -> None:
+        self.label = label
+        self.total_files = total_files
+        self.files = 0
+        self.failures = 0
+        self.retries = 0
+        self.bytes = 0
+        self.started = time.monotonic()
+        self.lock = threading.Lock()
+
+    def record(
+        self, source_url: str, nbytes: int, attempts: int, seconds: float, ok: bool
+    ) -> None:
+        with self.lock:
+            self.files += 1
+            self.failures += 0 if ok else 1
+            self.retries += attempts - 1
+            self.bytes += nbytes
+            files = self.files
+        logging.debug(
+            f"{source_url}: {'ok' if ok else 'failed'}, {nbytes} bytes, {attempts} attempt(s), {seconds:.2f}s"
+        )
+        progress_step = max(self.total_files // 20, 1)
+        if attempts > 1 or not ok or files % progress_step == 0:
+            logging.info(
+                f"{self.label}: downloaded {files} of {self.total_files} files ({source_url} took {attempts} attempt(s))"
+            )
+
+    def summary(self) -> None:
+        seconds = time.monotonic() - self.started
+        logging.info(
+            f"{self.label}: {self.files} files, {self.bytes / (1 << 20):.1f} MB in {seconds:.1f}s, {self.retries} retries, {self.failures} failures"
+        )
+
+
+class FtpSessionPool:
+    """A fixed number of logged-in FTP sessions, reused across downloads."""
+
+    def __init__(self, ftp_host: str, ftp_dir: str, size: int = 1) -> None:
+        self.ftp_host = ftp_host
+        self.ftp_dir = ftp_dir
+        self.sessions = queue.LifoQueue()
+        for _ in range(max(size, 1)):
+            self.sessions.put(None)
+
+    @contextlib.contextmanager
+    def session(self) -> typing.Iterator[ftplib.FTP]:
+        ftp_conn = self.sessions.get()
+        try:
+            if ftp_conn is None:
+                ftp_conn = ftplib.FTP(self.ftp_host, timeout=60)
+                ftp_conn.login("", "")
+                ftp_conn.cwd(self.ftp_dir)
+                ftp_conn.encoding = "utf-8"
+            yield ftp_conn
+        except Exception:
+            # A failed session is dropped and reopened on next use
+            if ftp_conn is not None:
+                ftp_conn.close()
+            ftp_conn = None
+            raise
+        finally:
+            self.sessions.put(ftp_conn)
+
+    def close(self) -> None:
+        while not self.sessions.empty():
+            ftp_conn = self.sessions.get()
+            if ftp_conn is not None:
+                try:
+                    ftp_conn.quit()
+                except ftplib.all_errors:
+                    ftp_conn.close()
+
+
+def prefetch_in_order(
+    items: typing.List[typing.Any],
+    fetch: typing.Callable[[typing.Any], typing.Any],
+    max_workers: int,
+    window: int,
+) -> typing.Iterator[typing.Tuple[typing.Any, typing.Any]]:
+    # Yields (item, fetch(item)) in input order, keeping at most `window` fetches
+    # running or finished ahead of the consumer
+    with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+        pending = collections.deque()
+        for item in items:
+            pending.append((item, executor.submit(fetch, item)))
+            if len(pending) > max(window, 1):
+                item, future = pending.popleft()
+                yield item, future.result()
+        while pending:
+            item, future = pending.popleft()
+            yield item, future.result()
+
+
+def download_file_ftp_pooled(
+    ftp_pool: FtpSessionPool,
+    ftp_filename: str,
+    local_file: str,
+    source_url: str,
+    rate_limiter: TokenBucket,
+    metrics: DownloadMetrics,
+    max_attempts: int = 4,
+) -> None:
+    logging.info(f"Downloading {source_url} into {local_file}")
+    started = time.monotonic()
+    for attempt in range(1, max_attempts + 1):
+        rate_limiter.acquire()
+        try:
+            with ftp_pool.session() as ftp_conn, open(local_file, "wb") as dest_file:
+                ftp_conn.retrbinary(f"RETR {ftp_filename}", dest_file.write)
+        except ftplib.all_errors as e:
+            if attempt == max_attempts:
+                metrics.record(
+                    source_url, 0, attempt, time.monotonic() - started, False
+                )
+                raise
+            logging.info(f"{e}, Retrying {source_url} in {attempt * 30} seconds")
+            time.sleep(attempt * 30)
+        else:
+            metrics.record(
+                source_url,
+                os.path.getsize(local_file),
+                attempt,
+                time.monotonic() - started,
+                True,
+            )
+            return
+
+
+def http_session(pool_size: int = 1) -> requests.Session:
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def fetch_url_content(
+    session: requests.Session,
+    source_url: str,
+    rate_limiter: TokenBucket,
+    metrics: DownloadMetrics,
+    max_attempts: int = 5,
+) -> typing.Optional[bytes]:
+    started = time.monotonic()
+    for attempt in range(1, max_attempts + 1):
+        rate_limiter.acquire()
+        try:
+            response = session.get(source_url, timeout=60)
+            if 400 <= response.status_code <= 499:
                 logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path}"
+                    f"Unable to download file {source_url} (error code was {response.status_code})"
                 )
-            target_file.write(data_file.read())
-            if os.path.exists(batch_file_path):
-                os.remove(batch_file_path)
+                break
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            logging.info(f"{e}. Attempt {attempt} of {max_attempts} for {source_url}")
+            if attempt < max_attempts:
+                time.sleep(3 * attempt)
+        else:
+            metrics.record(
+                source_url,
+                len(response.content),
+                attempt,
+                time.monotonic() - started,
+                True,
+            )
+            return response.content
+    metrics.record(source_url, 0, attempt, time.monotonic() - started, False)
+    return None
 
 
 def download_file_ftp(
@@ -1881,7 +2646,7 @@ def upload_file_to_gcs(
         logging.info(
             f"Uploading output file to gs://{target_gcs_bucket}/{target_gcs_path}"
         )
-        storage_client = storage.Client()
+        storage_client = gcp_clients.storage()
         bucket = storage_client.bucket(target_gcs_bucket)
         blob = bucket.blob(target_gcs_path)
         blob.upload_from_filename(file_path)
@@ -1931,4 +2696,13 @@ if __name__ == "__main__":
         regex_list=json.loads(os.environ.get("REGEX_LIST", r"{}")),
         int_date_list=json.loads(os.environ.get("INT_DATE_LIST", r"[]")),
         gen_location_list=json.loads(os.environ.get("GEN_LOCATION_LIST", r"{}")),
+        output_shard_size_mb=os.environ.get("OUTPUT_SHARD_SIZE_MB", "0"),
+        download_max_workers=os.environ.get("DOWNLOAD_MAX_WORKERS", "4"),
+        download_requests_per_second=os.environ.get(
+            "DOWNLOAD_REQUESTS_PER_SECOND", "10"
+        ),
+        reader_engine=os.environ.get("READER_ENGINE", "csv"),
+        max_parallel_years=os.environ.get("MAX_PARALLEL_YEARS", "1"),
+        client_pool_size=os.environ.get("CLIENT_POOL_SIZE", "10"),
+        schema_cache_dir=os.environ.get("SCHEMA_CACHE_DIR", ""),
     )
@@ -81,6 +81,8 @@ with DAG(
             "START_YEAR": "1763",
             "REMOVE_SOURCE_FILE": "Y",
             "DELETE_TARGET_FILE": "Y",
+            "OUTPUT_SHARD_SIZE_MB": "512",
+            "READER_ENGINE": "columnar",
             "INPUT_CSV_HEADERS": '[\n  "id",\n  "date",\n  "element",\n  "value",\n  "mflag",\n  "qflag",\n  "sflag",\n  "time"\n]',
             "DATA_DTYPES": '{\n  "id": "str",\n  "date": "str",\n  "element": "str",\n  "value": "str",\n  "mflag": "str",\n  "qflag": "str",\n  "sflag": "str",\n  "time": "str"\n}',
             "REORDER_HEADERS_LIST": '[\n  "id",\n  "date",\n  "element",\n  "value",\n  "mflag",\n  "qflag",\n  "sflag",\n  "time",\n  "source_url",\n  "etl_timestamp"\n]',
@@ -409,6 +411,7 @@ with DAG(
             "REMOVE_SOURCE_FILE": "Y",
             "DELETE_TARGET_FILE": "Y",
             "START_YEAR": "1950",
+            "MAX_PARALLEL_YEARS": "3",
             "RENAME_HEADERS_LIST": '{\n  "EPISODE_ID_x": "episode_id",\n  "EVENT_ID": "event_id",\n  "STATE": "state",\n  "STATE_FIPS": "state_fips_code",\n  "EVENT_TYPE": "event_type",\n  "CZ_TYPE": "cz_type",\n  "CZ_FIPS": "cz_fips_code",\n  "CZ_NAME": "cz_name",\n  "WFO": "wfo",\n  "BEGIN_DATE_TIME": "event_begin_time",\n  "CZ_TIMEZONE": "event_timezone",\n  "END_DATE_TIME": "event_end_time",\n  "INJURIES_DIRECT": "injuries_direct",\n  "INJURIES_INDIRECT": "injuries_indirect",\n  "DEATHS_DIRECT": "deaths_direct",\n  "DEATHS_INDIRECT": "deaths_indirect",\n  "DAMAGE_PROPERTY": "damage_property",\n  "DAMAGE_CROPS": "damage_crops",\n  "SOURCE": "source",\n  "MAGNITUDE": "magnitude",\n  "MAGNITUDE_TYPE": "magnitude_type",\n  "FLOOD_CAUSE": "flood_cause",\n  "TOR_F_SCALE": "tor_f_scale",\n  "TOR_LENGTH": "tor_length",\n  "TOR_WIDTH": "tor_width",\n  "TOR_OTHER_WFO": "tor_other_wfo",\n  "LOCATION_INDEX": "location_index",\n  "RANGE": "event_range",\n  "AZIMUTH": "event_azimuth",\n  "LOCATION": "reference_location",\n  "LATITUDE": "event_latitude",\n  "LONGITUDE": "event_longitude"\n}',
             "DATE_FORMAT_LIST": '[\n  ["event_begin_time", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M:%S" ],\n  ["event_end_time", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M:%S" ]\n]',
             "GEN_LOCATION_LIST": '{\n  "event_point": ["event_longitude", "event_latitude"]\n}',
@@ -444,6 +447,7 @@ with DAG(
             "FULL_DATA_LOAD": "N",
             "REMOVE_SOURCE_FILE": "Y",
             "DELETE_TARGET_FILE": "Y",
+            "READER_ENGINE": "columnar",
             "INPUT_CSV_HEADERS": '[\n  "year",\n  "month",\n  "day",\n  "time",\n  "size",\n  "location",\n  "county",\n  "state",\n  "lat",\n  "lon",\n  "comments"\n]',
             "RENAME_HEADERS_LIST": '{\n  "lat": "latitude",\n  "lon": "longitude"\n}',
             "DATE_FORMAT_LIST": '[\n  ["timestamp", "%Y-%m-%d %H%M%S", "%Y-%m-%d %H:%M:%S" ]\n]',
@@ -480,6 +484,7 @@ with DAG(
             "FULL_DATA_LOAD": "N",
             "REMOVE_SOURCE_FILE": "Y",
             "DELETE_TARGET_FILE": "Y",
+            "READER_ENGINE": "columnar",
             "INPUT_CSV_HEADERS": '[\n  "year",\n  "month",\n  "day",\n  "time",\n  "speed",\n  "location",\n  "county",\n  "state",\n  "lat",\n  "lon",\n  "comments"\n]',
             "RENAME_HEADERS_LIST": '{\n  "lat": "latitude",\n  "lon": "longitude"\n}',
             "DATE_FORMAT_LIST": '[\n  ["timestamp", "%Y-%m-%d %H%M%S", "%Y-%m-%d %H:%M:%S" ]\n]',
@@ -516,6 +521,7 @@ with DAG(
             "FULL_DATA_LOAD": "N",
             "REMOVE_SOURCE_FILE": "Y",
             "DELETE_TARGET_FILE": "Y",
+            "READER_ENGINE": "columnar",
             "INPUT_CSV_HEADERS": '[\n  "year",\n  "month",\n  "day",\n  "time",\n  "f_scale",\n  "location",\n  "county",\n  "state",\n  "lat",\n  "lon",\n  "comments"\n]',
             "RENAME_HEADERS_LIST": '{\n  "lat": "latitude",\n  "lon": "longitude"\n}',
             "DATE_FORMAT_LIST": '[\n  ["timestamp", "%Y-%m-%d %H%M%S", "%Y-%m-%d %H:%M:%S" ]\n]',
@@ -830,6 +836,7 @@ with DAG(
             "DELETE_TARGET_FILE": "Y",
             "NUMBER_OF_HEADER_ROWS": "1",
             "INPUT_CSV_HEADERS": '[\n  "STATION",\n  "DATE",\n  "LATITUDE",\n  "LONGITUDE",\n  "ELEVATION",\n  "NAME",\n  "TEMP",\n  "TEMP_ATTRIBUTES",\n  "DEWP",\n  "DEWP_ATTRIBUTES",\n  "SLP",\n  "SLP_ATTRIBUTES",\n  "STP",\n  "STP_ATTRIBUTES",\n  "VISIB",\n  "VISIB_ATTRIBUTES",\n  "WDSP",\n  "WDSP_ATTRIBUTES",\n  "MXSPD",\n  "GUST",\n  "MAX",\n  "MAX_ATTRIBUTES",\n  "MIN",\n  "MIN_ATTRIBUTES",\n  "PRCP",\n  "PRCP_ATTRIBUTES",\n  "SNDP",\n  "FRSHTT"\n]',
+            "SLICE_COLUMN_LIST": '{\n  "stn": ["STATION", "0", "6", "N"],\n  "wban": ["STATION", "6", "11", "N"],\n  "year": ["DATE", "0", "4", "N"],\n  "mo": ["DATE", "5", "7", "N"],\n  "da": ["DATE", "8", "10", "N"],\n  "fog": ["FRSHTT", "0", "1", "N"],\n  "rain_drizzle": ["FRSHTT", "1", "2", "N"],\n  "snow_ice_pellets": ["FRSHTT", "2", "3", "N"],\n  "hail": ["FRSHTT", "3", "4", "N"],\n  "thunder": ["FRSHTT", "4", "5", "N"],\n  "tornado_funnel_cloud": ["FRSHTT", "5", "6", "N"]\n}',
             "RENAME_HEADERS_LIST": '{\n  "TEMP": "temp",\n  "TEMP_ATTRIBUTES": "count_temp",\n  "DEWP": "dewp",\n  "DEWP_ATTRIBUTES": "count_dewp",\n  "SLP": "slp",\n  "SLP_ATTRIBUTES": "count_slp",\n  "STP": "stp",\n  "STP_ATTRIBUTES": "count_stp",\n  "VISIB": "visib",\n  "VISIB_ATTRIBUTES": "count_visib",\n  "WDSP": "wdsp",\n  "WDSP_ATTRIBUTES": "count_wdsp",\n  "MXSPD": "mxspd",\n  "GUST": "gust",\n  "MAX": "max",\n  "MAX_ATTRIBUTES": "flag_max",\n  "MIN": "min",\n  "MIN_ATTRIBUTES": "flag_min",\n  "PRCP": "prcp",\n  "PRCP_ATTRIBUTES": "flag_prcp",\n  "SNDP": "sndp",\n  "DATE": "date"\n}',
             "TRIM_WHITESPACE_LIST": '[\n  "stn",\n  "wban",\n  "year",\n  "mo",\n  "da",\n  "date",\n  "temp",\n  "count_temp",\n  "dewp",\n  "count_dewp",\n  "slp",\n  "count_slp",\n  "stp",\n  "count_stp",\n  "visib",\n  "count_visib",\n  "wdsp",\n  "count_wdsp",\n  "mxspd",\n  "gust",\n  "max",\n  "flag_max",\n  "min",\n  "flag_min",\n  "prcp",\n  "flag_prcp",\n  "sndp",\n  "fog",\n  "rain_drizzle",\n  "snow_ice_pellets",\n  "hail",\n  "thunder",\n  "tornado_funnel_cloud"\n]',
             "REORDER_HEADERS_LIST": '[\n  "stn",\n  "wban",\n  "date",\n  "year",\n  "mo",\n  "da",\n  "temp",\n  "count_temp",\n  "dewp",\n  "count_dewp",\n  "slp",\n  "count_slp",\n  "stp",\n  "count_stp",\n  "visib",\n  "count_visib",\n  "wdsp",\n  "count_wdsp",\n  "mxspd",\n  "gust",\n  "max",\n  "flag_max",\n  "min",\n  "flag_min",\n  "prcp",\n  "flag_prcp",\n  "sndp",\n  "fog",\n  "rain_drizzle",\n  "snow_ice_pellets",\n  "hail",\n  "thunder",\n  "tornado_funnel_cloud"\n]',
@@ -865,6 +872,7 @@ with DAG(
             "DELETE_TARGET_FILE": "Y",
             "NUMBER_OF_HEADER_ROWS": "1",
             "INPUT_CSV_HEADERS": '[\n  "STATION",\n  "DATE",\n  "LATITUDE",\n  "LONGITUDE",\n  "ELEVATION",\n  "NAME",\n  "TEMP",\n  "TEMP_ATTRIBUTES",\n  "DEWP",\n  "DEWP_ATTRIBUTES",\n  "SLP",\n  "SLP_ATTRIBUTES",\n  "STP",\n  "STP_ATTRIBUTES",\n  "VISIB",\n  "VISIB_ATTRIBUTES",\n  "WDSP",\n  "WDSP_ATTRIBUTES",\n  "MXSPD",\n  "GUST",\n  "MAX",\n  "MAX_ATTRIBUTES",\n  "MIN",\n  "MIN_ATTRIBUTES",\n  "PRCP",\n  "PRCP_ATTRIBUTES",\n  "SNDP",\n  "FRSHTT"\n]',
+            "SLICE_COLUMN_LIST": '{\n  "stn": ["STATION", "0", "6", "N"],\n  "wban": ["STATION", "6", "11", "N"],\n  "year": ["DATE", "0", "4", "N"],\n  "mo": ["DATE", "5", "7", "N"],\n  "da": ["DATE", "8", "10", "N"],\n  "fog": ["FRSHTT", "0", "1", "N"],\n  "rain_drizzle": ["FRSHTT", "1", "2", "N"],\n  "snow_ice_pellets": ["FRSHTT", "2", "3", "N"],\n  "hail": ["FRSHTT", "3", "4", "N"],\n  "thunder": ["FRSHTT", "4", "5", "N"],\n  "tornado_funnel_cloud": ["FRSHTT", "5", "6", "N"]\n}',
             "RENAME_HEADERS_LIST": '{\n  "TEMP": "temp",\n  "TEMP_ATTRIBUTES": "count_temp",\n  "DEWP": "dewp",\n  "DEWP_ATTRIBUTES": "count_dewp",\n  "SLP": "slp",\n  "SLP_ATTRIBUTES": "count_slp",\n  "STP": "stp",\n  "STP_ATTRIBUTES": "count_stp",\n  "VISIB": "visib",\n  "VISIB_ATTRIBUTES": "count_visib",\n  "WDSP": "wdsp",\n  "WDSP_ATTRIBUTES": "count_wdsp",\n  "MXSPD": "mxspd",\n  "GUST": "gust",\n  "MAX": "max",\n  "MAX_ATTRIBUTES": "flag_max",\n  "MIN": "min",\n  "MIN_ATTRIBUTES": "flag_min",\n  "PRCP": "prcp",\n  "PRCP_ATTRIBUTES": "flag_prcp",\n  "SNDP": "sndp",\n  "DATE": "date"\n}',
             "TRIM_WHITESPACE_LIST": '[\n  "stn",\n  "wban",\n  "year",\n  "mo",\n  "da",\n  "date",\n  "temp",\n  "count_temp",\n  "dewp",\n  "count_dewp",\n  "slp",\n  "count_slp",\n  "stp",\n  "count_stp",\n  "visib",\n  "count_visib",\n  "wdsp",\n  "count_wdsp",\n  "mxspd",\n  "gust",\n  "max",\n  "flag_max",\n  "min",\n  "flag_min",\n  "prcp",\n  "flag_prcp",\n  "sndp",\n  "fog",\n  "rain_drizzle",\n  "snow_ice_pellets",\n  "hail",\n  "thunder",\n  "tornado_funnel_cloud"\n]',
             "REORDER_HEADERS_LIST": '[\n  "stn",\n  "wban",\n  "date",\n  "year",\n  "mo",\n  "da",\n  "temp",\n  "count_temp",\n  "dewp",\n  "count_dewp",\n  "slp",\n  "count_slp",\n  "stp",\n  "count_stp",\n  "visib",\n  "count_visib",\n  "wdsp",\n  "count_wdsp",\n  "mxspd",\n  "gust",\n  "max",\n  "flag_max",\n  "min",\n  "flag_min",\n  "prcp",\n  "flag_prcp",\n  "sndp",\n  "fog",\n  "rain_drizzle",\n  "snow_ice_pellets",\n  "hail",\n  "thunder",\n  "tornado_funnel_cloud"\n]',
@@ -12,21 +12,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
+import concurrent.futures
+import contextlib
 import fnmatch
 import json
 import logging
 import os
 import pathlib
-import re
-import shutil
+import threading
+import time
 import typing
 import zipfile as zip
-from datetime import datetime
 
+import google.auth
 import numpy as np
 import pandas as pd
 import requests
 from google.api_core.exceptions import NotFound
+from google.auth.transport.requests import AuthorizedSession
 from google.cloud import bigquery, storage
 
 
@@ -64,8 +68,14 @@ def main(
     date_format_list: dict,
     filter_headers_list: typing.List[str],
     reorder_headers_list: typing.List[str],
+    csv_engine: str,
+    csv_shadow_rows: str,
+    download_max_workers: str,
+    client_pool_size: str,
 ) -> None:
     logging.info(f"{pipeline_name} process started")
+    gcp_clients.configure(pool_size=int(client_pool_size))
+    csv_readers.configure(engine=csv_engine, shadow_rows=int(csv_shadow_rows))
     pathlib.Path("./files").mkdir(parents=True, exist_ok=True)
     execute_pipeline(
         source_url=source_url,
@@ -100,7 +110,10 @@ def main(
         date_format_list=date_format_list,
         filter_headers_list=filter_headers_list,
         reorder_headers_list=reorder_headers_list,
+        download_max_workers=int(download_max_workers),
     )
+    csv_readers.summary()
+    gcp_clients.summary()
     logging.info(f"{pipeline_name} process completed")
 
 
@@ -137,6 +150,7 @@ def execute_pipeline(
     date_format_list: dict,
     filter_headers_list: typing.List[str],
     reorder_headers_list: typing.List[str],
+    download_max_workers: int = 1,
 ) -> None:
     if (
         destination_table == "311_service_requests"
@@ -266,8 +280,10 @@ def execute_pipeline(
         download_file_json(source_url_json, source_file_json, source_file, "stations")
     if destination_table == "bikeshare_trips":
         dest_path = os.path.split(source_file)[0]
-        download_url_files_from_list(source_url_list, dest_path)
-        stage_input_files(dest_path, source_file)
+        source_files = download_url_files_from_list(
+            source_url_list, dest_path, max_workers=download_max_workers
+        )
+        stage_input_files(source_files, source_file)
         process_source_file(
             source_file=str(source_file).replace(".csv", "_trip_data.csv"),
             target_file=str(target_file).replace(".csv", "_trip_data.csv"),
@@ -306,6 +322,7 @@ def execute_pipeline(
         )
         handle_tripdata(
             target_file=target_file,
+            chunksize=int(chunksize),
             resolve_datatypes_list=resolve_datatypes_list,
             rename_headers_list=rename_headers_list,
             reorder_headers_list=reorder_headers_list,
@@ -881,7 +898,7 @@ def download_file_gcs(
 ) -> None:
     object_name = os.path.basename(source_location)
     dest_object = f"{destination_folder}/{object_name}"
-    storage_client = storage.Client(project_id)
+    storage_client = gcp_clients.storage(project_id)
     bucket_name = str.split(source_location, "gs://")[1].split("/")[0]
     bucket = storage_client.bucket(bucket_name)
     source_object_path = str.split(source_location, f"gs://{bucket_name}/")[1]
@@ -891,144 +908,421 @@ def download_file_gcs(
 
 def handle_tripdata(
     target_file: str,
+    chunksize: int,
     resolve_datatypes_list: dict,
     rename_headers_list: dict,
     reorder_headers_list: typing.List[str],
     target_gcs_bucket: str,
     target_gcs_path: str,
-) -> pd.DataFrame:
+) -> None:
     logging.info("Compiling target file by merging source data")
-    trip_data_filepath = str(target_file).replace(".csv", "_trip_data.csv")
-    logging.info(f"Opening {trip_data_filepath}")
-    df_trip_data = pd.read_csv(
-        trip_data_filepath,
-        engine="python",
-        encoding="utf-8",
-        quotechar='"',  # string separator, typically double-quotes
-        sep="|",  # data column separator, typically ","
-    )
-    tripdata_filepath = str(target_file).replace(".csv", "_tripdata.csv")
-    logging.info(f"Opening {tripdata_filepath}")
-    df_tripdata = pd.read_csv(
-        tripdata_filepath,
-        engine="python",
-        encoding="utf-8",
-        quotechar='"',  # string separator, typically double-quotes
-        sep="|",  # data column separator, typically ","
-    )
-    df_tripdata.drop_duplicates(
-        subset=["key_val"], keep="last", inplace=True, ignore_index=False
-    )
-    df_tripdata["trip_id"] = df_tripdata["key_val"].str.replace("-", "")
-    df_tripdata.set_index("key", inplace=True)
-    df_trip_data.drop_duplicates(
-        subset=["key_val"], keep="last", inplace=True, ignore_index=False
-    )
-    df_trip_data.set_index("key", inplace=True)
-    df = df_trip_data.append(df_tripdata, sort=True)
-    df["subscriber_type_new"] = df.apply(
-        lambda x: str(x.subscription_type)
-        if not str(x.subscriber_type)
-        else str(x.subscriber_type),
-        axis=1,
+    # The Ford GoBike era files carry their own trip_id, the Bay Wheels era
+    # ones get theirs from the trip key
+    source_files = {
+        str(target_file).replace(".csv", "_trip_data.csv"): False,
+        str(target_file).replace(".csv", "_tripdata.csv"): True,
+    }
+    merged_columns = {"trip_id"}
+    for source_file in source_files:
+        merged_columns.update(
+            csv_readers.read_csv(source_file, sep="|", nrows=0).columns
+        )
+    merged_columns = sorted(merged_columns)
+    rows_written = 0
+    for source_file, derive_trip_id in source_files.items():
+        keep_rows = last_occurrence_mask(source_file, chunksize, "key_val")
+        logging.info(
+            f"Merging {keep_rows.sum()} of {len(keep_rows)} rows from {source_file}"
+        )
+        row_offset = 0
+        with csv_readers.read_csv(
+            source_file,
+            encoding="utf-8",
+            quotechar='"',  # string separator, typically double-quotes
+            sep="|",  # data column separator, typically ","
+            chunksize=chunksize,
+            dtype=str,
+        ) as reader:
+            for chunk in reader:
+                chunk_keep = keep_rows[row_offset : row_offset + len(chunk)]
+                row_offset += len(chunk)
+                df = merge_tripdata_chunk(
+                    df=chunk[chunk_keep],
+                    merged_columns=merged_columns,
+                    derive_trip_id=derive_trip_id,
+                    resolve_datatypes_list=resolve_datatypes_list,
+                    rename_headers_list=rename_headers_list,
+                    reorder_headers_list=reorder_headers_list,
+                )
+                append_batch_to_target_file(
+                    df,
+                    target_file,
+                    include_header=(rows_written == 0),
+                    truncate_file=(rows_written == 0),
+                )
+                rows_written += len(df)
+    upload_file_to_gcs(target_file, target_gcs_bucket, target_gcs_path)
+
+
+def last_occurrence_mask(
+    source_file: str, chunksize: int, key_field: str, sep: str = "|"
+) -> np.ndarray:
+    # Only a 64-bit hash per row is held, so the index stays at 8 bytes a row
+    # however long the trip history grows
+    with csv_readers.read_csv(
+        source_file, sep=sep, usecols=[key_field], dtype=str, chunksize=chunksize
+    ) as reader:
+        key_hashes = np.concatenate(
+            [
+                pd.util.hash_pandas_object(chunk[key_field], index=False).to_numpy()
+                for chunk in reader
+            ]
+            or [np.empty(0, dtype=np.uint64)]
+        )
+    order = np.argsort(key_hashes, kind="stable")
+    sorted_hashes = key_hashes[order]
+    is_last = np.ones(len(sorted_hashes), dtype=bool)
+    is_last[:-1] = sorted_hashes[1:] != sorted_hashes[:-1]
+    keep_rows = np.zeros(len(key_hashes), dtype=bool)
+    keep_rows[order[is_last]] = True
+    # Rows sharing a hash are settled on the keys themselves, so a hash
+    # collision can never drop a distinct trip
+    shared_hashes = np.unique(sorted_hashes[~is_last])
+    shared_rows = np.flatnonzero(np.isin(key_hashes, shared_hashes))
+    if len(shared_rows):
+        shared_keys = []
+        row_offset = 0
+        with csv_readers.read_csv(
+            source_file, sep=sep, usecols=[key_field], dtype=str, chunksize=chunksize
+        ) as reader:
+            for chunk in reader:
+                in_chunk = shared_rows[
+                    (shared_rows >= row_offset)
+                    & (shared_rows < row_offset + len(chunk))
+                ]
+                shared_keys.append(chunk[key_field].to_numpy()[in_chunk - row_offset])
+                row_offset += len(chunk)
+        shared_keys = pd.Series(np.concatenate(shared_keys))
+        keep_rows[shared_rows] = ~shared_keys.duplicated(keep="last").to_numpy()
+    return keep_rows
+
+
+def merge_tripdata_chunk(
+    df: pd.DataFrame,
+    merged_columns: typing.List[str],
+    derive_trip_id: bool,
+    resolve_datatypes_list: dict,
+    rename_headers_list: dict,
+    reorder_headers_list: typing.List[str],
+) -> pd.DataFrame:
+    if derive_trip_id:
+        df = df.assign(trip_id=df["key_val"].str.replace("-", "", regex=False))
+    df = df.reindex(columns=merged_columns)
+    subscriber_type = df["subscriber_type"]
+    df["subscriber_type_new"] = np.where(
+        subscriber_type.notna() & (subscriber_type != ""),
+        subscriber_type,
+        df["subscription_type"],
     )
     df = df.drop(columns=["subscriber_type"])
+    # Fields are read as text, so those being retyped are made numeric first
+    for field in resolve_datatypes_list:
+        df[field] = pd.to_numeric(df[field])
     df = resolve_datatypes(df=df, resolve_datatypes_list=resolve_datatypes_list)
     df = rename_headers(df=df, rename_headers_list=rename_headers_list)
     df = reorder_headers(df=df, output_headers_list=reorder_headers_list)
-    save_to_new_file(df=df, file_path=target_file, sep="|")
-    upload_file_to_gcs(target_file, target_gcs_bucket, target_gcs_path)
+    return df
 
 
-def listdirs(rootdir: str) -> list:
-    rtn_list = []
-    for file in os.listdir(rootdir):
-        d = os.path.join(rootdir, file)
-        if os.path.isdir(d):
-            rtn_list.append(d)
-            for elem in listdirs(d):
-                rtn_list.append(elem)
-    return rtn_list
+def download_url_files_from_list(
+    url_list: typing.List[str], dest_path: str, max_workers: int = 1
+) -> typing.List[str]:
+    dest_files = [dest_path + "/" + os.path.split(url)[1] for url in url_list]
+    # Archives are left packed, staging reads their members in place
+    session = http_session(pool_size=max_workers)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(
+            executor.map(
+                lambda url, dest_file: download_file_http(url, dest_file, session),
+                url_list,
+                dest_files,
+            )
+        )
+    session.close()
+    return dest_files
 
 
-def download_url_files_from_list(url_list: typing.List[str], dest_path: str) -> None:
-    for url in url_list:
-        dest_file = dest_path + "/" + os.path.split(url)[1]
-        download_file_http(url, dest_file)
+def http_session(pool_size: int = 1) -> requests.Session:
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class CsvReaderFactory:
+    """Opens pd.read_csv readers on the fastest engine that supports the
+    requested options. "auto" uses the C parser, which keeps pandas' own type
+    inference, and falls back to the python parser only for options the C
+    parser lacks. With `shadow_rows` set, the first `shadow_rows` rows of each
+    file are also parsed by the python engine and any difference sends that
+    file back to it. Only that sample is compared, so a difference further
+    into a file goes unnoticed.
+
+    Every image reading CSVs this way carries a copy of this block. Edit the
+    new_york_taxi_trips copy and run scripts/sync_shared_helpers.py."""
+
+    def __init__(self, engine: str = "auto", shadow_rows: int = 0) -> None:
+        self.lock = threading.Lock()
+        self.counts = collections.Counter()
+        self.engine = engine
+        self.shadow_rows = shadow_rows
+
+    def configure(self, engine: str = "auto", shadow_rows: int = 0) -> None:
+        self.engine = engine or "auto"
+        self.shadow_rows = max(shadow_rows, 0)
+
+    def pick_engine(self, options: dict) -> str:
+        sep = options.get("sep", options.get("delimiter", ","))
+        dtype = options.get("dtype")
         if (
-            url.find(".zip") > -1 or url.find(".gz") > -1 or url.find(".tar") > -1
-        ) and (url.find("http") == 0 or url.find("gs:") == 0):
-            unpack_file(dest_file, dest_path)
-        else:
-            logging.info(f"Parsing {dest_file} for decompression")
+            self.engine == "python"
+            or sep is None
+            or (len(sep) > 1 and sep != r"\s+")
+            or len(options.get("quotechar", '"')) > 1
+            or options.get("skipfooter")
+            or callable(options.get("on_bad_lines"))
+            or (
+                not isinstance(dtype, dict)
+                and pd.api.types.is_datetime64_any_dtype(dtype)
+            )
+        ):
+            return "python"
+        return "c"
+
+    def read_csv(
+        self, source_file: str, **options
+    ) -> typing.Union[pd.DataFrame, pd.io.parsers.TextFileReader]:
+        engine = self.pick_engine(options)
+        if engine != "python" and self.shadow_rows:
+            sample_options = {
+                key: value
+                for key, value in options.items()
+                if key not in ("chunksize", "iterator")
+            }
+            sample_options["nrows"] = self.shadow_rows
+            if not self.frames_match(
+                source_file,
+                engine,
+                self.open(source_file, engine, sample_options, count=False),
+                self.open(source_file, "python", sample_options, count=False),
+            ):
+                engine = "python"
+        return self.open(source_file, engine, options)
+
+    def open(
+        self, source_file: str, engine: str, options: dict, count: bool = True
+    ) -> typing.Union[pd.DataFrame, pd.io.parsers.TextFileReader]:
+        datetime_dtypes = {}
+        if engine == "c":
+            # Parse floats exactly as the python engine does and infer each
+            # chunk's types from the whole chunk rather than per internal block
+            options = {"float_precision": "round_trip", "low_memory": False, **options}
+            # The C parser rejects datetime64 in dtype, so those columns are
+            # read as text and cast afterwards, as the python parser does
+            dtype = options.get("dtype")
+            if isinstance(dtype, dict):
+                datetime_dtypes = {
+                    column: column_dtype
+                    for column, column_dtype in dtype.items()
+                    if pd.api.types.is_datetime64_any_dtype(column_dtype)
+                }
+                if datetime_dtypes:
+                    options = {
+                        **options,
+                        "dtype": {
+                            **dtype,
+                            **{column: object for column in datetime_dtypes},
+                        },
+                    }
+        if count:
+            logging.info(f"Reading {source_file} with the {engine} CSV engine")
+            with self.lock:
+                self.counts[engine] += 1
+        reader = pd.read_csv(source_file, engine=engine, **options)
+        if not datetime_dtypes:
+            return reader
+        if isinstance(reader, pd.DataFrame):
+            return cast_datetime_columns(reader, datetime_dtypes)
+        return DatetimeCastingReader(reader, datetime_dtypes)
+
+    def frames_match(
+        self,
+        source_file: str,
+        engine: str,
+        engine_df: pd.DataFrame,
+        python_df: pd.DataFrame,
+    ) -> bool:
+        try:
+            pd.testing.assert_frame_equal(engine_df, python_df)
+        except AssertionError as e:
+            logging.warning(
+                f"The {engine} engine parsed {source_file} differently from the python engine, using python instead: {e}"
+            )
+            with self.lock:
+                self.counts["shadow_mismatches"] += 1
+            return False
+        with self.lock:
+            self.counts["shadow_matches"] += 1
+        return True
+
+    def summary(self) -> None:
+        logging.info(
+            f"CSV readers opened: {self.counts['c']} c, "
+            f"{self.counts['python']} python; shadow checks matched: "
+            f"{self.counts['shadow_matches']}, differed: {self.counts['shadow_mismatches']}"
+        )
+
+
+class DatetimeCastingReader:
+    """Wraps a chunked pd.read_csv reader and casts the datetime64 columns of
+    every chunk it hands out."""
+
+    def __init__(
+        self, reader: pd.io.parsers.TextFileReader, datetime_dtypes: dict
+    ) -> None:
+        self.reader = reader
+        self.datetime_dtypes = datetime_dtypes
+
+    def __enter__(self) -> "DatetimeCastingReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __iter__(self) -> "DatetimeCastingReader":
+        return self
+
+    def __next__(self) -> pd.DataFrame:
+        return cast_datetime_columns(next(self.reader), self.datetime_dtypes)
+
+    def get_chunk(self, size: int = None) -> pd.DataFrame:
+        return cast_datetime_columns(self.reader.get_chunk(size), self.datetime_dtypes)
+
+    def close(self) -> None:
+        self.reader.close()
+
+
+def cast_datetime_columns(df: pd.DataFrame, datetime_dtypes: dict) -> pd.DataFrame:
+    for column, column_dtype in datetime_dtypes.items():
+        if column not in df.columns:
+            continue
+        try:
+            df[column] = df[column].astype(column_dtype)
+        except (TypeError, ValueError) as error:
+            raise ValueError(
+                f"Unable to convert column {column} to type {column_dtype}"
+            ) from error
+    return df
+
+
+csv_readers = CsvReaderFactory()
 
 
-def download_file_http(source_url: str, source_file: pathlib.Path) -> None:
+def download_file_http(
+    source_url: str, source_file: pathlib.Path, session: requests.Session = None
+) -> None:
     logging.info(f"Downloading {source_url} to {source_file}")
-    src_file = requests.get(source_url, stream=True)
+    src_file = (session or requests).get(source_url, stream=True)
     with open(source_file, "wb") as f:
-        for chunk in src_file:
+        for chunk in src_file.iter_content(chunk_size=1024 * 1024):
             f.write(chunk)
 
 
-def unpack_file(infile: str, dest_path: str, compression_type: str = "zip") -> None:
-    if compression_type == "zip":
-        logging.info(f"Unpacking {infile} to {dest_path}")
-        zip_decompress(infile=infile, dest_path=dest_path)
-    else:
-        logging.info(
-            f"{infile} ignored as it is not compressed or is of unknown compression"
+def stage_input_files(source_files: typing.List[str], target_file_path: str) -> None:
+    logging.info("Staging input files")
+    for file_group_wildcard in ["tripdata.csv", "trip_data.csv"]:
+        concatenate_files(
+            target_file_path,
+            list_group_members(source_files, file_group_wildcard),
+            file_group_wildcard,
         )
 
 
-def zip_decompress(infile: str, dest_path: str) -> None:
-    logging.info(f"Unpacking {infile} to {dest_path}")
-    with zip.ZipFile(infile, mode="r") as zipf:
-        zipf.extractall(dest_path)
-        zipf.close()
+def list_group_members(
+    source_files: typing.List[str], file_group_wildcard: str
+) -> typing.List[typing.Tuple[str, str, typing.Optional[str]]]:
+    # Returns (file name, local file, zip member or None) sorted by file name
+    members = {}
+    for source_file in source_files:
+        if zip.is_zipfile(source_file):
+            with zip.ZipFile(source_file, mode="r") as zipf:
+                for member in zipf.namelist():
+                    # Skip the macOS resource forks packed alongside the data
+                    if member.startswith("__MACOSX/"):
+                        continue
+                    file_name = os.path.basename(member)
+                    if fnmatch.fnmatch(file_name, "*" + file_group_wildcard):
+                        members[file_name] = (source_file, member)
+        elif fnmatch.fnmatch(os.path.basename(source_file), "*" + file_group_wildcard):
+            members[os.path.basename(source_file)] = (source_file, None)
+    return [(file_name, *members[file_name]) for file_name in sorted(members)]
 
 
-def stage_input_files(dest_dir: str, target_file_path: str) -> None:
-    logging.info("Staging input files")
-    for src_dir in listdirs(dest_dir):
-        logging.info("-------------------------------------------------------------")
-        pool_files(src_dir, dest_dir, "tripdata.csv")
-        pool_files(src_dir, dest_dir, "trip_data.csv")
-    concatenate_files(target_file_path, dest_dir, "tripdata.csv")
-    concatenate_files(target_file_path, dest_dir, "trip_data.csv")
+def concatenate_files(
+    target_file_path: str,
+    group_members: typing.List[typing.Tuple[str, str, typing.Optional[str]]],
+    file_group_wildcard: str,
+) -> None:
+    target_file_path = str(target_file_path).replace(".csv", "_" + file_group_wildcard)
+    logging.info(
+        f"Concatenating {len(group_members)} *{file_group_wildcard} files into {target_file_path}"
+    )
+    with open(target_file_path, "wb") as target_file:
+        for file_name, source_file, member in group_members:
+            logging.info(
+                f"Reading from {source_file}{'/' + member if member else ''}, writing to file {target_file_path}"
+            )
+            with open_group_member(source_file, member) as src_file:
+                append_with_source_name(src_file, target_file, file_name)
 
 
-def pool_files(src_dir: str, dest_dir: str, file_group_wildcard: str):
-    logging.info(f"Pooling files *{file_group_wildcard}")
-    if len(fnmatch.filter(os.listdir(src_dir), "*" + file_group_wildcard)) > 0:
-        for src_file in fnmatch.filter(os.listdir(src_dir), "*" + file_group_wildcard):
-            logging.info(f"Copying {src_dir}/{src_file} -> {dest_dir}/{src_file}")
-            shutil.copyfile(f"{src_dir}/{src_file}", f"{dest_dir}/{src_file}")
+@contextlib.contextmanager
+def open_group_member(
+    source_file: str, member: typing.Optional[str]
+) -> typing.Iterator[typing.BinaryIO]:
+    if member is None:
+        with open(source_file, "rb") as src_file:
+            yield src_file
+    else:
+        with zip.ZipFile(source_file, mode="r") as zipf, zipf.open(member) as src_file:
+            yield src_file
 
 
-def concatenate_files(
-    target_file_path: str, dest_path: str, file_group_wildcard: str
+def append_with_source_name(
+    src_file: typing.BinaryIO,
+    target_file: typing.BinaryIO,
+    file_name: str,
+    block_size: int = 16 * 1024 * 1024,
 ) -> None:
-    target_file_dir = os.path.split(str(target_file_path))[0]
-    target_file_path = str(target_file_path).replace(".csv", "_" + file_group_wildcard)
-    logging.info(f"Concatenating files {target_file_dir}/*{file_group_wildcard}")
-    if os.path.isfile(target_file_path):
-        os.unlink(target_file_path)
-    for src_file_path in sorted(
-        fnmatch.filter(os.listdir(dest_path), "*" + file_group_wildcard)
-    ):
-        src_file_path = dest_path + "/" + src_file_path
-        with open(src_file_path, "r") as src_file:
-            with open(target_file_path, "a+") as target_file:
-                next(src_file)
-                logging.info(
-                    f"Reading from file {src_file_path}, writing to file {target_file_path}"
-                )
-                for line in src_file:
-                    line = (
-                        os.path.split(src_file_path)[1] + "," + line
-                    )  # include the file source
-                    target_file.write(line)
+    # Drop the header, then prefix every row with its file name a block at a time
+    prefix = (file_name + ",").encode("utf-8")
+    src_file.readline()
+    pending = b""
+    while True:
+        block = src_file.read(block_size)
+        if not block:
+            break
+        block = pending + block
+        cut = block.rfind(b"\n") + 1
+        rows, pending = block[:cut].replace(b"\r\n", b"\n"), block[cut:]
+        if rows:
+            target_file.write(prefix + rows[:-1].replace(b"\n", b"\n" + prefix) + b"\n")
+    if pending:
+        # A last row without a newline must not run into the next file's first
+        target_file.write(prefix + pending + b"\n")
 
 
 def process_source_file(
@@ -1051,10 +1345,21 @@ def process_source_file(
     field_separator: str = ",",
 ) -> None:
     logging.info(f"Opening source file {source_file}")
+    transform_pipeline = compile_transform_plan(
+        plan_name=transform_plan_name(destination_table, target_file),
+        rename_headers_list=rename_headers_list,
+        empty_key_list=empty_key_list,
+        gen_location_list=gen_location_list,
+        resolve_datatypes_list=resolve_datatypes_list,
+        remove_paren_list=remove_paren_list,
+        strip_whitespace_list=strip_whitespace_list,
+        strip_newlines_list=strip_newlines_list,
+        date_format_list=date_format_list,
+        reorder_headers_list=reorder_headers_list,
+    )
     if header_row_ordinal is None or header_row_ordinal == "None":
-        with pd.read_csv(
+        with csv_readers.read_csv(
             source_file,
-            engine="python",
             encoding="utf-8",
             quotechar='"',
             chunksize=int(chunksize),  # size of batch data, in no. of records
@@ -1075,23 +1380,13 @@ def process_source_file(
                     target_file_batch=target_file_batch,
                     target_file=target_file,
                     skip_header=(not chunk_number == 0),
-                    destination_table=destination_table,
-                    rename_headers_list=rename_headers_list,
-                    empty_key_list=empty_key_list,
-                    gen_location_list=gen_location_list,
-                    resolve_datatypes_list=resolve_datatypes_list,
-                    remove_paren_list=remove_paren_list,
-                    strip_newlines_list=strip_newlines_list,
-                    strip_whitespace_list=strip_whitespace_list,
-                    date_format_list=date_format_list,
-                    reorder_headers_list=reorder_headers_list,
+                    transform_pipeline=transform_pipeline,
                 )
     else:
         header = int(header_row_ordinal)
         if data_dtypes != "[]":
-            with pd.read_csv(
+            with csv_readers.read_csv(
                 source_file,
-                engine="python",
                 encoding="utf-8",
                 quotechar='"',
                 chunksize=int(chunksize),  # size of batch data, in no. of records
@@ -1112,21 +1407,11 @@ def process_source_file(
                         target_file_batch=target_file_batch,
                         target_file=target_file,
                         skip_header=(not chunk_number == 0),
-                        destination_table=destination_table,
-                        rename_headers_list=rename_headers_list,
-                        empty_key_list=empty_key_list,
-                        gen_location_list=gen_location_list,
-                        resolve_datatypes_list=resolve_datatypes_list,
-                        remove_paren_list=remove_paren_list,
-                        strip_newlines_list=strip_newlines_list,
-                        strip_whitespace_list=strip_whitespace_list,
-                        date_format_list=date_format_list,
-                        reorder_headers_list=reorder_headers_list,
+                        transform_pipeline=transform_pipeline,
                     )
         else:
-            with pd.read_csv(
+            with csv_readers.read_csv(
                 source_file,
-                engine="python",
                 encoding="utf-8",
                 quotechar='"',
                 chunksize=int(chunksize),  # size of batch data, in no. of records
@@ -1146,17 +1431,9 @@ def process_source_file(
                         target_file_batch=target_file_batch,
                         target_file=target_file,
                         skip_header=(not chunk_number == 0),
-                        destination_table=destination_table,
-                        rename_headers_list=rename_headers_list,
-                        empty_key_list=empty_key_list,
-                        gen_location_list=gen_location_list,
-                        resolve_datatypes_list=resolve_datatypes_list,
-                        remove_paren_list=remove_paren_list,
-                        strip_newlines_list=strip_newlines_list,
-                        strip_whitespace_list=strip_whitespace_list,
-                        date_format_list=date_format_list,
-                        reorder_headers_list=reorder_headers_list,
+                        transform_pipeline=transform_pipeline,
                     )
+    transform_pipeline.summary()
 
 
 def process_chunk(
@@ -1164,8 +1441,115 @@ def process_chunk(
     target_file_batch: str,
     target_file: str,
     skip_header: bool,
-    destination_table: str,
-    rename_headers_list: typing.List[str],
+    transform_pipeline: "TransformPipeline",
+) -> None:
+    logging.info(f"Processing batch file {target_file_batch}")
+    df = transform_pipeline(df)
+    append_batch_to_target_file(
+        df, target_file, include_header=not skip_header, truncate_file=not skip_header
+    )
+    logging.info(f"Processing batch file {target_file_batch} completed")
+
+
+# Transform steps applied to each chunk, in order, per destination table.
+# Bikeshare trips are planned per source file group.
+TRANSFORM_PLANS = {
+    "311_service_requests": [
+        "rename_headers",
+        "remove_empty_key_rows",
+        "resolve_datatypes",
+        "remove_parenthesis_long_lat",
+        "strip_whitespace",
+        "strip_newlines",
+        "resolve_date_format",
+        "reorder_headers",
+    ],
+    "sffd_service_calls": [
+        "rename_headers",
+        "strip_whitespace",
+        "strip_newlines",
+        "extract_long_lat_from_geom",
+        "resolve_date_format",
+        "reorder_headers",
+    ],
+    "street_trees": [
+        "rename_headers",
+        "remove_empty_key_rows",
+        "resolve_date_format",
+        "reorder_headers",
+    ],
+    "sfpd_incidents": [
+        "rename_headers",
+        "remove_empty_key_rows",
+        "resolve_date_format",
+        "sfpd_timestamp",
+        "reorder_headers",
+    ],
+    "bikeshare_station_info": [
+        "rename_headers",
+        "remove_empty_key_rows",
+        "generate_location",
+        "resolve_datatypes",
+        "reorder_headers",
+    ],
+    "bikeshare_station_status": [
+        "rename_headers",
+        "remove_empty_key_rows",
+        "reorder_headers",
+    ],
+    "bikeshare_trips_trip_data": ["resolve_date_format", "add_key"],
+    "bikeshare_trips_tripdata": [
+        "resolve_date_format",
+        "generate_location",
+        "add_key",
+    ],
+    "film_locations": [
+        "rename_headers",
+        "strip_whitespace",
+        "strip_newlines",
+        "reorder_headers",
+    ],
+}
+
+
+class TransformPipeline:
+    """The compiled form of a transform plan: an ordered list of named stages,
+    each taking and returning a chunk, with the time spent in every stage
+    summed across chunks."""
+
+    def __init__(
+        self,
+        plan_name: str,
+        stages: typing.List[typing.Tuple[str, typing.Callable]],
+    ) -> None:
+        self.plan_name = plan_name
+        self.stages = stages
+        self.timings = collections.OrderedDict((name, 0.0) for name, _ in stages)
+
+    def __call__(self, df: pd.DataFrame) -> pd.DataFrame:
+        for name, stage in self.stages:
+            started = time.perf_counter()
+            df = stage(df)
+            self.timings[name] += time.perf_counter() - started
+        return df
+
+    def summary(self) -> None:
+        for name, seconds in self.timings.items():
+            logging.info(f"Transform {self.plan_name} step {name}: {seconds:.2f}s")
+
+
+def transform_plan_name(destination_table: str, target_file: str) -> str:
+    if destination_table == "bikeshare_trips":
+        if str(target_file).find("_trip_data.csv") > -1:
+            return "bikeshare_trips_trip_data"
+        if str(target_file).find("_tripdata.csv") > -1:
+            return "bikeshare_trips_tripdata"
+    return destination_table
+
+
+def compile_transform_plan(
+    plan_name: str,
+    rename_headers_list: dict,
     empty_key_list: typing.List[str],
     gen_location_list: dict,
     resolve_datatypes_list: dict,
@@ -1174,81 +1558,120 @@ def process_chunk(
     strip_newlines_list: typing.List[str],
     date_format_list: dict,
     reorder_headers_list: typing.List[str],
-) -> None:
-    logging.info(f"Processing batch file {target_file_batch}")
-    if destination_table == "311_service_requests":
-        df = rename_headers(df, rename_headers_list)
-        df = remove_empty_key_rows(df, empty_key_list)
-        df = resolve_datatypes(df, resolve_datatypes_list)
-        df = remove_parenthesis_long_lat(df, remove_paren_list)
-        df = strip_whitespace(df, strip_whitespace_list)
-        df = strip_newlines(df, strip_newlines_list)
-        df = resolve_date_format(df, date_format_list)
-        df = reorder_headers(df, reorder_headers_list)
-    elif destination_table == "sffd_service_calls":
-        df = rename_headers(df, rename_headers_list)
-        df = strip_whitespace(df, strip_whitespace_list)
-        df = strip_newlines(df, strip_newlines_list)
-        df = extract_latitude_from_geom(df, "location_geom", "latitude")
-        df = extract_longitude_from_geom(df, "location_geom", "longitude")
-        df = resolve_date_format(df, date_format_list)
-        df = reorder_headers(df, reorder_headers_list)
-    elif destination_table == "street_trees":
-        df = rename_headers(df, rename_headers_list)
-        df = remove_empty_key_rows(df, empty_key_list)
-        df = resolve_date_format(df, date_format_list)
-        df = reorder_headers(df, reorder_headers_list)
-    elif destination_table == "sfpd_incidents":
-        df = rename_headers(df=df, rename_headers_list=rename_headers_list)
-        df = remove_empty_key_rows(df, empty_key_list)
-        df = resolve_date_format(df, date_format_list)
-        df["timestamp"] = df.apply(
-            lambda x: datetime.strftime(
-                datetime.strptime(
-                    (x["Date"][:10] + " " + x["Time"] + ":00"), "%Y-%m-%d %H:%M:%S"
-                ),
-                "%Y-%m-%d %H:%M:%S",
+) -> TransformPipeline:
+    # Steps that rework whole chunks
+    frame_steps = {
+        "rename_headers": lambda df: rename_headers(df, rename_headers_list),
+        "remove_empty_key_rows": lambda df: remove_empty_key_rows(df, empty_key_list),
+        "reorder_headers": lambda df: reorder_headers(df, reorder_headers_list),
+    }
+    # Steps that map each value of the listed columns on its own, as
+    # (function, per-column settings)
+    column_steps = {
+        "resolve_datatypes": (resolve_datatypes, resolve_datatypes_list),
+        "remove_parenthesis_long_lat": (remove_parenthesis_long_lat, remove_paren_list),
+        "strip_whitespace": (strip_whitespace, strip_whitespace_list),
+        "strip_newlines": (strip_newlines, strip_newlines_list),
+        "resolve_date_format": (resolve_date_format, date_format_list),
+    }
+    # Steps that derive columns from others, as (function, reads, writes)
+    derived_steps = {
+        "extract_long_lat_from_geom": (
+            lambda df: extract_long_lat_from_geom(
+                df, "location_geom", "longitude", "latitude"
             ),
-            axis=1,
-        )
-        df = reorder_headers(df, reorder_headers_list)
-    elif destination_table == "bikeshare_station_info":
-        df = rename_headers(df, rename_headers_list)
-        df = remove_empty_key_rows(df, empty_key_list)
-        df = generate_location(df, gen_location_list)
-        df = resolve_datatypes(df, resolve_datatypes_list)
-        df = reorder_headers(df, reorder_headers_list)
-    elif destination_table == "bikeshare_station_status":
-        df = rename_headers(df, rename_headers_list)
-        df = remove_empty_key_rows(df, empty_key_list)
-        df = reorder_headers(df, reorder_headers_list)
-    elif destination_table == "bikeshare_trips":
-        if str(target_file).find("_trip_data.csv") > -1:
-            df = resolve_date_format(df, date_format_list)
-        if str(target_file).find("_tripdata.csv") > -1:
-            df = resolve_date_format(df, date_format_list)
-            df = generate_location(df, gen_location_list)
-        df = add_key(df)
-    elif destination_table == "film_locations":
-        df = rename_headers(df, rename_headers_list)
-        df = strip_whitespace(df, strip_whitespace_list)
-        df = strip_newlines(df, strip_newlines_list)
-        df = reorder_headers(df, reorder_headers_list)
-    else:
-        pass
-    save_to_new_file(df, file_path=str(target_file_batch), sep="|")
-    append_batch_file(target_file_batch, target_file, skip_header, not (skip_header))
-    logging.info(f"Processing batch file {target_file_batch} completed")
+            {"location_geom"},
+            {"longitude", "latitude"},
+        ),
+        "generate_location": (
+            lambda df: generate_location(df, gen_location_list),
+            {field for fields in gen_location_list.values() for field in fields},
+            set(gen_location_list),
+        ),
+        "sfpd_timestamp": (sfpd_timestamp, {"Date", "Time"}, {"timestamp"}),
+        "add_key": (
+            add_key,
+            {"start_date", "bike_number"},
+            {"start_date_str", "key", "key_val"},
+        ),
+    }
+    stages = []
+    fused_columns = collections.OrderedDict()
+    fused_step_names = []
+    deferred = []
+
+    def flush() -> None:
+        if fused_columns:
+            stages.append(
+                (
+                    " + ".join(fused_step_names),
+                    fused_column_stage(dict(fused_columns)),
+                )
+            )
+        stages.extend((name, step) for name, step, _ in deferred)
+        fused_columns.clear()
+        fused_step_names.clear()
+        deferred.clear()
+
+    for step_name in TRANSFORM_PLANS.get(plan_name, []):
+        if step_name in frame_steps:
+            flush()
+            stages.append((step_name, frame_steps[step_name]))
+        elif step_name in column_steps:
+            step, settings = column_steps[step_name]
+            for column in settings:
+                # A column feeding or fed by a deferred step keeps its order
+                # relative to that step, so the fused pass is closed first
+                if any(column in touched for _, _, touched in deferred):
+                    flush()
+                column_settings = (
+                    {column: settings[column]}
+                    if isinstance(settings, dict)
+                    else [column]
+                )
+                fused_columns.setdefault(column, []).append((step, column_settings))
+            if step_name not in fused_step_names:
+                fused_step_names.append(step_name)
+        else:
+            step, reads, writes = derived_steps[step_name]
+            # Runs after the pending fused pass, whose columns it may read
+            deferred.append((step_name, step, reads | writes))
+    flush()
+    logging.info(f"Compiled transform plan {plan_name}: {[name for name, _ in stages]}")
+    return TransformPipeline(plan_name, stages)
+
+
+def fused_column_stage(fused_columns: dict) -> typing.Callable:
+    def run(df: pd.DataFrame) -> pd.DataFrame:
+        for column, steps in fused_columns.items():
+            # Every step maps values one at a time, so they run over the
+            # distinct values only and the result is spread back in one take
+            codes, uniques = pd.factorize(df[column], use_na_sentinel=False)
+            values = pd.DataFrame({column: uniques})
+            for step, column_settings in steps:
+                values = step(values, column_settings)
+            df[column] = values[column].take(codes).set_axis(df.index)
+        return df
+
+    return run
+
+
+def sfpd_timestamp(df: pd.DataFrame) -> pd.DataFrame:
+    df["timestamp"] = convert_dt_format_series(
+        df["Date"].str[:10] + " " + df["Time"] + ":00",
+        from_format="%Y-%m-%d %H:%M:%S",
+        to_format="%Y-%m-%d %H:%M:%S",
+        fallback=lambda value: convert_dt_format(value, to_format="%Y-%m-%d %H:%M:%S"),
+    ).fillna("")
+    return df
 
 
 def add_key(df: pd.DataFrame) -> pd.DataFrame:
     logging.info("Adding key column")
-    df["start_date_str"] = df["start_date"].apply(
-        lambda x: re.sub("[^0-9.]", "", str(x))
-    )
-    df["key"] = df.apply(
-        lambda x: str(x.start_date_str) + "-" + str(x.bike_number), axis=1
+    df["start_date_str"] = (
+        df["start_date"].astype(str).str.replace("[^0-9.]", "", regex=True)
     )
+    df["key"] = df["start_date_str"] + "-" + df["bike_number"].astype(str)
     df["key_val"] = df["key"].replace("-", "")
     return df
 
@@ -1277,6 +1700,89 @@ def download_file_json(
     df.to_csv(source_file_csv, index=False)
 
 
+class GoogleCloudClients:
+    """Builds BigQuery and Cloud Storage clients on first use and shares them
+    across every helper in the process. All clients ride on one authorized
+    HTTP session with a pool of `pool_size` connections. Client constructions
+    and API round-trips are counted for the end-of-run summary.
+
+    Every image talking to BigQuery or Cloud Storage carries a copy of this
+    block. Edit the new_york_taxi_trips copy and run
+    scripts/sync_shared_helpers.py."""
+
+    def __init__(self, pool_size: int = 10) -> None:
+        self.lock = threading.Lock()
+        self.counts = collections.Counter()
+        self.pool_size = pool_size
+        self.reset()
+
+    def reset(self) -> None:
+        self.pid = os.getpid()
+        self.credentials = None
+        self.default_project = None
+        self.session = None
+        self.clients = {}
+
+    def configure(self, pool_size: int) -> None:
+        with self.lock:
+            self.pool_size = max(pool_size, 1)
+            self.reset()
+
+    def authorized_session(self) -> AuthorizedSession:
+        if self.pid != os.getpid():
+            # A forked worker process builds its own session and clients
+            self.reset()
+        if self.session is None:
+            self.credentials, self.default_project = google.auth.default(
+                scopes=["https://www.googleapis.com/auth/cloud-platform"]
+            )
+            self.counts["credential_lookups"] += 1
+            self.session = AuthorizedSession(self.credentials)
+            self.session.mount(
+                "https://",
+                requests.adapters.HTTPAdapter(
+                    pool_connections=self.pool_size, pool_maxsize=self.pool_size
+                ),
+            )
+            self.session.hooks["response"].append(self.count_round_trip)
+        return self.session
+
+    def count_round_trip(self, response: requests.Response, *args, **kwargs) -> None:
+        with self.lock:
+            self.counts["api_round_trips"] += 1
+
+    def client(
+        self, label: str, client_class: typing.Type, project: str = None
+    ) -> typing.Union[bigquery.Client, storage.Client]:
+        with self.lock:
+            session = self.authorized_session()
+            project = project or self.default_project
+            if (label, project) not in self.clients:
+                client_args = {"credentials": self.credentials, "_http": session}
+                if project:
+                    client_args["project"] = project
+                self.clients[(label, project)] = client_class(**client_args)
+                self.counts[f"{label}_clients"] += 1
+            return self.clients[(label, project)]
+
+    def bigquery(self, project: str = None) -> bigquery.Client:
+        return self.client("bigquery", bigquery.Client, project)
+
+    def storage(self, project: str = None) -> storage.Client:
+        return self.client("storage", storage.Client, project)
+
+    def summary(self) -> None:
+        logging.info(
+            f"Google Cloud clients built: {self.counts['bigquery_clients']} BigQuery, "
+            f"{self.counts['storage_clients']} Cloud Storage; "
+            f"credential lookups: {self.counts['credential_lookups']}; "
+            f"API round-trips: {self.counts['api_round_trips']}"
+        )
+
+
+gcp_clients = GoogleCloudClients()
+
+
 def load_data_to_bq(
     project_id: str,
     dataset_id: str,
@@ -1288,7 +1794,7 @@ def load_data_to_bq(
     logging.info(
         f"Loading data from {file_path} into {project_id}.{dataset_id}.{table_id} started"
     )
-    client = bigquery.Client(project=project_id)
+    client = gcp_clients.bigquery(project_id)
     table_ref = client.dataset(dataset_id).table(table_id)
     job_config = bigquery.LoadJobConfig()
     job_config.source_format = bigquery.SourceFormat.CSV
@@ -1317,7 +1823,7 @@ def create_dest_table(
 ) -> bool:
     table_ref = f"{project_id}.{dataset_id}.{table_id}"
     logging.info(f"Attempting to create table {table_ref} if it doesn't already exist")
-    client = bigquery.Client()
+    client = gcp_clients.bigquery()
     table_exists = False
     try:
         table = client.get_table(table_ref)
@@ -1354,7 +1860,7 @@ def create_dest_table(
 
 
 def check_gcs_file_exists(file_path: str, bucket_name: str) -> bool:
-    storage_client = storage.Client()
+    storage_client = gcp_clients.storage()
     bucket = storage_client.bucket(bucket_name)
     exists = storage.Blob(bucket=bucket, name=file_path).exists(storage_client)
     return exists
@@ -1368,7 +1874,7 @@ def create_table_schema(
     if not (schema_filepath):
         schema_struct = schema_structure
     else:
-        storage_client = storage.Client()
+        storage_client = gcp_clients.storage()
         bucket = storage_client.get_bucket(bucket_name)
         blob = bucket.blob(schema_filepath)
         schema_struct = json.loads(blob.download_as_string(client=None))
@@ -1417,31 +1923,26 @@ def remove_parenthesis_long_lat(
     return df
 
 
-def extract_longitude_from_geom(
+def extract_long_lat_from_geom(
     df: pd.DataFrame,
     geom_field_name: str,
     lon_field_name: str,
-) -> str:
-    logging.info(f"Extracting longitude field {lon_field_name} from {geom_field_name}")
-    df[lon_field_name] = df[geom_field_name].apply(
-        lambda x: str(x).replace("POINT (", "").replace(")", "").split(" ", 1)[0]
-        if str(x) != ""
-        else "POINT (  )"
-    )
-    return df
-
-
-def extract_latitude_from_geom(
-    df: pd.DataFrame,
-    geom_field_name: str,
     lat_field_name: str,
-) -> str:
-    logging.info(f"Extracting latitude field {lat_field_name} from {geom_field_name}")
-    df[lat_field_name] = df[geom_field_name].apply(
-        lambda x: str(x).replace("POINT (", "").replace(")", "").split(" ", 1)[-1]
-        if str(x) != ""
-        else "POINT (  )"
+) -> pd.DataFrame:
+    logging.info(
+        f"Extracting fields {lon_field_name} and {lat_field_name} from {geom_field_name}"
+    )
+    codes, uniques = pd.factorize(df[geom_field_name], use_na_sentinel=False)
+    geom = pd.Series(uniques, dtype=object).astype(str)
+    point = geom.str.replace("POINT (", "", regex=False).str.replace(
+        ")", "", regex=False
     )
+    lon_lat = point.str.split(" ", n=1)
+    empty_geom = geom == ""
+    lon = lon_lat.str[0].mask(empty_geom, "POINT (  )")
+    lat = lon_lat.str[-1].mask(empty_geom, "POINT (  )")
+    df[lon_field_name] = lon.take(codes).set_axis(df.index)
+    df[lat_field_name] = lat.take(codes).set_axis(df.index)
     return df
 
 
@@ -1483,12 +1984,57 @@ def resolve_date_format(
     date_format_list: dict,
 ) -> pd.DataFrame:
     logging.info("Resolving date formats")
-    for dt_fld in date_format_list.items():
-        logging.info(f"Resolving date formats in field {dt_fld}")
-        df[dt_fld[0]] = df[dt_fld[0]].apply(convert_dt_format, to_format=dt_fld[1])
+    for column, to_format in date_format_list.items():
+        logging.info(f"Resolving date formats in field {(column, to_format)}")
+        # Values already in to_format are parsed strictly, the rest are inferred
+        df[column] = convert_dt_format_series(
+            df[column],
+            from_format=to_format,
+            to_format=to_format,
+            fallback=lambda value: convert_dt_format(value, to_format=to_format),
+        ).fillna("")
     return df
 
 
+def convert_dt_format_series(
+    values: pd.Series,
+    from_format: str,
+    to_format: str,
+    fallback: typing.Callable[[str], str] = None,
+) -> pd.Series:
+    # Reformats one (column, from_format, to_format) spec. Dates repeat heavily,
+    # so only the distinct values are parsed. Values which do not match
+    # from_format go through fallback when one is given, otherwise become NaN.
+    codes, uniques = pd.factorize(values)
+    uniques = pd.Series(uniques, dtype=object)
+    parsed = pd.to_datetime(uniques, format=from_format, errors="coerce")
+    converted = format_dt_series(parsed, to_format)
+    if fallback:
+        # Sub-second values keep their fraction, so leave those to fallback too
+        converted = converted.where(parsed == parsed.dt.floor("s"))
+        unmatched = converted.isna()
+        converted[unmatched] = uniques[unmatched].apply(fallback)
+    # Missing values are coded -1, which picks up the trailing NaN
+    return pd.Series(
+        np.append(converted.to_numpy(dtype=object), np.nan)[codes], index=values.index
+    )
+
+
+def format_dt_series(parsed: pd.Series, to_format: str) -> pd.Series:
+    unit = {"%Y-%m-%d": "D", "%Y-%m-%d %H:%M:%S": "s"}.get(to_format)
+    if not unit:
+        return parsed.dt.strftime(to_format)
+    # NumPy renders these two layouts well over twice as fast as strftime
+    iso_text = np.datetime_as_string(
+        parsed.to_numpy().astype(f"datetime64[{unit}]"), unit=unit
+    )
+    return (
+        pd.Series(iso_text, index=parsed.index, dtype=object)
+        .str.replace("T", " ", regex=False)
+        .where(parsed.notna())
+    )
+
+
 def convert_dt_format(dt_str: str, to_format: str = '"%Y-%m-%d %H:%M:%S"') -> str:
     if not dt_str or str(dt_str).lower() == "nan" or str(dt_str).lower() == "nat":
         return ""
@@ -1521,25 +2067,24 @@ def save_to_new_file(df: pd.DataFrame, file_path: str, sep: str = "|") -> None:
     df.to_csv(file_path, index=False, sep=sep)
 
 
-def append_batch_file(
-    batch_file_path: str, target_file_path: str, skip_header: bool, truncate_file: bool
+def append_batch_to_target_file(
+    df: pd.DataFrame,
+    target_file_path: str,
+    include_header: bool,
+    truncate_file: bool,
+    sep: str = "|",
 ) -> None:
-    with open(batch_file_path, "r") as data_file:
-        if truncate_file:
-            target_file = open(target_file_path, "w+").close()
-        with open(target_file_path, "a+") as target_file:
-            if skip_header:
-                logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path} with skip header"
-                )
-                next(data_file)
-            else:
-                logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path}"
-                )
-            target_file.write(data_file.read())
-            if os.path.exists(batch_file_path):
-                os.remove(batch_file_path)
+    logging.info(
+        f"Appending batch to {target_file_path} with include_header={include_header} and truncate_file={truncate_file}"
+    )
+    # Each chunk goes straight into the target file rather than via a batch file
+    df.to_csv(
+        target_file_path,
+        sep=sep,
+        index=False,
+        header=include_header,
+        mode=("w" if truncate_file else "a"),
+    )
 
 
 def upload_file_to_gcs(
@@ -1549,7 +2094,7 @@ def upload_file_to_gcs(
         logging.info(
             f"Uploading output file to gs://{target_gcs_bucket}/{target_gcs_path}"
         )
-        storage_client = storage.Client()
+        storage_client = gcp_clients.storage()
         bucket = storage_client.bucket(target_gcs_bucket)
         blob = bucket.blob(target_gcs_path)
         blob.upload_from_filename(file_path)
@@ -1604,4 +2149,8 @@ if __name__ == "__main__":
         date_format_list=json.loads(os.environ.get("DATE_FORMAT_LIST", r"[]")),
         filter_headers_list=json.loads(os.environ.get("FILTER_HEADERS_LIST", r"[]")),
         reorder_headers_list=json.loads(os.environ.get("REORDER_HEADERS_LIST", r"[]")),
+        csv_engine=os.environ.get("CSV_ENGINE", "auto"),
+        csv_shadow_rows=os.environ.get("CSV_SHADOW_ROWS", "0"),
+        download_max_workers=os.environ.get("DOWNLOAD_MAX_WORKERS", "4"),
+        client_pool_size=os.environ.get("CLIENT_POOL_SIZE", "10"),
     )
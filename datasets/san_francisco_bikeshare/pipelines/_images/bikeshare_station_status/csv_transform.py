@@ -12,10 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import json
 import logging
 import os
 import pathlib
+import threading
+import typing
 
 import pandas as pd
 import requests
@@ -29,10 +32,14 @@ def main(
     chunksize: str,
     target_gcs_bucket: str,
     target_gcs_path: str,
+    csv_engine: str,
+    csv_shadow_rows: str,
 ) -> None:
 
     logging.info("San Francisco - Bikeshare Status process started")
 
+    csv_readers.configure(engine=csv_engine, shadow_rows=int(csv_shadow_rows))
+
     pathlib.Path("./files").mkdir(parents=True, exist_ok=True)
 
     logging.info(f"Extracting URL for status: {source_url_json}")
@@ -44,9 +51,8 @@ def main(
     chunksz = int(chunksize)
 
     logging.info(f"Opening batch file {source_file}")
-    with pd.read_csv(
+    with csv_readers.read_csv(
         source_file,  # path to main source file to load in batches
-        engine="python",
         encoding="utf-8",
         quotechar='"',  # string separator, typically double-quotes
         chunksize=chunksz,  # size of batch data, in no. of records
@@ -62,6 +68,8 @@ def main(
 
     upload_file_to_gcs(target_file, target_gcs_bucket, target_gcs_path)
 
+    csv_readers.summary()
+
     logging.info("San Francisco - Bikeshare Status process completed")
 
 
@@ -154,6 +162,175 @@ def append_batch_file(
         os.remove(batch_file_path)
 
 
+class CsvReaderFactory:
+    """Opens pd.read_csv readers on the fastest engine that supports the
+    requested options. "auto" uses the C parser, which keeps pandas' own type
+    inference, and falls back to the python parser only for options the C
+    parser lacks. With `shadow_rows` set, the first `shadow_rows` rows of each
+    file are also parsed by the python engine and any difference sends that
+    file back to it. Only that sample is compared, so a difference further
+    into a file goes unnoticed.
+
+    Every image reading CSVs this way carries a copy of this block. Edit the
+    new_york_taxi_trips copy and run scripts/sync_shared_helpers.py."""
+
+    def __init__(self, engine: str = "auto", shadow_rows: int = 0) -> None:
+        self.lock = threading.Lock()
+        self.counts = collections.Counter()
+        self.engine = engine
+        self.shadow_rows = shadow_rows
+
+    def configure(self, engine: str = "auto", shadow_rows: int = 0) -> None:
+        self.engine = engine or "auto"
+        self.shadow_rows = max(shadow_rows, 0)
+
+    def pick_engine(self, options: dict) -> str:
+        sep = options.get("sep", options.get("delimiter", ","))
+        dtype = options.get("dtype")
+        if (
+            self.engine == "python"
+            or sep is None
+            or (len(sep) > 1 and sep != r"\s+")
+            or len(options.get("quotechar", '"')) > 1
+            or options.get("skipfooter")
+            or callable(options.get("on_bad_lines"))
+            or (
+                not isinstance(dtype, dict)
+                and pd.api.types.is_datetime64_any_dtype(dtype)
+            )
+        ):
+            return "python"
+        return "c"
+
+    def read_csv(
+        self, source_file: str, **options
+    ) -> typing.Union[pd.DataFrame, pd.io.parsers.TextFileReader]:
+        engine = self.pick_engine(options)
+        if engine != "python" and self.shadow_rows:
+            sample_options = {
+                key: value
+                for key, value in options.items()
+                if key not in ("chunksize", "iterator")
+            }
+            sample_options["nrows"] = self.shadow_rows
+            if not self.frames_match(
+                source_file,
+                engine,
+                self.open(source_file, engine, sample_options, count=False),
+                self.open(source_file, "python", sample_options, count=False),
+            ):
+                engine = "python"
+        return self.open(source_file, engine, options)
+
+    def open(
+        self, source_file: str, engine: str, options: dict, count: bool = True
+    ) -> typing.Union[pd.DataFrame, pd.io.parsers.TextFileReader]:
+        datetime_dtypes = {}
+        if engine == "c":
+            # Parse floats exactly as the python engine does and infer each
+            # chunk's types from the whole chunk rather than per internal block
+            options = {"float_precision": "round_trip", "low_memory": False, **options}
+            # The C parser rejects datetime64 in dtype, so those columns are
+            # read as text and cast afterwards, as the python parser does
+            dtype = options.get("dtype")
+            if isinstance(dtype, dict):
+                datetime_dtypes = {
+                    column: column_dtype
+                    for column, column_dtype in dtype.items()
+                    if pd.api.types.is_datetime64_any_dtype(column_dtype)
+                }
+                if datetime_dtypes:
+                    options = {
+                        **options,
+                        "dtype": {
+                            **dtype,
+                            **{column: object for column in datetime_dtypes},
+                        },
+                    }
+        if count:
+            logging.info(f"Reading {source_file} with the {engine} CSV engine")
+            with self.lock:
+                self.counts[engine] += 1
+        reader = pd.read_csv(source_file, engine=engine, **options)
+        if not datetime_dtypes:
+            return reader
+        if isinstance(reader, pd.DataFrame):
+            return cast_datetime_columns(reader, datetime_dtypes)
+        return DatetimeCastingReader(reader, datetime_dtypes)
+
+    def frames_match(
+        self,
+        source_file: str,
+        engine: str,
+        engine_df: pd.DataFrame,
+        python_df: pd.DataFrame,
+    ) -> bool:
+        try:
+            pd.testing.assert_frame_equal(engine_df, python_df)
+        except AssertionError as e:
+            logging.warning(
+                f"The {engine} engine parsed {source_file} differently from the python engine, using python instead: {e}"
+            )
+            with self.lock:
+                self.counts["shadow_mismatches"] += 1
+            return False
+        with self.lock:
+            self.counts["shadow_matches"] += 1
+        return True
+
+    def summary(self) -> None:
+        logging.info(
+            f"CSV readers opened: {self.counts['c']} c, "
+            f"{self.counts['python']} python; shadow checks matched: "
+            f"{self.counts['shadow_matches']}, differed: {self.counts['shadow_mismatches']}"
+        )
+
+
+class DatetimeCastingReader:
+    """Wraps a chunked pd.read_csv reader and casts the datetime64 columns of
+    every chunk it hands out."""
+
+    def __init__(
+        self, reader: pd.io.parsers.TextFileReader, datetime_dtypes: dict
+    ) -> None:
+        self.reader = reader
+        self.datetime_dtypes = datetime_dtypes
+
+    def __enter__(self) -> "DatetimeCastingReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __iter__(self) -> "DatetimeCastingReader":
+        return self
+
+    def __next__(self) -> pd.DataFrame:
+        return cast_datetime_columns(next(self.reader), self.datetime_dtypes)
+
+    def get_chunk(self, size: int = None) -> pd.DataFrame:
+        return cast_datetime_columns(self.reader.get_chunk(size), self.datetime_dtypes)
+
+    def close(self) -> None:
+        self.reader.close()
+
+
+def cast_datetime_columns(df: pd.DataFrame, datetime_dtypes: dict) -> pd.DataFrame:
+    for column, column_dtype in datetime_dtypes.items():
+        if column not in df.columns:
+            continue
+        try:
+            df[column] = df[column].astype(column_dtype)
+        except (TypeError, ValueError) as error:
+            raise ValueError(
+                f"Unable to convert column {column} to type {column_dtype}"
+            ) from error
+    return df
+
+
+csv_readers = CsvReaderFactory()
+
+
 def download_file_json(
     source_url_json: str, source_file_json: str, source_file_csv: str
 ) -> None:
@@ -197,4 +374,6 @@ if __name__ == "__main__":
         chunksize=os.environ["CHUNKSIZE"],
         target_gcs_bucket=os.environ["TARGET_GCS_BUCKET"],
         target_gcs_path=os.environ["TARGET_GCS_PATH"],
+        csv_engine=os.environ.get("CSV_ENGINE", "auto"),
+        csv_shadow_rows=os.environ.get("CSV_SHADOW_ROWS", "0"),
     )
@@ -19,9 +19,11 @@ import json
 import logging
 import os
 import pathlib
+import shutil
 import typing
 from urllib.parse import urlparse
 
+import numpy as np
 import pandas as pd
 import requests
 from google.api_core.exceptions import NotFound
@@ -147,11 +149,12 @@ def execute_pipeline(
         )
 
 
-def gz_decompress(infile: str, tofile: str, delete_zipfile: bool = False) -> None:
+def gz_decompress(
+    infile: str, tofile: str, delete_zipfile: bool = False, block_size: int = 1 << 20
+) -> None:
     logging.info(f"Decompressing {infile}")
-    with open(infile, "rb") as inf, open(tofile, "w", encoding="utf8") as tof:
-        decom_str = gzip.decompress(inf.read()).decode("utf-8")
-        tof.write(decom_str)
+    with gzip.open(infile, "rb") as inf, open(tofile, "wb") as tof:
+        shutil.copyfileobj(inf, tof, block_size)
     if delete_zipfile:
         os.remove(infile)
 
@@ -271,8 +274,9 @@ def process_chunk(
     df = remove_null_strings(df, null_string_list)
     df = add_metadata_columns(df, source_file, source_url)
     df = resolve_date_format(df, datetime_list)
-    save_to_new_file(df, file_path=str(target_file_batch), sep="|")
-    append_batch_file(target_file_batch, target_file, skip_header, not (skip_header))
+    append_batch_to_target_file(
+        df, target_file, include_header=not skip_header, truncate_file=not skip_header
+    )
     logging.info(f"Processing batch file {target_file_batch} completed")
 
 
@@ -300,10 +304,54 @@ def resolve_date_format(
 ) -> pd.DataFrame:
     logging.info("Resolving date formats")
     for dt_fld in date_format_list:
-        df[dt_fld] = df[dt_fld].apply(convert_dt_format)
+        df[dt_fld] = convert_dt_format_series(
+            df[dt_fld],
+            from_format="%Y-%m-%d %H:%M:%S",
+            to_format="%Y-%m-%d %H:%M:%S",
+            fallback=convert_dt_format,
+        ).fillna("")
     return df
 
 
+def convert_dt_format_series(
+    values: pd.Series,
+    from_format: str,
+    to_format: str,
+    fallback: typing.Callable[[str], str] = None,
+) -> pd.Series:
+    # Reformats one (column, from_format, to_format) spec. Dates repeat heavily,
+    # so only the distinct values are parsed. Values which do not match
+    # from_format go through fallback when one is given, otherwise become NaN.
+    codes, uniques = pd.factorize(values)
+    uniques = pd.Series(uniques, dtype=object)
+    parsed = pd.to_datetime(uniques, format=from_format, errors="coerce")
+    converted = format_dt_series(parsed, to_format)
+    if fallback:
+        # Sub-second values keep their fraction, so leave those to fallback too
+        converted = converted.where(parsed == parsed.dt.floor("s"))
+        unmatched = converted.isna()
+        converted[unmatched] = uniques[unmatched].apply(fallback)
+    # Missing values are coded -1, which picks up the trailing NaN
+    return pd.Series(
+        np.append(converted.to_numpy(dtype=object), np.nan)[codes], index=values.index
+    )
+
+
+def format_dt_series(parsed: pd.Series, to_format: str) -> pd.Series:
+    unit = {"%Y-%m-%d": "D", "%Y-%m-%d %H:%M:%S": "s"}.get(to_format)
+    if not unit:
+        return parsed.dt.strftime(to_format)
+    # NumPy renders these two layouts well over twice as fast as strftime
+    iso_text = np.datetime_as_string(
+        parsed.to_numpy().astype(f"datetime64[{unit}]"), unit=unit
+    )
+    return (
+        pd.Series(iso_text, index=parsed.index, dtype=object)
+        .str.replace("T", " ", regex=False)
+        .where(parsed.notna())
+    )
+
+
 def convert_dt_format(dt_str: str) -> str:
     if not dt_str or str(dt_str).lower() == "nan" or str(dt_str).lower() == "nat":
         return ""
@@ -445,30 +493,24 @@ def create_table_schema(
     return schema
 
 
-def save_to_new_file(df: pd.DataFrame, file_path: str, sep: str = "|") -> None:
-    logging.info(f"Saving data to target file.. {file_path} ...")
-    df.to_csv(file_path, index=False, sep=sep)
-
-
-def append_batch_file(
-    batch_file_path: str, target_file_path: str, skip_header: bool, truncate_file: bool
+def append_batch_to_target_file(
+    df: pd.DataFrame,
+    target_file_path: str,
+    include_header: bool,
+    truncate_file: bool,
+    sep: str = "|",
 ) -> None:
-    with open(batch_file_path, "r") as data_file:
-        if truncate_file:
-            target_file = open(target_file_path, "w+").close()
-        with open(target_file_path, "a+") as target_file:
-            if skip_header:
-                logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path} with skip header"
-                )
-                next(data_file)
-            else:
-                logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path}"
-                )
-            target_file.write(data_file.read())
-            if os.path.exists(batch_file_path):
-                os.remove(batch_file_path)
+    logging.info(
+        f"Appending batch to {target_file_path} with include_header={include_header} and truncate_file={truncate_file}"
+    )
+    # Each chunk goes straight into the target file rather than via a batch file
+    df.to_csv(
+        target_file_path,
+        sep=sep,
+        index=False,
+        header=include_header,
+        mode=("w" if truncate_file else "a"),
+    )
 
 
 def upload_file_to_gcs(
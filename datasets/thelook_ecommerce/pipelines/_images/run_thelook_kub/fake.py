@@ -2,26 +2,104 @@ import collections
 import csv
 import dataclasses
 import datetime
-import io
+import functools
 import itertools
 import json
 import logging
 import os
+import pathlib
 import random
+import secrets
+import time
 import typing
 import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 import faker
 import numpy as np
 from google.cloud import storage
 
 fake = faker.Faker()
+
+
+class ShardContext:
+    """Seeds, row IDs and reference time of the shard being generated.
+
+    Users are dealt to NUM_OF_SHARDS shards round-robin and each shard is
+    generated on its own, so its data only depends on the base seed and the
+    shard index, never on how many workers run the shards. Row IDs are
+    strided by the shard count, which keeps them unique across shards without
+    any coordination.
+    """
+
+    def __init__(self) -> None:
+        self.configure(shard_index=0, num_of_shards=1)
+
+    def configure(
+        self,
+        shard_index: int,
+        num_of_shards: int,
+        base_seed: int = None,
+        now: datetime.datetime = None,
+    ) -> None:
+        self.shard_index = shard_index
+        self.num_of_shards = num_of_shards
+        self.now = now or datetime.datetime.now()
+        self.id_counters = collections.Counter()
+        if base_seed is not None:
+            seed_sequence = np.random.SeedSequence(base_seed, spawn_key=(shard_index,))
+            random_seed, numpy_seed, faker_seed = seed_sequence.generate_state(3)
+            random.seed(int(random_seed))
+            np.random.seed(numpy_seed)
+            fake.seed_instance(int(faker_seed))
+
+    def next_id(self, table_name: str) -> int:
+        # shard k hands out k + 1, k + 1 + S, k + 1 + 2S, ... so user IDs of
+        # all shards together are exactly 1..NUM_OF_USERS
+        seq = self.id_counters[table_name]
+        self.id_counters[table_name] += 1
+        return seq * self.num_of_shards + self.shard_index + 1
+
+    def session_id(self) -> str:
+        # uuid4 reads os.urandom, which would make the output unreproducible
+        return str(uuid.UUID(int=random.getrandbits(128), version=4))
+
+
+class TableWriter:
+    """Streams the rows of one table in the current shard to a CSV file."""
+
+    def __init__(self, table_name: str) -> None:
+        self.table_name = table_name
+        self.file = None
+
+    def open(self, file_path: str, drop_fields: typing.List[str] = ()) -> None:
+        self.file = open(file_path, "w", encoding="utf-8", newline="")
+        self.writer = csv.writer(self.file, quoting=csv.QUOTE_NONNUMERIC)
+        self.drop_fields = drop_fields
+        self.rows = 0
+
+    def append(self, row: dict) -> None:
+        for key in self.drop_fields:
+            del row[key]
+        if self.rows == 0:
+            csv.DictWriter(self.file, fieldnames=row.keys()).writeheader()
+        self.writer.writerow(row.values())
+        self.rows += 1
+
+    def close(self) -> None:
+        if self.file:
+            self.file.close()
+            self.file = None
+
+
+shard = ShardContext()
 # final datasets
-orders = list()
-users = list()
-order_items = list()
-events = list()
-inventory_items = list()
+users = TableWriter("users")
+orders = TableWriter("orders")
+order_items = TableWriter("order_items")
+events = TableWriter("events")
+inventory_items = TableWriter("inventory_items")
+TABLE_WRITERS = [users, orders, order_items, events, inventory_items]
 
 
 # read from local csv and return products
@@ -147,42 +225,46 @@ def main(
     target_gcs_bucket: str,
     source_dir: str,
     extraneous_headers: typing.List[str],
+    num_of_shards: int = 1,
+    max_workers: int = 1,
+    seed: int = None,
+    reference_time: datetime.datetime = None,
+    output_dir: str = "output",
 ) -> None:
+    if seed is None:
+        seed = secrets.randbits(32)
+    reference_time = reference_time or datetime.datetime.now()
+    logging.info(
+        f"generating {num_of_users} users in {num_of_shards} shard(s) with seed {seed} "
+        f"and reference time {reference_time.isoformat()}"
+    )
+    pathlib.Path(output_dir).mkdir(parents=True, exist_ok=True)
 
-    # read and generate location
-    logging.info("generating data")
-    for user_num in range(int(num_of_users)):
-        logging.info(f"user transaction {user_num}")
-        users.append(dataclasses.asdict(Users()))
-
-    # remove extraneous keys in order_items
-    logging.info("remove extraneous keys from order items")
-    for oi in order_items:
-        for key in extraneous_headers:
-            del oi[key]
-
-    # generate ghost events
-    logging.info("generating ghost events")
-    for user_num in range(int(num_of_users) * int(num_of_ghost_events)):
-        logging.info(f"ghost event {user_num}")
-        GhostEvents()
-
-    # write generated data to gcs
-    table_dat = [users, orders, order_items, events, inventory_items]
-    table_name = ["users", "orders", "order_items", "events", "inventory_items"]
-    for name, table_dat in list(zip(table_name, table_dat)):
-        logging.info(f"converting {name} dict to csv")
-        csv_data = dict_to_csv(table_dat)
-        logging.info(
-            f"uploading output file to... gs://{target_gcs_bucket}/{target_gcs_prefix}/{name}.csv"
-        )
-        upload_to_bucket(
+    # drop shards left over from a run with a larger shard count
+    for writer in TABLE_WRITERS:
+        delete_from_bucket(
             target_bucket=target_gcs_bucket,
             target_prefix=target_gcs_prefix,
-            target_object=f"{name}.csv",
-            source_data=csv_data,
+            object_prefix=f"{writer.table_name}_",
         )
 
+    shard_args = [
+        {
+            "shard_index": shard_index,
+            "num_of_shards": num_of_shards,
+            "num_of_users": num_of_users,
+            "num_of_ghost_events": num_of_ghost_events,
+            "seed": seed,
+            "reference_time": reference_time,
+            "output_dir": output_dir,
+            "extraneous_headers": extraneous_headers,
+            "target_gcs_bucket": target_gcs_bucket,
+            "target_gcs_prefix": target_gcs_prefix,
+        }
+        for shard_index in range(num_of_shards)
+    ]
+    generate_shards(shard_args, max_workers)
+
     # upload static data to gcs
     file_names = ["products.csv", "distribution_centers.csv"]
     for file in file_names:
@@ -197,6 +279,92 @@ def main(
         )
 
 
+def generate_shards(shard_args: typing.List[dict], max_workers: int = 1) -> None:
+    started = time.time()
+    row_counts = collections.Counter()
+
+    def report(args: dict, shard_rows: dict) -> None:
+        row_counts.update(shard_rows)
+        row_counts["shards"] += 1
+        logging.info(
+            f"[{row_counts['shards']}/{len(shard_args)}] shard {args['shard_index']} "
+            f"done: {shard_rows['users']} users, {shard_rows['orders']} orders, "
+            f"{shard_rows['events']} events ({time.time() - started:.0f}s elapsed)"
+        )
+
+    if max_workers <= 1:
+        for args in shard_args:
+            report(args, generate_shard(**args))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            jobs = {
+                executor.submit(generate_shard, **args): args for args in shard_args
+            }
+            try:
+                for job in as_completed(jobs):
+                    report(jobs[job], job.result())
+            finally:
+                for job in jobs:
+                    job.cancel()
+    logging.info(
+        f"generated {len(shard_args)} shard(s) in {time.time() - started:.0f}s: "
+        + ", ".join(f"{row_counts[w.table_name]} {w.table_name}" for w in TABLE_WRITERS)
+    )
+
+
+# generates the users of one shard with their orders, order items, events and
+# inventory items, plus the shard's ghost events, and uploads its csv files
+def generate_shard(
+    shard_index: int,
+    num_of_shards: int,
+    num_of_users: int,
+    num_of_ghost_events: int,
+    seed: int,
+    reference_time: datetime.datetime,
+    output_dir: str,
+    extraneous_headers: typing.List[str],
+    target_gcs_bucket: str,
+    target_gcs_prefix: str,
+) -> dict:
+    shard.configure(shard_index, num_of_shards, seed, reference_time)
+    shard_users = len(range(shard_index, num_of_users, num_of_shards))
+    file_names = {
+        writer.table_name: f"{writer.table_name}_{shard_index:05d}.csv"
+        for writer in TABLE_WRITERS
+    }
+    try:
+        for writer in TABLE_WRITERS:
+            writer.open(
+                f"{output_dir}/{file_names[writer.table_name]}",
+                drop_fields=extraneous_headers if writer is order_items else (),
+            )
+        for user_num in range(shard_users):
+            if user_num % 10000 == 0:
+                logging.info(f"shard {shard_index}: user {user_num}/{shard_users}")
+            users.append(dataclasses.asdict(Users()))
+
+        logging.info(f"shard {shard_index}: generating ghost events")
+        for _ in range(shard_users * num_of_ghost_events):
+            GhostEvents()
+    finally:
+        for writer in TABLE_WRITERS:
+            writer.close()
+
+    row_counts = {writer.table_name: writer.rows for writer in TABLE_WRITERS}
+    for file_name in file_names.values():
+        logging.info(
+            f"uploading output file to... gs://{target_gcs_bucket}/{target_gcs_prefix}/{file_name}"
+        )
+        upload_to_bucket(
+            target_bucket=target_gcs_bucket,
+            target_prefix=target_gcs_prefix,
+            target_object=file_name,
+            source_filepath=f"{output_dir}/{file_name}",
+        )
+        os.remove(f"{output_dir}/{file_name}")
+    return row_counts
+
+
 # returns random address based off specified distribution
 def get_address(
     *, country: str = "*", state: str = "*", postal_code: str = "*"
@@ -205,6 +373,17 @@ def get_address(
     # state = '*' OR state = 'California' OR state={'California':.75,'New York':.25}
     # postal_code = '*' OR postal_code = '95060' OR postal_code={'94117':.75,'95060':.25}
     # type checking is used to provide flexibility of inputs to function (ie. can be dict with proportions, or could be single string value)
+    if country == state == postal_code == "*":
+        loc = random.choices(LOCATION_DATA, cum_weights=location_cum_weights())[0]
+        return {
+            "street": fake.street_address(),
+            "city": loc["city"],
+            "state": loc["state"],
+            "postal_code": loc["postal_code"],
+            "country": loc["country"],
+            "latitude": loc["latitude"],
+            "longitude": loc["longitude"],
+        }
     universe = []
     if postal_code != "*":
         if type(postal_code) == str:
@@ -290,9 +469,20 @@ def get_address(
     }
 
 
+# population weights of all locations, accumulated once instead of per address
+@functools.lru_cache(maxsize=None)
+def location_cum_weights() -> typing.List[float]:
+    total_pop = sum([int(loc["population"]) for loc in LOCATION_DATA])
+    return list(
+        itertools.accumulate(
+            [int(loc["population"]) / total_pop for loc in LOCATION_DATA]
+        )
+    )
+
+
 # generates random date between now and specified date
 def created_at(start_date: datetime.datetime) -> datetime.datetime:
-    end_date = datetime.datetime.now()
+    end_date = shard.now
     time_between_dates = end_date - start_date
     days_between_dates = time_between_dates.days
     if days_between_dates <= 1:
@@ -316,17 +506,6 @@ def generate_uri(event: str, product: str) -> str:
         return f"/{event}"
 
 
-# converts list of dicts into csv format
-def dict_to_csv(data: dict) -> str:
-    output = io.StringIO()
-    writer = csv.writer(output, quoting=csv.QUOTE_NONNUMERIC)
-    header_writer = csv.DictWriter(output, fieldnames=data[0].keys())
-    header_writer.writeheader()
-    for dat in data:
-        writer.writerow(dat.values())
-    return output.getvalue()
-
-
 # upload into GCS Bucket
 def upload_to_bucket(
     target_bucket: str,
@@ -346,12 +525,28 @@ def upload_to_bucket(
     return blob.public_url
 
 
+# delete objects in GCS Bucket starting with the given prefix
+def delete_from_bucket(
+    target_bucket: str, target_prefix: str, object_prefix: str
+) -> int:
+    storage_client = storage.Client()
+    blobs = list(
+        storage_client.list_blobs(
+            target_bucket, prefix=f"{target_prefix}/{object_prefix}"
+        )
+    )
+    for blob in blobs:
+        logging.info(f"deleting stale output file gs://{target_bucket}/{blob.name}")
+        blob.delete()
+    return len(blobs)
+
+
 # utility class
 class DataUtil:
     def child_created_at(
         self, probability: str = "uniform"
     ) -> datetime.datetime:  # returns a random timestamp between now and parent date
-        time_between_dates = datetime.datetime.now() - self.parent.created_at
+        time_between_dates = shard.now - self.parent.created_at
         days_between_dates = time_between_dates.days
         if days_between_dates <= 1:
             days_between_dates = 2
@@ -392,7 +587,7 @@ class Address(object):
 @dataclasses.dataclass
 class Users(DataUtil):
     logging.info("generating user")
-    id: int = dataclasses.field(default_factory=itertools.count(start=1).__next__)
+    id: int = dataclasses.field(default_factory=lambda: shard.next_id("users"))
     first_name: str = dataclasses.field(init=False)
     last_name: str = dataclasses.field(init=False)
     email: str = dataclasses.field(init=False)
@@ -438,9 +633,7 @@ class Users(DataUtil):
         if choice == 0:
             self.created_at = created_at(datetime.datetime(2019, 1, 1))
         if choice == 1:
-            self.created_at = created_at(
-                datetime.datetime.now() - datetime.timedelta(days=7)
-            )
+            self.created_at = created_at(shard.now - datetime.timedelta(days=7))
         num_of_orders = random.choices(
             population=[0, 1, 2, 3, 4], weights=[0.2, 0.5, 0.2, 0.05, 0.05]
         )[0]
@@ -489,7 +682,7 @@ class Product:
 @dataclasses.dataclass
 class Order(DataUtil):
     logging.info("generating order")
-    order_id: int = dataclasses.field(default_factory=itertools.count(start=1).__next__)
+    order_id: int = dataclasses.field(default_factory=lambda: shard.next_id("orders"))
     user_id: int = dataclasses.field(init=False)
     status: str = dataclasses.field(init=False)
     gender: str = dataclasses.field(init=False)
@@ -554,7 +747,7 @@ class Order(DataUtil):
 @dataclasses.dataclass
 class Events:
     logging.info("generating event")
-    id: int = dataclasses.field(default_factory=itertools.count(start=1).__next__)
+    id: int = dataclasses.field(default_factory=lambda: shard.next_id("events"))
     user_id: int = dataclasses.field(init=False)
     sequence_number: int = dataclasses.field(init=False)
     session_id: str = dataclasses.field(init=False)
@@ -588,13 +781,10 @@ class Events:
         return f"{self.created_at}, {self.ip_address}, {self.city}, {self.state}, {self.postal_code}"
 
 
-inv_item_id = 0
-
-
 @dataclasses.dataclass
 class OrderItem(DataUtil):
     logging.info("generating order item")
-    id: int = dataclasses.field(default_factory=itertools.count(start=1).__next__)
+    id: int = dataclasses.field(default_factory=lambda: shard.next_id("order_items"))
     order_id: int = dataclasses.field(init=False)
     user_id: int = dataclasses.field(init=False)
     product_id: int = dataclasses.field(init=False)
@@ -619,12 +809,9 @@ class OrderItem(DataUtil):
     order: dataclasses.InitVar[typing.Any] = None
 
     def __post_init__(self, order=None):
-        global inv_item_id
-
         self.order_id = order.order_id
         self.user_id = order.user_id
-        inv_item_id = inv_item_id + 1
-        self.inventory_item_id = inv_item_id
+        self.inventory_item_id = shard.next_id("inventory_items")
         self.status = order.status
         self.created_at = order.created_at - datetime.timedelta(
             seconds=random.randrange(SECONDS_IN_MINUTE * 240)
@@ -649,7 +836,7 @@ class OrderItem(DataUtil):
             population=["Email", "Adwords", "Organic", "YouTube", "Facebook"],
             distribution=[0.45, 0.3, 0.05, 0.1, 0.1],
         )
-        self.session_id = str(uuid.uuid4())
+        self.session_id = shard.session_id()
 
         self.person = order.user  # pass person object to events
         self.is_sold = True
@@ -697,8 +884,7 @@ class OrderItem(DataUtil):
         )
         for _ in range(num_of_items):
             self.is_sold = False
-            inv_item_id += 1
-            self.inventory_item_id = inv_item_id
+            self.inventory_item_id = shard.next_id("inventory_items")
             inventory_items.append(dataclasses.asdict(InventoryItem(order_item=self)))
 
 
@@ -767,7 +953,7 @@ class GhostEvents(DataUtil):
         self.sequence_number = 0
         self.user_id = None
         self.created_at = created_at(datetime.datetime(2019, 1, 1))
-        self.session_id = str(uuid.uuid4())
+        self.session_id = shard.session_id()
         self.ip_address = fake.ipv4()
         self.city = address["city"]
         self.state = address["state"]
@@ -802,10 +988,8 @@ class GhostEvents(DataUtil):
         )
 
         for event in random_events:
-            # set ghost events ID to max of original
-            event_id = len(events)
-            self.id = event_id + 1
-            event_id = self.id
+            # ghost events continue the shard's event IDs
+            self.id = shard.next_id("events")
 
             self.event_type = event
             self.uri = generate_uri(event, product)
@@ -828,4 +1012,13 @@ if __name__ == "__main__":
         target_gcs_bucket=os.environ["TARGET_GCS_BUCKET"],
         source_dir=os.environ["SOURCE_DIR"],
         extraneous_headers=json.loads(os.environ["EXTRANEOUS_HEADERS"]),
+        num_of_shards=int(os.environ.get("NUM_OF_SHARDS", "1")),
+        max_workers=int(os.environ.get("MAX_WORKERS", "1")),
+        seed=int(os.environ["SEED"]) if os.environ.get("SEED") else None,
+        reference_time=(
+            datetime.datetime.fromisoformat(os.environ["REFERENCE_TIME"])
+            if os.environ.get("REFERENCE_TIME")
+            else None
+        ),
+        output_dir=os.environ.get("OUTPUT_DIR", "output"),
     )
@@ -49,6 +49,8 @@ with DAG(
             "TARGET_GCS_PREFIX": "data/thelook_ecommerce",
             "SOURCE_DIR": "data",
             "EXTRANEOUS_HEADERS": '["event_type", "ip_address", "browser", "traffic_source", "session_id", "sequence_number", "uri", "is_sold"]',
+            "NUM_OF_SHARDS": "16",
+            "MAX_WORKERS": "2",
         },
         resources={
             "request_memory": "8G",
@@ -83,7 +85,7 @@ with DAG(
     load_events_to_bq = gcs_to_bigquery.GCSToBigQueryOperator(
         task_id="load_events_to_bq",
         bucket="{{ var.value.composer_bucket }}",
-        source_objects=["data/thelook_ecommerce/events.csv"],
+        source_objects=["data/thelook_ecommerce/events_*.csv"],
         source_format="CSV",
         destination_project_dataset_table="thelook_ecommerce.events",
         skip_leading_rows=1,
@@ -109,7 +111,7 @@ with DAG(
     load_inventory_items_to_bq = gcs_to_bigquery.GCSToBigQueryOperator(
         task_id="load_inventory_items_to_bq",
         bucket="{{ var.value.composer_bucket }}",
-        source_objects=["data/thelook_ecommerce/inventory_items.csv"],
+        source_objects=["data/thelook_ecommerce/inventory_items_*.csv"],
         source_format="CSV",
         destination_project_dataset_table="thelook_ecommerce.inventory_items",
         skip_leading_rows=1,
@@ -138,7 +140,7 @@ with DAG(
     load_order_items_to_bq = gcs_to_bigquery.GCSToBigQueryOperator(
         task_id="load_order_items_to_bq",
         bucket="{{ var.value.composer_bucket }}",
-        source_objects=["data/thelook_ecommerce/order_items.csv"],
+        source_objects=["data/thelook_ecommerce/order_items_*.csv"],
         source_format="CSV",
         destination_project_dataset_table="thelook_ecommerce.order_items",
         skip_leading_rows=1,
@@ -162,7 +164,7 @@ with DAG(
     load_orders_to_bq = gcs_to_bigquery.GCSToBigQueryOperator(
         task_id="load_orders_to_bq",
         bucket="{{ var.value.composer_bucket }}",
-        source_objects=["data/thelook_ecommerce/orders.csv"],
+        source_objects=["data/thelook_ecommerce/orders_*.csv"],
         source_format="CSV",
         destination_project_dataset_table="thelook_ecommerce.orders",
         skip_leading_rows=1,
@@ -184,7 +186,7 @@ with DAG(
     load_users_to_bq = gcs_to_bigquery.GCSToBigQueryOperator(
         task_id="load_users_to_bq",
         bucket="{{ var.value.composer_bucket }}",
-        source_objects=["data/thelook_ecommerce/users.csv"],
+        source_objects=["data/thelook_ecommerce/users_*.csv"],
         source_format="CSV",
         destination_project_dataset_table="thelook_ecommerce.users",
         skip_leading_rows=1,
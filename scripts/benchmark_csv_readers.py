@@ -0,0 +1,265 @@
+# Copyright 2021 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import argparse
+import importlib.util
+import json
+import pathlib
+import tempfile
+import time
+import typing
+
+import numpy as np
+import pandas as pd
+from ruamel import yaml
+
+yaml = yaml.YAML(typ="safe")
+
+CURRENT_PATH = pathlib.Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_PATH.parent
+DATASETS_PATH = PROJECT_ROOT / "datasets"
+
+# Synthetic inputs and read_csv options mirroring each image's reader call.
+# Where the reader is fed a pipeline task's INPUT_CSV_HEADERS and DATA_DTYPES,
+# the columns and dtype come from that task in pipeline.yaml, so the engine
+# reported is the one production gets. Otherwise "columns" lists the layout.
+# Kinds: int, float, code (zero-padded digits), text (may hold quoted
+# separators), date, flag (Y/N with blanks).
+BENCHMARKS = {
+    "epa_historical_air_quality": {
+        "image": "run_csv_transform_kub",
+        "pipeline": "epa_historical_air_quality",
+        "task_id": "co_hourly_summary",
+        "options": {
+            "sep": ",",
+            "header": 0,
+            "names": True,
+            "keep_default_na": True,
+            "na_values": [" "],
+        },
+    },
+    "san_francisco": {
+        "image": "run_csv_transform_kub",
+        "pipeline": "san_francisco",
+        "task_id": "sffd_service_calls",
+        "options": {
+            "sep": ",",
+            "header": 0,
+            "keep_default_na": True,
+            "na_values": [" "],
+        },
+    },
+    "new_york": {
+        "image": "run_csv_transform_kub",
+        "pipeline": "new_york",
+        "task_id": "transform_csv_nypd_mv_collisions",
+        "options": {"sep": ","},
+    },
+    "covid19_google_mobility": {
+        "image": "run_csv_transform_kub",
+        "pipeline": "mobility_report",
+        "task_id": "mobility_report",
+        "options": {
+            "sep": ",",
+            "header": 0,
+            "keep_default_na": True,
+            "na_values": [" "],
+        },
+    },
+    "sec_failure_to_deliver": {
+        "image": "run_csv_transform_kub",
+        "pipeline": "fails_to_deliver",
+        "task_id": "transform_csv",
+        "options": {"sep": ",", "names": True, "skiprows": 1},
+    },
+    "san_francisco_bikeshare": {
+        "image": "bikeshare_station_status",
+        "columns": [
+            ("station_id", "code"),
+            ("num_bikes_available", "int"),
+            ("num_docks_available", "int"),
+            ("is_installed", "flag"),
+            ("is_renting", "flag"),
+            ("last_reported", "int"),
+        ],
+        "options": {"sep": ","},
+    },
+    "new_york_taxi_trips": {
+        "image": "run_csv_transform_kub",
+        "pipeline": "new_york_taxi_trips",
+        "task_id": "yellow_trips",
+        "options": {"sep": "|", "names": True, "skiprows": 1},
+    },
+}
+
+
+def main(
+    datasets: typing.List[str], rows: int, chunksize: int, engine: str, shadow_rows: int
+) -> None:
+    print(
+        f"{'dataset':<28} {'engine':<8} {'python (s)':>10} {'factory (s)':>11} {'speedup':>8}  result"
+    )
+    with tempfile.TemporaryDirectory() as work_dir:
+        for dataset in datasets:
+            benchmark = BENCHMARKS[dataset]
+            source_file = pathlib.Path(work_dir) / f"{dataset}.csv"
+            columns, options = benchmark_layout(dataset, benchmark)
+            options = write_synthetic_csv(source_file, columns, options, rows)
+            module = load_transform_module(dataset, benchmark["image"])
+            module.csv_readers.configure(engine=engine, shadow_rows=shadow_rows)
+            chosen_engine = module.csv_readers.pick_engine(
+                {**options, "chunksize": chunksize}
+            )
+
+            start = time.perf_counter()
+            python_df = read_all(
+                lambda: pd.read_csv(
+                    source_file, engine="python", chunksize=chunksize, **options
+                )
+            )
+            python_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            factory_df = read_all(
+                lambda: module.csv_readers.read_csv(
+                    source_file, chunksize=chunksize, **options
+                )
+            )
+            factory_seconds = time.perf_counter() - start
+
+            try:
+                pd.testing.assert_frame_equal(factory_df, python_df)
+                result = "identical"
+            except AssertionError as e:
+                result = f"DIFFERENT: {str(e).splitlines()[0]}"
+            print(
+                f"{dataset:<28} {chosen_engine:<8} {python_seconds:>10.2f} {factory_seconds:>11.2f} "
+                f"{python_seconds / factory_seconds:>7.1f}x  {result}"
+            )
+
+
+def benchmark_layout(
+    dataset: str, benchmark: dict
+) -> typing.Tuple[typing.List[typing.Tuple[str, str]], dict]:
+    if "task_id" not in benchmark:
+        return benchmark["columns"], benchmark["options"]
+    env_vars = task_env_vars(dataset, benchmark["pipeline"], benchmark["task_id"])
+    data_dtypes = json.loads(env_vars["DATA_DTYPES"])
+    headers = json.loads(env_vars.get("INPUT_CSV_HEADERS", "[]")) or list(data_dtypes)
+    columns = [(name, column_kind(data_dtypes.get(name, "str"))) for name in headers]
+    return columns, {**benchmark["options"], "dtype": data_dtypes}
+
+
+def task_env_vars(dataset: str, pipeline: str, task_id: str) -> dict:
+    pipeline_yaml = DATASETS_PATH / dataset / "pipelines" / pipeline / "pipeline.yaml"
+    for task in yaml.load(pipeline_yaml.read_text())["dag"]["tasks"]:
+        if task["args"].get("task_id") == task_id:
+            return task["args"]["env_vars"]
+    raise KeyError(f"No {task_id} task in {pipeline_yaml}")
+
+
+def column_kind(dtype: str) -> str:
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return "date"
+    if pd.api.types.is_integer_dtype(dtype):
+        return "int"
+    if pd.api.types.is_float_dtype(dtype):
+        return "float"
+    return "text"
+
+
+def write_synthetic_csv(
+    source_file: pathlib.Path,
+    columns: typing.List[typing.Tuple[str, str]],
+    options: dict,
+    rows: int,
+) -> dict:
+    rng = np.random.default_rng(0)
+    data = {}
+    for name, kind in columns:
+        if kind == "int":
+            data[name] = rng.integers(-500, 100_000, rows)
+        elif kind == "float":
+            scale = 10.0 ** rng.integers(1, 12, rows)
+            values = np.round(rng.normal(0, 1000, rows) * scale) / scale
+            values[rng.random(rows) < 0.02] = np.nan
+            data[name] = values
+        elif kind == "code":
+            data[name] = (
+                pd.Series(rng.integers(0, 99_999, rows)).astype(str).str.zfill(5)
+            )
+        elif kind == "text":
+            words = np.array(
+                ["NORTH", "SOUTH, EAST", "Main St", 'say "hi"', "", " ", "café"]
+            )
+            data[name] = words[rng.integers(0, len(words), rows)]
+        elif kind == "date":
+            data[name] = (
+                pd.Timestamp("2015-01-01")
+                + pd.to_timedelta(rng.integers(0, 2_000 * 86_400, rows), unit="s")
+            ).strftime("%Y-%m-%d %H:%M:%S")
+        elif kind == "flag":
+            data[name] = np.array(["Y", "N", ""])[rng.integers(0, 3, rows)]
+    df = pd.DataFrame(data)
+    sep = options.get("sep", ",")
+    df.to_csv(source_file, sep=sep, index=False, encoding="utf-8")
+    read_options = {"encoding": "utf-8", "quotechar": '"', **options}
+    if options.get("names"):
+        read_options["names"] = [name for name, _ in columns]
+    return read_options
+
+
+def load_transform_module(dataset: str, image: str):
+    module_path = (
+        DATASETS_PATH / dataset / "pipelines" / "_images" / image / "csv_transform.py"
+    )
+    spec = importlib.util.spec_from_file_location(f"{dataset}_transform", module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def read_all(open_reader: typing.Callable) -> pd.DataFrame:
+    with open_reader() as reader:
+        return pd.concat(list(reader), ignore_index=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the CSV reader factory against the python engine"
+    )
+    parser.add_argument(
+        "-d",
+        "--dataset",
+        action="append",
+        choices=sorted(BENCHMARKS),
+        dest="datasets",
+        help="Dataset to benchmark, can be repeated. Defaults to all of them",
+    )
+    parser.add_argument("-r", "--rows", type=int, default=500_000)
+    parser.add_argument("-c", "--chunksize", type=int, default=100_000)
+    parser.add_argument(
+        "-e", "--engine", choices=["auto", "c", "python"], default="auto"
+    )
+    parser.add_argument("-s", "--shadow-rows", type=int, default=0, dest="shadow_rows")
+
+    args = parser.parse_args()
+    main(
+        datasets=args.datasets or list(BENCHMARKS),
+        rows=args.rows,
+        chunksize=args.chunksize,
+        engine=args.engine,
+        shadow_rows=args.shadow_rows,
+    )
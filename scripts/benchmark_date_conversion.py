@@ -0,0 +1,126 @@
+# Copyright 2021 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import argparse
+import datetime
+import importlib.util
+import pathlib
+import time
+import typing
+
+import numpy as np
+import pandas as pd
+
+CURRENT_PATH = pathlib.Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_PATH.parent
+DATASETS_PATH = PROJECT_ROOT / "datasets"
+
+# Images carrying a copy of convert_dt_format_series
+DATASETS = [
+    "epa_historical_air_quality",
+    "fda_food",
+    "noaa",
+    "san_francisco",
+    "the_general_index",
+]
+
+# (column, from_format, to_format) specs and how many distinct values the
+# synthetic column holds, from a low-cardinality date to unique timestamps
+SPECS = {
+    "dates": ("%Y%m%d", "%Y-%m-%d", 365),
+    "storm_timestamps": ("%d-%b-%y %H:%M:%S", "%m-%d %H:%M:%S", None),
+    "timestamps": ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M:%S", None),
+}
+
+
+def main(datasets: typing.List[str], specs: typing.List[str], rows: int) -> None:
+    print(
+        f"{'dataset':<28} {'spec':<17} {'per-row (rows/s)':>16} {'series (rows/s)':>16} {'speedup':>8}  result"
+    )
+    for spec in specs:
+        from_format, to_format, distinct = SPECS[spec]
+        values = synthetic_column(from_format, rows, distinct)
+
+        start = time.perf_counter()
+        expected = values.apply(
+            lambda x: datetime.datetime.strptime(x, from_format).strftime(to_format)
+        )
+        per_row_rate = rows / (time.perf_counter() - start)
+
+        for dataset in datasets:
+            module = load_transform_module(dataset)
+            start = time.perf_counter()
+            converted = module.convert_dt_format_series(values, from_format, to_format)
+            series_rate = rows / (time.perf_counter() - start)
+            result = "identical" if converted.equals(expected) else "DIFFERENT"
+            print(
+                f"{dataset:<28} {spec:<17} {per_row_rate:>16,.0f} {series_rate:>16,.0f} "
+                f"{series_rate / per_row_rate:>7.1f}x  {result}"
+            )
+
+
+def synthetic_column(from_format: str, rows: int, distinct: int = None) -> pd.Series:
+    rng = np.random.default_rng(0)
+    if distinct:
+        offsets = pd.to_timedelta(rng.integers(0, distinct, rows), unit="D")
+    else:
+        offsets = pd.to_timedelta(rng.integers(0, 20 * 365 * 86_400, rows), unit="s")
+    timestamps = pd.Timestamp("2001-01-01") + offsets
+    return pd.Series(timestamps.strftime(from_format), dtype=object)
+
+
+def load_transform_module(dataset: str):
+    module_path = (
+        DATASETS_PATH
+        / dataset
+        / "pipelines"
+        / "_images"
+        / "run_csv_transform_kub"
+        / "csv_transform.py"
+    )
+    spec = importlib.util.spec_from_file_location(f"{dataset}_transform", module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark convert_dt_format_series against per-row strptime"
+    )
+    parser.add_argument(
+        "-d",
+        "--dataset",
+        action="append",
+        choices=DATASETS,
+        dest="datasets",
+        help="Image whose copy of the helper to benchmark, can be repeated. Defaults to all of them",
+    )
+    parser.add_argument(
+        "-s",
+        "--spec",
+        action="append",
+        choices=sorted(SPECS),
+        dest="specs",
+        help="Column spec to benchmark, can be repeated. Defaults to all of them",
+    )
+    parser.add_argument("-r", "--rows", type=int, default=1_000_000)
+
+    args = parser.parse_args()
+    main(
+        datasets=args.datasets or DATASETS,
+        specs=args.specs or list(SPECS),
+        rows=args.rows,
+    )
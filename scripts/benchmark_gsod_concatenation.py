@@ -0,0 +1,134 @@
+# Copyright 2021 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import argparse
+import importlib.util
+import os
+import pathlib
+import shutil
+import tempfile
+import time
+import typing
+
+import numpy as np
+
+CURRENT_PATH = pathlib.Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_PATH.parent
+NOAA_TRANSFORM = (
+    PROJECT_ROOT
+    / "datasets"
+    / "noaa"
+    / "pipelines"
+    / "_images"
+    / "run_csv_transform_kub"
+    / "csv_transform.py"
+)
+
+GSOD_HEADER = '"STATION","DATE","LATITUDE","LONGITUDE","TEMP","TEMP_ATTRIBUTES"\n'
+
+
+def main(files: int, rows: int, number_of_header_rows: int) -> None:
+    module = load_transform_module()
+    with tempfile.TemporaryDirectory() as work_dir:
+        station_files = write_station_files(pathlib.Path(work_dir), files, rows)
+
+        start = time.perf_counter()
+        expected = shell_concatenation(
+            station_files, pathlib.Path(work_dir), number_of_header_rows
+        )
+        shell_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        contents = (
+            (str(station_file), station_file.read_bytes())
+            for station_file in station_files
+        )
+        streamed = "".join(
+            module.concatenated_lines(
+                contents, number_of_header_rows=number_of_header_rows
+            )
+        )
+        stream_seconds = time.perf_counter() - start
+
+    result = "identical" if streamed == expected else "DIFFERENT"
+    print(f"{files:,} station files of {rows} rows each")
+    print(f"  sed -i 1d / cat >> / rm per file + header removal: {shell_seconds:.1f}s")
+    print(f"  concatenated_lines:                               {stream_seconds:.2f}s")
+    print(f"  {result}")
+
+
+def shell_concatenation(
+    station_files: typing.List[pathlib.Path],
+    work_dir: pathlib.Path,
+    number_of_header_rows: int,
+) -> str:
+    # The GSOD branch of execute_pipeline before the files were streamed,
+    # less the downloads and the 0.5s sleep between them
+    source_file = work_dir / "gsod_source.csv"
+    shutil.copyfile(station_files[0], source_file)
+    for station_file in station_files[1:]:
+        source_file_tmpname = work_dir / f"gsod_source_{station_file.name}"
+        shutil.copyfile(station_file, source_file_tmpname)
+        os.system(f"sed -i 1d {source_file_tmpname} 2> /dev/null")
+        os.system(f"cat {source_file_tmpname} >> {source_file}")
+        os.system(f"rm {source_file_tmpname}")
+    if number_of_header_rows > 0:
+        os.system(f"sed -i '1,{number_of_header_rows}d' {source_file} ")
+    return source_file.read_text()
+
+
+def write_station_files(
+    work_dir: pathlib.Path, files: int, rows: int
+) -> typing.List[pathlib.Path]:
+    rng = np.random.default_rng(0)
+    station_dir = work_dir / "stations"
+    station_dir.mkdir()
+    station_files = []
+    for station in range(files):
+        station_file = station_dir / f"{station:011d}.csv"
+        latitude, longitude = rng.uniform(-90, 90), rng.uniform(-180, 180)
+        temperatures = rng.uniform(-40, 40, rows)
+        with open(station_file, "w") as f:
+            f.write(GSOD_HEADER)
+            for day, temperature in enumerate(temperatures):
+                f.write(
+                    f'"{station:011d}","2020-01-{day % 31 + 1:02d}","{latitude:.4f}",'
+                    f'"{longitude:.4f}","{temperature:6.1f}","24"\n'
+                )
+        station_files.append(station_file)
+    return station_files
+
+
+def load_transform_module():
+    spec = importlib.util.spec_from_file_location("noaa_transform", NOAA_TRANSFORM)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark joining GSOD station files in-process against the per-file shell commands"
+    )
+    parser.add_argument("-f", "--files", type=int, default=10_000)
+    parser.add_argument("-r", "--rows", type=int, default=30)
+    parser.add_argument("-n", "--number-of-header-rows", type=int, default=1)
+
+    args = parser.parse_args()
+    main(
+        files=args.files,
+        rows=args.rows,
+        number_of_header_rows=args.number_of_header_rows,
+    )
@@ -0,0 +1,121 @@
+# Copyright 2021 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import argparse
+import importlib.util
+import json
+import pathlib
+import time
+
+import numpy as np
+import pandas as pd
+from ruamel import yaml
+
+yaml = yaml.YAML(typ="safe")
+
+CURRENT_PATH = pathlib.Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_PATH.parent
+PIPELINES_PATH = PROJECT_ROOT / "datasets" / "noaa" / "pipelines"
+NOAA_TRANSFORM = (
+    PIPELINES_PATH / "_images" / "run_csv_transform_kub" / "csv_transform.py"
+)
+PIPELINE_YAML = PIPELINES_PATH / "noaa" / "pipeline.yaml"
+
+
+def main(stations: int, days: int, pipeline_name: str) -> None:
+    module = load_transform_module()
+    slice_column_list = gsod_slice_column_list(pipeline_name)
+    df = synthetic_gsod_year(stations, days)
+    print(f"{len(df):,} rows, {stations:,} stations, {days} dates")
+
+    start = time.perf_counter()
+    expected = apply_lambdas(df.copy())
+    apply_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sliced = module.slice_column(df.copy(), slice_column_list, pipeline_name)
+    slice_seconds = time.perf_counter() - start
+
+    result = "identical" if sliced.equals(expected) else "DIFFERENT"
+    print(f"  apply lambdas: {apply_seconds:.1f}s")
+    print(f"  slice_column:  {slice_seconds:.1f}s")
+    print(f"  {result}")
+
+
+def apply_lambdas(df: pd.DataFrame) -> pd.DataFrame:
+    # The GSOD 2020/2022 branch of process_chunk before it used slice_column
+    df["stn"] = df["STATION"].apply(lambda x: "" if x == "" else x[0:6])
+    df["wban"] = df["STATION"].apply(lambda x: "" if x == "" else x[6:11])
+    df["year"] = df["DATE"].apply(lambda x: "" if x == "" else x[0:4])
+    df["mo"] = df["DATE"].apply(lambda x: "" if x == "" else x[5:7])
+    df["da"] = df["DATE"].apply(lambda x: "" if x == "" else x[8:10])
+    df["fog"] = df["FRSHTT"].apply(lambda x: "" if x == "" else x[0:1])
+    df["rain_drizzle"] = df["FRSHTT"].apply(lambda x: "" if x == "" else x[1:2])
+    df["snow_ice_pellets"] = df["FRSHTT"].apply(lambda x: "" if x == "" else x[2:3])
+    df["hail"] = df["FRSHTT"].apply(lambda x: "" if x == "" else x[3:4])
+    df["thunder"] = df["FRSHTT"].apply(lambda x: "" if x == "" else x[4:5])
+    df["tornado_funnel_cloud"] = df["FRSHTT"].apply(lambda x: "" if x == "" else x[5:6])
+    return df
+
+
+def synthetic_gsod_year(stations: int, days: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    station_ids = pd.Series(rng.integers(0, 10**11, stations)).map("{:011d}".format)
+    dates = pd.date_range("2020-01-01", periods=days).strftime("%Y-%m-%d")
+    # Mostly clear days, with a blank FRSHTT now and then
+    frshtt = np.array(["000000", "010000", "100000", "011000", "001000", ""])
+    rows = stations * days
+    return pd.DataFrame(
+        {
+            "STATION": np.repeat(station_ids.to_numpy(dtype=object), days),
+            "DATE": np.tile(np.asarray(dates, dtype=object), stations),
+            "FRSHTT": rng.choice(
+                frshtt, rows, p=[0.8, 0.1, 0.04, 0.03, 0.02, 0.01]
+            ).astype(object),
+        }
+    )
+
+
+def gsod_slice_column_list(pipeline_name: str) -> dict:
+    task_id = pipeline_name.replace(" ", "_").lower()
+    pipeline = yaml.load(PIPELINE_YAML.read_text())
+    for task in pipeline["dag"]["tasks"]:
+        if task["args"].get("task_id") == task_id:
+            return json.loads(task["args"]["env_vars"]["SLICE_COLUMN_LIST"])
+    raise KeyError(f"No {task_id} task in {PIPELINE_YAML}")
+
+
+def load_transform_module():
+    spec = importlib.util.spec_from_file_location("noaa_transform", NOAA_TRANSFORM)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark slice_column against the per-column apply lambdas on a year of GSOD rows"
+    )
+    parser.add_argument("-s", "--stations", type=int, default=12_000)
+    parser.add_argument("-d", "--days", type=int, default=366)
+    parser.add_argument(
+        "-p",
+        "--pipeline-name",
+        choices=["NOAA GSOD 2020", "NOAA GSOD 2022"],
+        default="NOAA GSOD 2020",
+    )
+
+    args = parser.parse_args()
+    main(stations=args.stations, days=args.days, pipeline_name=args.pipeline_name)
@@ -0,0 +1,195 @@
+# Copyright 2021 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import argparse
+import concurrent.futures
+import importlib.util
+import json
+import multiprocessing
+import pathlib
+import resource
+import shutil
+import sys
+import tempfile
+import time
+import typing
+
+import numpy as np
+import pandas as pd
+from ruamel import yaml
+
+yaml = yaml.YAML(typ="safe")
+
+CURRENT_PATH = pathlib.Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_PATH.parent
+PIPELINES_PATH = PROJECT_ROOT / "datasets" / "new_york_taxi_trips" / "pipelines"
+IMAGE_PATH = PIPELINES_PATH / "_images" / "run_csv_transform_kub"
+PIPELINE_YAML = PIPELINES_PATH / "new_york_taxi_trips" / "pipeline.yaml"
+
+OUTPUT_FORMATS = ["csv", "parquet"]
+
+
+def main(rows: int, chunksize: int, output_formats: typing.List[str]) -> None:
+    # Every step runs in a fresh process, as Linux carries the peak RSS of a
+    # process over into the processes it starts
+    spawn = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as work_dir:
+        source_parquet_file = pathlib.Path(work_dir) / "yellow_tripdata.parquet"
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=1, mp_context=spawn
+        ) as executor:
+            executor.submit(write_synthetic_month, source_parquet_file, rows).result()
+        print(
+            f"{'output':<8} {'wall (s)':>9} {'peak RSS (MB)':>14} {'output (MB)':>12}"
+        )
+        for output_format in output_formats:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=1, mp_context=spawn
+            ) as executor:
+                seconds, peak_rss_kb, output_bytes = executor.submit(
+                    transform_synthetic_month,
+                    str(source_parquet_file),
+                    work_dir,
+                    chunksize,
+                    output_format,
+                ).result()
+            print(
+                f"{output_format:<8} {seconds:>9.1f} {peak_rss_kb / 1024:>14,.0f} "
+                f"{output_bytes / 1024 ** 2:>12,.0f}"
+            )
+
+
+def transform_synthetic_month(
+    source_parquet_file: str, work_dir: str, chunksize: int, output_format: str
+) -> typing.Tuple[float, int, int]:
+    module = load_transform_module()
+    env_vars = yellow_trips_env_vars()
+    output_headers = json.loads(env_vars["OUTPUT_CSV_HEADERS"])
+
+    # Stand in for the TLC download with a local copy of the synthetic month
+    def download_file(source_url: str, source_file: pathlib.Path) -> bool:
+        shutil.copyfile(source_parquet_file, source_file)
+        return True
+
+    module.download_file = download_file
+    output_schema = None
+    if output_format == "parquet":
+        schema_struct = json.loads(
+            (IMAGE_PATH / "yellow_trips_schema.json").read_text()
+        )
+        output_schema = module.bq_schema_to_arrow_schema(
+            module.create_table_schema(schema_struct), output_headers
+        )
+
+    start = time.perf_counter()
+    output_file = module.transform_month(
+        source_url="file://",
+        year_number=2022,
+        month_number=1,
+        source_file=str(pathlib.Path(work_dir) / f"source_{output_format}.csv"),
+        target_file=str(pathlib.Path(work_dir) / f"batch_{output_format}.csv"),
+        target_file_name=str(pathlib.Path(work_dir) / f"output_{output_format}.csv"),
+        chunksize=str(chunksize),
+        input_headers=json.loads(env_vars["INPUT_CSV_HEADERS"]),
+        data_dtypes=json.loads(env_vars["DATA_DTYPES"]),
+        output_headers=output_headers,
+        pipeline_name="tlc_yellow_trips",
+        output_file_format=output_format,
+        output_schema=output_schema,
+    )
+    seconds = time.perf_counter() - start
+    return (
+        seconds,
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        pathlib.Path(output_file).stat().st_size,
+    )
+
+
+def write_synthetic_month(source_parquet_file: pathlib.Path, rows: int) -> None:
+    rng = np.random.default_rng(0)
+    pickup = pd.Timestamp("2022-01-01") + pd.to_timedelta(
+        rng.integers(0, 31 * 86_400, rows), unit="s"
+    )
+    df = pd.DataFrame(
+        {
+            "VendorID": rng.integers(1, 3, rows),
+            "tpep_pickup_datetime": pickup,
+            "tpep_dropoff_datetime": pickup
+            + pd.to_timedelta(rng.integers(60, 3_600, rows), unit="s"),
+            "passenger_count": rng.choice([0.0, 1.0, 2.0, np.nan], rows),
+            "trip_distance": rng.random(rows) * 10,
+            "RatecodeID": rng.choice([1.0, 2.0, np.nan], rows),
+            "store_and_fwd_flag": rng.choice(["N", "Y"], rows),
+            "PULocationID": rng.integers(1, 265, rows),
+            "DOLocationID": rng.integers(1, 265, rows),
+            "payment_type": rng.integers(1, 5, rows),
+            **{
+                column: rng.random(rows) * 20
+                for column in [
+                    "fare_amount",
+                    "extra",
+                    "mta_tax",
+                    "tip_amount",
+                    "tolls_amount",
+                    "improvement_surcharge",
+                    "total_amount",
+                    "congestion_surcharge",
+                    "airport_fee",
+                ]
+            },
+        }
+    )
+    df.to_parquet(source_parquet_file, row_group_size=1_000_000)
+
+
+def yellow_trips_env_vars() -> dict:
+    pipeline = yaml.load(PIPELINE_YAML.read_text())
+    for task in pipeline["dag"]["tasks"]:
+        if task["args"].get("task_id") == "yellow_trips":
+            return task["args"]["env_vars"]
+    raise KeyError(f"No yellow_trips task in {PIPELINE_YAML}")
+
+
+def load_transform_module():
+    spec = importlib.util.spec_from_file_location(
+        "new_york_taxi_trips_transform", IMAGE_PATH / "csv_transform.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the taxi month transform writing Parquet against the csv round-trip"
+    )
+    parser.add_argument("-r", "--rows", type=int, default=3_000_000)
+    parser.add_argument("-c", "--chunksize", type=int, default=500_000)
+    parser.add_argument(
+        "-f",
+        "--format",
+        action="append",
+        choices=OUTPUT_FORMATS,
+        dest="output_formats",
+        help="Output format to benchmark, can be repeated. Defaults to both",
+    )
+
+    args = parser.parse_args()
+    main(
+        rows=args.rows,
+        chunksize=args.chunksize,
+        output_formats=args.output_formats or OUTPUT_FORMATS,
+    )
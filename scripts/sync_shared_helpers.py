@@ -0,0 +1,103 @@
+# Copyright 2021 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import argparse
+import pathlib
+import sys
+import typing
+
+CURRENT_PATH = pathlib.Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_PATH.parent
+DATASETS_PATH = PROJECT_ROOT / "datasets"
+
+# Each container image is built from its own directory, so helpers shared by
+# several images are pasted into each one. Every shared block runs from its
+# first line to its last line, and the copy in the canonical file is the one
+# to edit. This script copies it over the others.
+CANONICAL_FILE = pathlib.Path(
+    "new_york_taxi_trips/pipelines/_images/run_csv_transform_kub/csv_transform.py"
+)
+SHARED_BLOCKS = {
+    "CsvReaderFactory": (
+        "class CsvReaderFactory:\n",
+        "csv_readers = CsvReaderFactory()\n",
+    ),
+    "GoogleCloudClients": (
+        "class GoogleCloudClients:\n",
+        "gcp_clients = GoogleCloudClients()\n",
+    ),
+}
+
+
+def main(blocks: typing.List[str], check: bool) -> None:
+    stale_files = []
+    for block in blocks:
+        stale_files += sync_block(block, DATASETS_PATH, check=check)
+    for stale_file in stale_files:
+        print(f"{'Out of sync' if check else 'Updated'}: {stale_file}")
+    if check and stale_files:
+        sys.exit(
+            f"Shared helpers differ from {CANONICAL_FILE}, run python scripts/sync_shared_helpers.py"
+        )
+
+
+def sync_block(
+    block: str, datasets_path: pathlib.Path, check: bool = False
+) -> typing.List[pathlib.Path]:
+    first_line, last_line = SHARED_BLOCKS[block]
+    canonical_text = (datasets_path / CANONICAL_FILE).read_text()
+    start, end = block_bounds(canonical_text, first_line, last_line)
+    canonical_block = canonical_text[start:end]
+
+    stale_files = []
+    for copy_file in sorted(datasets_path.glob("*/pipelines/_images/*/*.py")):
+        text = copy_file.read_text()
+        if first_line not in text:
+            continue
+        start, end = block_bounds(text, first_line, last_line)
+        if text[start:end] == canonical_block:
+            continue
+        stale_files.append(copy_file)
+        if not check:
+            copy_file.write_text(text[:start] + canonical_block + text[end:])
+    return stale_files
+
+
+def block_bounds(text: str, first_line: str, last_line: str) -> typing.Tuple[int, int]:
+    start = text.index(first_line)
+    end = text.index(last_line, start) + len(last_line)
+    return start, end
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Copy the canonical shared helpers over their copies in other images"
+    )
+    parser.add_argument(
+        "-b",
+        "--block",
+        action="append",
+        choices=sorted(SHARED_BLOCKS),
+        dest="blocks",
+        help="Shared block to sync, can be repeated. Defaults to all of them",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only report copies that differ and exit non-zero if there are any",
+    )
+
+    args = parser.parse_args()
+    main(blocks=args.blocks or list(SHARED_BLOCKS), check=args.check)
@@ -0,0 +1,73 @@
+# Copyright 2021 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pathlib
+import shutil
+import tempfile
+import typing
+
+import pytest
+
+from scripts import sync_shared_helpers
+
+
+@pytest.fixture
+def datasets_path() -> typing.Iterator[pathlib.Path]:
+    with tempfile.TemporaryDirectory() as dir_path:
+        yield pathlib.Path(dir_path)
+
+
+@pytest.mark.parametrize("block", list(sync_shared_helpers.SHARED_BLOCKS))
+def test_shared_blocks_are_in_sync_across_images(block: str):
+    assert (
+        sync_shared_helpers.sync_block(
+            block, sync_shared_helpers.DATASETS_PATH, check=True
+        )
+        == []
+    )
+
+
+@pytest.mark.parametrize("block", list(sync_shared_helpers.SHARED_BLOCKS))
+def test_sync_block_rewrites_a_drifted_copy(datasets_path: pathlib.Path, block: str):
+    first_line, last_line = sync_shared_helpers.SHARED_BLOCKS[block]
+    canonical_file = datasets_path / sync_shared_helpers.CANONICAL_FILE
+    canonical_file.parent.mkdir(parents=True)
+    shutil.copyfile(
+        sync_shared_helpers.DATASETS_PATH / sync_shared_helpers.CANONICAL_FILE,
+        canonical_file,
+    )
+    drifted_file = (
+        datasets_path / "other" / "pipelines" / "_images" / "image" / "csv_transform.py"
+    )
+    drifted_file.parent.mkdir(parents=True)
+    drifted_file.write_text(
+        "import os\n\n\n"
+        + first_line
+        + '    """Old copy"""\n\n\n'
+        + last_line
+        + "\n\ndef main():\n    pass\n"
+    )
+
+    assert sync_shared_helpers.sync_block(block, datasets_path, check=True) == [
+        drifted_file
+    ]
+    assert "Old copy" in drifted_file.read_text()
+
+    assert sync_shared_helpers.sync_block(block, datasets_path) == [drifted_file]
+    text = drifted_file.read_text()
+    assert "Old copy" not in text
+    assert text.startswith("import os\n\n\n" + first_line)
+    assert text.endswith("\n\ndef main():\n    pass\n")
+    assert sync_shared_helpers.sync_block(block, datasets_path, check=True) == []